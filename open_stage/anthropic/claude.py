@@ -7,8 +7,9 @@ logger = logging.getLogger(__name__)
 
 class AnthropicPromptTransformer(BasePromptTransformer):
 
-    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int = 16000) -> None:
-        super().__init__(name, model, api_key, prompt, max_tokens)
+    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int = 16000, **kwargs) -> None:
+        # chunk_rows, output_format, columns, ... are handled by BasePromptTransformer
+        super().__init__(name, model, api_key, prompt, max_tokens, **kwargs)
 
     def _initialize_client(self) -> None:
         try:
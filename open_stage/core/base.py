@@ -5,9 +5,10 @@ import pandas as pd
 
 
 class DataPackage:
-  def __init__(self, pipe_name: str, df: pd.DataFrame) -> None:
+  def __init__(self, pipe_name: str, df: pd.DataFrame, arrow=None) -> None:
     self.pipe_name = pipe_name
     self.df = df
+    self._arrow = arrow  # pyarrow.Table holding the same data, if the sender already has one
   
   def get_pipe_name(self) -> str:
     return self.pipe_name
@@ -15,6 +16,13 @@ class DataPackage:
   def get_df(self) -> pd.DataFrame:
     return self.df
 
+  def get_arrow(self):
+    """The DataFrame as a pyarrow.Table (requires the arrow extra), converted once per package."""
+    if self._arrow is None:
+      import pyarrow as pa
+      self._arrow = pa.Table.from_pandas(self.df, preserve_index=False)
+    return self._arrow
+
 
 class Pipe:
   def __init__(self, name: str) -> None:
@@ -34,8 +42,8 @@ class Pipe:
     if isinstance(destination, Node):
       return destination
   
-  def flow(self, df: pd.DataFrame) -> None:
-    data_package = DataPackage(self.name, df)
+  def flow(self, df: pd.DataFrame, arrow=None) -> None:
+    data_package = DataPackage(self.name, df, arrow)
     self.destination.sink(data_package)
 
 
@@ -46,7 +54,7 @@ class Origin:
   
   @abstractmethod
   def add_output_pipe(self, pipe: Pipe) -> Pipe:
-    if len(self.outputs.keys()) == 0:
+    if len(self.outputs) == 0:
       self.outputs[pipe.get_name()] = pipe
       pipe.set_origin(self)
       return pipe
@@ -63,7 +71,7 @@ class Destination:
   
   @abstractmethod
   def add_input_pipe(self, pipe: Pipe) -> None:
-    if len(self.inputs.keys()) == 0:
+    if len(self.inputs) == 0:
       self.inputs[pipe.get_name()] = pipe
     
   @abstractmethod
@@ -79,18 +87,24 @@ class Node(Origin, Destination):
 
 class SingleInputMixin:
   """Restricts a component to exactly 1 input pipe."""
+  _input_pipe = None  # the single input pipe, once connected
+
   def add_input_pipe(self, pipe: 'Pipe') -> None:
-    if len(self.inputs) == 0:
+    if self._input_pipe is None:
       self.inputs[pipe.get_name()] = pipe
+      self._input_pipe = pipe
     else:
       raise ValueError(f"{self.__class__.__name__} '{self.name}' can only have 1 input")
 
 
 class SingleOutputMixin:
   """Restricts a component to exactly 1 output pipe."""
+  _output_pipe = None  # the single output pipe, once connected
+
   def add_output_pipe(self, pipe: 'Pipe') -> 'Pipe':
-    if len(self.outputs) == 0:
+    if self._output_pipe is None:
       self.outputs[pipe.get_name()] = pipe
+      self._output_pipe = pipe
       pipe.set_origin(self)
       return pipe
     else:
@@ -1,12 +1,151 @@
+import csv
+import hashlib
+import json
 import logging
 import re
+import sqlite3
+import threading
+import time
 import pandas as pd
 from abc import abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
 from io import StringIO
+from typing import Callable, List, Optional, Tuple, Union
 from open_stage.core.base import DataPackage, Pipe, Node, SingleInputMixin, SingleOutputMixin
 
 logger = logging.getLogger(__name__)
 
+# Process-wide LRU of API results, shared by every transformer created with
+# cache_responses=True. Keys hash provider, model and the full request text.
+_RESPONSE_CACHE_MAXSIZE = 128
+_RESPONSE_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def _cache_key_prefix(class_name: str, model: str, max_tokens: int, system_message: str):
+    # The system message and settings are identical for every request of a
+    # transformer; hash them once and let each request copy the digest state
+    digest = hashlib.sha256()
+    for part in (class_name, model, str(max_tokens), system_message):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest
+
+# SQLite files backing cache_path, one shared connection per path. Entries
+# survive the process, so re-running a pipeline on unchanged data is free.
+_DISK_CACHES: dict = {}
+_DISK_CACHES_LOCK = threading.Lock()
+
+
+def _disk_cache(path: str) -> sqlite3.Connection:
+    with _DISK_CACHES_LOCK:
+        connection = _DISK_CACHES.get(path)
+        if connection is None:
+            connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL, result TEXT)")
+            connection.commit()
+            _DISK_CACHES[path] = connection
+        return connection
+
+
+# Prompts that are plain projections or row filters are executed locally with
+# pandas instead of round-tripping the data through the model.
+_NAME = r"(?:`[^`]+`|'[^']+'|\"[^\"]+\"|\w+)"
+_KEEP_COLUMNS_RE = re.compile(
+    rf"(?:keep|select|return)\s+(?:only\s+)?(?:the\s+)?columns?\s+(?P<cols>{_NAME}(?:\s*(?:,|and|, and)\s*{_NAME})*)\s*\.?",
+    re.IGNORECASE)
+_DROP_COLUMNS_RE = re.compile(
+    rf"(?:drop|remove|delete)\s+(?:the\s+)?columns?\s+(?P<cols>{_NAME}(?:\s*(?:,|and|, and)\s*{_NAME})*)\s*\.?",
+    re.IGNORECASE)
+_FILTER_ROWS_RE = re.compile(
+    rf"(?:filter|keep)\s+(?:only\s+)?(?:the\s+)?rows\s+where\s+(?P<col>{_NAME})\s*"
+    r"(?P<op><=|>=|==|!=|=|<|>)\s*(?P<value>[^\s]+?)\s*\.?",
+    re.IGNORECASE)
+_FILTER_OPS = {
+    '<': lambda s, v: s < v,
+    '>': lambda s, v: s > v,
+    '<=': lambda s, v: s <= v,
+    '>=': lambda s, v: s >= v,
+    '=': lambda s, v: s == v,
+    '==': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+}
+
+
+def _strip_quotes(token: str) -> str:
+    return token.strip().strip('`\'"').strip()
+
+
+def _split_column_list(cols: str) -> List[str]:
+    # Tokenized rather than split on "and", so a quoted name such as
+    # "sales and returns" stays one column; a bare "and" is a separator
+    names = []
+    for token in re.findall(_NAME, cols):
+        if token.lower() == 'and':
+            continue
+        name = _strip_quotes(token)
+        if name:
+            names.append(name)
+    return names
+
+
+def _parse_literal(token: str):
+    token = _strip_quotes(token)
+    for cast in (int, float):
+        try:
+            return cast(token)
+        except ValueError:
+            pass
+    return token
+
+
+def _check_columns(df: pd.DataFrame, columns: List[str]) -> List[str]:
+    # Only exact names count; anything else is left for the model to interpret
+    missing = [column for column in columns if column not in df.columns]
+    if missing:
+        raise KeyError(missing)
+    return columns
+
+
+def _compile_filter(column: str, op: str, value) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    compare = _FILTER_OPS[op]
+
+    def plan(df: pd.DataFrame) -> pd.DataFrame:
+        series = df[_check_columns(df, [column])[0]]
+        # pandas compares mismatched types without complaint (a number
+        # against strings just matches nothing), so only type-safe
+        # comparisons run locally; the rest go to the model
+        if isinstance(value, str):
+            if op not in ('=', '==', '!=') or pd.api.types.infer_dtype(series, skipna=True) != 'string':
+                raise TypeError(f"cannot compare column '{column}' with {value!r} locally")
+        elif pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+            raise TypeError(f"column '{column}' is not numeric")
+        return df[compare(series, value)]
+
+    return plan
+
+
+def _compile_local_plan(prompt: str) -> Optional[Callable[[pd.DataFrame], pd.DataFrame]]:
+    text = prompt.strip()
+    match = _KEEP_COLUMNS_RE.fullmatch(text)
+    if match:
+        columns = _split_column_list(match.group('cols'))
+        return lambda df: df.loc[:, _check_columns(df, columns)]
+    match = _DROP_COLUMNS_RE.fullmatch(text)
+    if match:
+        columns = _split_column_list(match.group('cols'))
+        return lambda df: df.drop(columns=_check_columns(df, columns))
+    match = _FILTER_ROWS_RE.fullmatch(text)
+    if match:
+        return _compile_filter(_strip_quotes(match.group('col')), match.group('op'),
+                               _parse_literal(match.group('value')))
+    return None
+
 
 class BasePromptTransformer(SingleInputMixin, SingleOutputMixin, Node):
 
@@ -23,15 +162,80 @@ class BasePromptTransformer(SingleInputMixin, SingleOutputMixin, Node):
         "- Return ONLY the raw CSV data"
     )
 
-    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int) -> None:
+    _JSON_SYSTEM_MESSAGE = (
+        "You are a data transformation assistant. You will receive data in CSV format "
+        "and transform it according to the user's instructions.\n"
+        "CRITICAL: You must ALWAYS return your response as a single JSON object:\n"
+        "- The object has one key, \"rows\", holding a list of objects\n"
+        "- Each object is one output row, mapping column names to values\n"
+        "- Every row must have the same keys, in the same order\n"
+        "- NEVER include explanations, markdown code blocks, or any text outside the JSON\n"
+        "- Return ONLY the raw JSON object"
+    )
+
+    _CSV_REMINDER = "\n\nRemember: Return ONLY raw CSV format, no explanations, no markdown, no code blocks."
+    _JSON_REMINDER = "\n\nRemember: Return ONLY the JSON object, no explanations, no markdown, no code blocks."
+
+    _AUTO_CHUNK_SAMPLE_ROWS = 100
+    # Rough size of a token in CSV text, used to estimate requests locally
+    _CHARS_PER_TOKEN = 4
+    # Largest prompt the model accepts, in tokens; None skips the local check
+    _INPUT_TOKEN_LIMIT: Optional[int] = None
+    # Constructor settings a fused transformer takes over from its steps, which
+    # must all agree on them; subclasses append their own settings
+    _FUSE_SETTINGS: Tuple[str, ...] = (
+        'chunk_rows', 'max_concurrency', 'csv_engine', 'cache_responses', 'float_decimals',
+        'run_in_background', 'output_format', 'cache_path', 'cache_ttl', 'columns', 'float_format',
+        'key_column',
+    )
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        api_key: str,
+        prompt: str,
+        max_tokens: int,
+        chunk_rows: Optional[Union[int, str]] = None,
+        max_concurrency: int = 4,
+        csv_engine: str = 'pandas',
+        cache_responses: bool = False,
+        float_decimals: Optional[int] = None,
+        run_in_background: bool = False,
+        output_format: str = 'csv',
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        columns: Optional[List[str]] = None,
+        float_format: Optional[str] = None,
+        key_column: Optional[str] = None,
+    ) -> None:
         super().__init__()
         self.name = name
         self.model = model
         self.api_key = api_key
         self.prompt = prompt
         self.max_tokens = max_tokens
+        self.chunk_rows = chunk_rows
+        self.max_concurrency = max_concurrency
+        self.csv_engine = csv_engine
+        self.cache_responses = cache_responses
+        self.float_decimals = float_decimals
+        self.run_in_background = run_in_background
+        self.output_format = output_format
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.columns = list(columns) if columns is not None else None
+        self.key_column = key_column
+        self.float_format = float_format
         self.received_df = None
         self.client = None
+        # run_in_background: one single-worker executor per transformer, so
+        # runs of a node stay in order and never wait on another node's pool
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._pending_lock = threading.Lock()
+        self._local_plan = _compile_local_plan(prompt) if prompt else None
+        self._message_head = f"Task: {prompt}\n\nHere is the input data in CSV format:\n\n"
 
         if not model or not model.strip():
             raise ValueError(f"{self.__class__.__name__} '{self.name}': model cannot be empty")
@@ -41,6 +245,29 @@ class BasePromptTransformer(SingleInputMixin, SingleOutputMixin, Node):
             raise ValueError(f"{self.__class__.__name__} '{self.name}': prompt cannot be empty")
         if max_tokens <= 0:
             raise ValueError(f"{self.__class__.__name__} '{self.name}': max_tokens must be positive, got {max_tokens}")
+        if chunk_rows is not None and chunk_rows != 'auto' and (not isinstance(chunk_rows, int) or chunk_rows <= 0):
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': chunk_rows must be positive or 'auto', got {chunk_rows!r}")
+        if max_concurrency <= 0:
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': max_concurrency must be positive, got {max_concurrency}")
+        if float_decimals is not None and float_decimals < 0:
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': float_decimals cannot be negative, got {float_decimals}")
+        valid_output_formats = ['csv', 'json']
+        if output_format not in valid_output_formats:
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': output_format must be one of {valid_output_formats}, got '{output_format}'")
+        if cache_ttl is not None and cache_ttl <= 0:
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': cache_ttl must be positive, got {cache_ttl}")
+        if float_format is not None:
+            try:
+                float_format % 1.5
+            except (TypeError, ValueError):
+                raise ValueError(f"{self.__class__.__name__} '{self.name}': float_format must be a %-format for one float, got {float_format!r}")
+        if columns is not None and len(self.columns) == 0:
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': columns cannot be empty")
+        if key_column is not None and (self.columns is None or key_column not in self.columns):
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': key_column must be one of columns, got {key_column!r}")
+        valid_csv_engines = ['pandas', 'pyarrow']
+        if csv_engine not in valid_csv_engines:
+            raise ValueError(f"{self.__class__.__name__} '{self.name}': csv_engine must be one of {valid_csv_engines}, got '{csv_engine}'")
 
     @abstractmethod
     def _initialize_client(self) -> None:
@@ -62,83 +289,447 @@ class BasePromptTransformer(SingleInputMixin, SingleOutputMixin, Node):
         logger.debug("%s '%s' received data from pipe '%s': %d rows, %d columns",
                      self.__class__.__name__, self.name, data_package.get_pipe_name(),
                      len(df), len(df.columns))
+        if self.run_in_background:
+            # Never blocks: this may run on an upstream transformer's worker
+            self._raise_background_error()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"open-stage-ai-{self.name}")
+            future = self._executor.submit(self._process, df)
+            with self._pending_lock:
+                self._pending.append(future)
+            return
         self.received_df = df
         self.pump()
 
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the background runs started by sink() and re-raise the first error, if any."""
+        with self._pending_lock:
+            pending = list(self._pending)
+        _, not_done = wait(pending, timeout=timeout)
+        self._raise_background_error()
+        if not_done:
+            raise FutureTimeoutError(f"{self.__class__.__name__} '{self.name}': "
+                                     f"{len(not_done)} background runs still in progress")
+
+    def _raise_background_error(self) -> None:
+        # Finished runs are dropped; the first one that failed is re-raised
+        with self._pending_lock:
+            finished = [future for future in self._pending if future.done()]
+            self._pending = [future for future in self._pending if future not in finished]
+        for future in finished:
+            error = future.exception()
+            if error is not None:
+                raise error
+
     def pump(self) -> None:
+        self._raise_background_error()
         if self.received_df is None:
             logger.warning("%s '%s' has no data to process", self.__class__.__name__, self.name)
             return
-        if len(self.outputs) == 0:
+        # Take the frame off the node so it is not kept alive by it while the
+        # request is in flight
+        df, self.received_df = self.received_df, None
+        self._process(df)
+
+    def _process(self, df: pd.DataFrame) -> None:
+        if self._output_pipe is None:
             logger.warning("%s '%s' has no output pipe configured", self.__class__.__name__, self.name)
             return
 
-        df = self.received_df
+        try:
+            input_df = df
+            if self.columns is not None:
+                missing = [column for column in self.columns if column not in df.columns]
+                if missing:
+                    raise ValueError(f"{self.__class__.__name__} '{self.name}': columns not found in input: {missing}")
+                # Columns the prompt does not need would only cost tokens
+                df = df.loc[:, self.columns]
+
+            result_df = self._run_local_plan(df)
+            if result_df is None:
+                result_df = self._run_model(df)
+            if self.columns is not None:
+                result_df = self._reattach_columns(input_df, result_df)
+
+            logger.info("%s '%s' completed: %d rows → %d rows, columns: %s",
+                        self.__class__.__name__, self.name, len(df), len(result_df), list(result_df.columns))
+
+            output_pipe = self._output_pipe
+            output_pipe.flow(result_df)
+            logger.debug("%s '%s' pumped data through pipe '%s'", self.__class__.__name__, self.name, output_pipe.get_name())
+
+        except Exception as e:
+            logger.error("%s '%s' failed: %s: %s", self.__class__.__name__, self.name, type(e).__name__, e)
+            raise
+
+    def _reattach_columns(self, input_df: pd.DataFrame, result_df: pd.DataFrame) -> pd.DataFrame:
+        # Columns held back from the model are looked up by key_column, so
+        # output rows that were filtered, sorted or reordered still get the
+        # values of their own input row
+        untouched = [column for column in input_df.columns
+                     if column not in self.columns and column not in result_df.columns]
+        if not untouched:
+            return result_df
+        key = self.key_column
+        if key is None:
+            reason = "no key_column is set"
+        elif key not in result_df.columns:
+            reason = f"key column '{key}' is missing from the output"
+        elif not input_df[key].is_unique:
+            reason = f"key column '{key}' has duplicate values"
+        else:
+            reason = None
+        if reason is not None:
+            logger.warning("%s '%s' cannot match output rows to input rows (%s); columns not sent to the "
+                           "model are dropped: %s", self.__class__.__name__, self.name, reason, untouched)
+            return result_df
+
+        input_keys, output_keys = input_df[key], result_df[key]
+        if input_keys.dtype != output_keys.dtype:
+            # The model's CSV may parse the key as another type (1 vs '1')
+            input_keys, output_keys = input_keys.astype(str), output_keys.astype(str)
+        held = input_df[untouched].set_index(pd.Index(input_keys.to_numpy()))
+        unmatched = int((~output_keys.isin(held.index)).sum())
+        if unmatched:
+            logger.warning("%s '%s' returned %d rows whose key is not in the input; their columns not sent "
+                           "to the model are left empty", self.__class__.__name__, self.name, unmatched)
+        attached = held.reindex(output_keys.to_numpy()).reset_index(drop=True)
+        combined = pd.concat([attached, result_df.reset_index(drop=True)], axis=1)
+        order = [column for column in input_df.columns if column in combined.columns]
+        order += [column for column in result_df.columns if column not in input_df.columns]
+        return combined.loc[:, order]
+
+    def can_fuse_with(self, other: 'BasePromptTransformer') -> bool:
+        """True if `other` can run in the same API call as this transformer."""
+        return (
+            type(other) is type(self)
+            and other.model == self.model
+            and other.api_key == self.api_key
+            and all(getattr(other, setting) == getattr(self, setting) for setting in self._FUSE_SETTINGS)
+        )
+
+    @classmethod
+    def fuse(cls, name: str, transformers: List['BasePromptTransformer']) -> 'BasePromptTransformer':
+        """
+        Build a single transformer equivalent to running `transformers` in
+        sequence, so a linear chain of N prompts costs one API round trip
+        instead of N. The transformers must not be wired to pipes yet.
+        """
+        if len(transformers) < 2:
+            raise ValueError(f"{cls.__name__} '{name}': fuse needs at least 2 transformers, got {len(transformers)}")
+        first = transformers[0]
+        for transformer in transformers:
+            if not isinstance(transformer, cls) or not first.can_fuse_with(transformer):
+                raise ValueError(
+                    f"{cls.__name__} '{name}': cannot fuse '{transformer.name}' — "
+                    f"transformers must share class, model, api_key and {', '.join(cls._FUSE_SETTINGS)}"
+                )
+            if transformer.inputs or transformer.outputs:
+                raise ValueError(f"{cls.__name__} '{name}': cannot fuse '{transformer.name}', it is already connected to pipes")
+
+        steps = "\n".join(f"{i}) {t.prompt}" for i, t in enumerate(transformers, start=1))
+        if first.output_format == 'json':
+            result = "return the rows of the final step only, as the JSON object"
+        else:
+            result = "return the CSV of the final step only"
+        prompt = f"Perform the following steps in order and {result}:\n{steps}"
+        settings = {setting: getattr(first, setting) for setting in cls._FUSE_SETTINGS}
+        fused = cls(name, first.model, first.api_key, prompt, max(t.max_tokens for t in transformers), **settings)
+        logger.info("%s '%s' fused %d transformers: %s",
+                    cls.__name__, name, len(transformers), [t.name for t in transformers])
+        return fused
 
+    def _run_local_plan(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        if self._local_plan is None:
+            return None
         try:
-            if self.client is None:
-                self._initialize_client()
+            result_df = self._local_plan(df).reset_index(drop=True)
+        except (KeyError, TypeError) as e:
+            logger.debug("%s '%s' local plan not applicable (%s), falling back to the model",
+                         self.__class__.__name__, self.name, e)
+            return None
+        logger.info("%s '%s' executed prompt locally without calling the API",
+                    self.__class__.__name__, self.name)
+        return result_df
 
-            data_csv = df.to_csv(index=False)
-            logger.info("%s '%s' sending request — model: %s, input: %d chars",
-                        self.__class__.__name__, self.name, self.model, len(data_csv))
+    def _run_model(self, df: pd.DataFrame) -> pd.DataFrame:
+        if len(df) == 0:
+            # Nothing for the model to transform; keep the input schema
+            logger.info("%s '%s' received no rows, skipping the API call",
+                        self.__class__.__name__, self.name)
+            return df.reset_index(drop=True)
 
-            user_message = (
-                f"Here is the input data in CSV format:\n\n{data_csv}\n\n"
-                f"Task: {self.prompt}\n\n"
-                "Remember: Return ONLY raw CSV format, no explanations, no markdown, no code blocks."
-            )
+        if self.client is None:
+            self._initialize_client()
+
+        chunks = self._split_chunks(df)
+        if len(chunks) == 1:
+            return self._transform(df)
+
+        workers = min(self.max_concurrency, len(chunks))
+        logger.info("%s '%s' splitting %d rows into %d chunks (max_concurrency=%d)",
+                    self.__class__.__name__, self.name, len(df), len(chunks), workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._transform, chunks))
+        return pd.concat(results, ignore_index=True)
 
-            result = self._call_api(self._SYSTEM_MESSAGE, user_message)
+    def _split_chunks(self, df: pd.DataFrame) -> List[pd.DataFrame]:
+        chunk_rows = self._auto_chunk_rows(df) if self.chunk_rows == 'auto' else self.chunk_rows
+        if chunk_rows is None or len(df) <= chunk_rows:
+            return [df]
+        return [df.iloc[start:start + chunk_rows] for start in range(0, len(df), chunk_rows)]
 
-            response_text = result['response_text']
-            truncated = result.get('truncated', False)
-            input_tokens = result.get('input_tokens', 0)
-            output_tokens = result.get('output_tokens', 0)
+    def _auto_chunk_rows(self, df: pd.DataFrame) -> int:
+        # ~4 bytes of CSV per token; keep each chunk's input within a third of
+        # max_tokens so the transformed output still fits in the response.
+        sample = df.head(self._AUTO_CHUNK_SAMPLE_ROWS)
+        if sample.empty:
+            return 1
+        bytes_per_row = max(1, len(self._to_csv(sample).encode('utf-8')) // len(sample))
+        token_budget = self.max_tokens // 3
+        return max(1, token_budget * self._CHARS_PER_TOKEN // bytes_per_row)
 
-            logger.info("%s '%s' received response — %d chars, tokens: %d in / %d out",
-                        self.__class__.__name__, self.name, len(response_text), input_tokens, output_tokens)
+    def _to_csv(self, df: pd.DataFrame) -> str:
+        if self.float_decimals is not None:
+            float_columns = df.select_dtypes(include='float').columns
+            if len(float_columns) > 0:
+                df = df.round({column: self.float_decimals for column in float_columns})
+        # Arrow's writer has no float formatting, so float_format always goes through pandas
+        if self.csv_engine == 'pyarrow' and self.float_format is None:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                # Mixed-type object columns have no Arrow type; pandas can still write them
+                logger.debug("%s '%s' falling back to pandas CSV writer: %s",
+                             self.__class__.__name__, self.name, e)
+            else:
+                sink = pa.BufferOutputStream()
+                pacsv.write_csv(table, sink)
+                # Decode straight from the Arrow buffer instead of copying it into bytes first
+                return str(memoryview(sink.getvalue()), 'utf-8')
+        if self._needs_no_quoting(df):
+            return df.to_csv(index=False, quoting=csv.QUOTE_NONE, float_format=self.float_format)
+        return df.to_csv(index=False, float_format=self.float_format)
+
+    @staticmethod
+    def _needs_no_quoting(df: pd.DataFrame) -> bool:
+        # Numbers never contain delimiters or quotes, so an all-numeric frame
+        # with plain column names serializes the same without quote scanning
+        return (
+            all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+            and not any(char in str(column) for column in df.columns for char in ',"\r\n')
+        )
+
+    def _read_csv(self, csv_text: str) -> pd.DataFrame:
+        if self.csv_engine == 'pyarrow':
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            try:
+                return pacsv.read_csv(pa.py_buffer(csv_text.encode('utf-8'))).to_pandas()
+            except pa.ArrowInvalid as e:
+                # Arrow rejects ragged rows that pandas pads with NaN
+                logger.debug("%s '%s' falling back to pandas CSV reader: %s",
+                             self.__class__.__name__, self.name, e)
+        return pd.read_csv(StringIO(csv_text))
+
+    def _transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        data_csv = self._to_csv(df)
+        logger.info("%s '%s' sending request — model: %s, input: %d chars",
+                    self.__class__.__name__, self.name, self.model, len(data_csv))
+
+        # Task first, data last: the system message and task form a prefix that
+        # repeats across chunks and runs, which providers with automatic prompt
+        # caching can reuse instead of re-processing.
+        json_output = self.output_format == 'json'
+        # Joined in one pass so the (possibly multi-MB) CSV is copied only once
+        user_message = "".join((
+            self._message_head, data_csv,
+            self._JSON_REMINDER if json_output else self._CSV_REMINDER,
+        ))
+
+        if self._INPUT_TOKEN_LIMIT is not None:
+            estimated_tokens = len(user_message) // self._CHARS_PER_TOKEN
+            if estimated_tokens > self._INPUT_TOKEN_LIMIT:
+                # The estimate only pre-filters: providers that can count
+                # tokens exactly get the final say before the request is refused
+                counted_tokens = self._count_tokens(user_message)
+                tokens = counted_tokens if counted_tokens is not None else estimated_tokens
+                if tokens > self._INPUT_TOKEN_LIMIT:
+                    # Known to be rejected, so don't spend a round trip finding out
+                    if self.chunk_rows is not None and len(df) > 1:
+                        logger.warning("%s '%s' request of ~%d tokens exceeds the %d-token input limit, splitting it in two",
+                                       self.__class__.__name__, self.name, tokens, self._INPUT_TOKEN_LIMIT)
+                        return self._transform_halves(df)
+                    raise ValueError(
+                        f"{self.__class__.__name__} '{self.name}': request of ~{tokens} tokens exceeds the "
+                        f"model's {self._INPUT_TOKEN_LIMIT}-token input limit — set chunk_rows or columns"
+                    )
+
+        system_message = self._JSON_SYSTEM_MESSAGE if json_output else self._SYSTEM_MESSAGE
+        result = self._cached_call_api(system_message, user_message)
+
+        response_text = result['response_text']
+        truncated = result.get('truncated', False)
+        input_tokens = result.get('input_tokens', 0)
+        output_tokens = result.get('output_tokens', 0)
+
+        logger.info("%s '%s' received response — %d chars, tokens: %d in / %d out",
+                    self.__class__.__name__, self.name, len(response_text), input_tokens, output_tokens)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Response preview: %s", response_text[:300])
 
-            if truncated:
-                logger.warning("%s '%s' response was truncated by token limit", self.__class__.__name__, self.name)
+        if truncated and self.chunk_rows is not None and len(df) > 1:
+            # Rows are independent when chunking is enabled, so retry each
+            # half on its own instead of dropping the rows that did not fit
+            logger.warning("%s '%s' response was truncated by token limit, retrying as two requests of %d and %d rows",
+                           self.__class__.__name__, self.name, len(df) // 2, len(df) - len(df) // 2)
+            return self._transform_halves(df)
 
-            result_df = self._parse_csv_response(response_text, truncated)
+        if truncated:
+            logger.warning("%s '%s' response was truncated by token limit", self.__class__.__name__, self.name)
 
-            logger.info("%s '%s' completed: %d rows → %d rows, columns: %s",
-                        self.__class__.__name__, self.name, len(df), len(result_df), list(result_df.columns))
+        if json_output:
+            return self._parse_json_response(response_text, truncated)
+        return self._parse_csv_response(response_text, truncated)
 
-            output_pipe = list(self.outputs.values())[0]
-            output_pipe.flow(result_df)
-            logger.debug("%s '%s' pumped data through pipe '%s'", self.__class__.__name__, self.name, output_pipe.get_name())
+    def _count_tokens(self, user_message: str) -> Optional[int]:
+        """Exact input token count from the provider, or None to rely on the estimate."""
+        return None
+
+    def _transform_halves(self, df: pd.DataFrame) -> pd.DataFrame:
+        middle = len(df) // 2
+        return pd.concat([self._transform(df.iloc[:middle]), self._transform(df.iloc[middle:])],
+                         ignore_index=True)
+
+    def _cache_key(self, system_message: str, user_message: str) -> str:
+        digest = _cache_key_prefix(self.__class__.__name__, self.model, self.max_tokens, system_message).copy()
+        digest.update(user_message.encode('utf-8'))
+        digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def _cached_call_api(self, system_message: str, user_message: str) -> dict:
+        if not self.cache_responses and not self.cache_path:
+            return self._call_api(system_message, user_message)
+
+        key = self._cache_key(system_message, user_message)
+        cached = None
+        if self.cache_responses:
+            with _RESPONSE_CACHE_LOCK:
+                cached = _RESPONSE_CACHE.get(key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(key)
+        if cached is None and self.cache_path:
+            cached = self._disk_cache_get(key)
+        if cached is not None:
+            logger.info("%s '%s' response cache hit — skipping API call", self.__class__.__name__, self.name)
+            return cached
 
+        result = self._call_api(system_message, user_message)
+        if not result.get('truncated', False):
+            if self.cache_responses:
+                with _RESPONSE_CACHE_LOCK:
+                    _RESPONSE_CACHE[key] = result
+                    _RESPONSE_CACHE.move_to_end(key)
+                    while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAXSIZE:
+                        _RESPONSE_CACHE.popitem(last=False)
+            if self.cache_path:
+                self._disk_cache_put(key, result)
+        return result
+
+    def _disk_cache_get(self, key: str) -> Optional[dict]:
+        connection = _disk_cache(self.cache_path)
+        with _DISK_CACHES_LOCK:
+            row = connection.execute("SELECT created, result FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        created, result = row
+        if self.cache_ttl is not None and time.time() - created > self.cache_ttl:
+            return None
+        return json.loads(result)
+
+    def _disk_cache_put(self, key: str, result: dict) -> None:
+        connection = _disk_cache(self.cache_path)
+        with _DISK_CACHES_LOCK:
+            connection.execute("INSERT OR REPLACE INTO responses (key, created, result) VALUES (?, ?, ?)",
+                               (key, time.time(), json.dumps(result)))
+            connection.commit()
+
+    @staticmethod
+    def clear_response_cache() -> None:
+        """Drop every cached API response."""
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE.clear()
+
+    def _parse_json_response(self, response_text: str, truncated: bool) -> pd.DataFrame:
+        if truncated:
+            raise ValueError(
+                f"{self.__class__.__name__} '{self.name}': JSON response was truncated by the token limit — "
+                f"increase max_tokens or set chunk_rows"
+            )
+        # Providers without a JSON mode may still wrap the object in ```json
+        response_text = self._strip_code_fence(response_text)
+        try:
+            rows = json.loads(response_text)['rows']
+            result_df = pd.DataFrame.from_records(rows)
+            logger.debug("Parsed JSON response: %d records", len(result_df))
+            return result_df
         except Exception as e:
-            logger.error("%s '%s' failed: %s: %s", self.__class__.__name__, self.name, type(e).__name__, e)
+            logger.error("Failed to parse JSON response: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response preview (first 500 chars): %s", response_text[:500])
             raise
 
-        finally:
-            self.received_df = None
-
-    def _parse_csv_response(self, response_text: str, truncated: bool) -> pd.DataFrame:
-        response_text = response_text.strip()
+    @staticmethod
+    def _drop_incomplete_row(response_text: str) -> str:
+        repaired = response_text.rstrip(' \t\r')
+        if repaired.endswith('\n'):
+            # Cut right after a line break: no partial line, though the break
+            # may still be inside a multi-line quoted field
+            repaired = repaired.rstrip('\r\n')
+        else:
+            last_newline = repaired.rfind('\n')
+            if last_newline == -1:
+                return response_text
+            repaired = repaired[:last_newline]
+        # An odd quote count means the cut row began inside a multi-line
+        # quoted field; keep dropping lines until the quotes balance
+        while repaired.count('"') % 2 and '\n' in repaired:
+            repaired = repaired[:repaired.rfind('\n')]
+        logger.debug("Repaired CSV by removing incomplete last line")
+        return repaired
 
+    @staticmethod
+    def _strip_code_fence(response_text: str) -> str:
+        response_text = response_text.lstrip()
         if response_text.startswith('```'):
-            csv_match = re.search(r'```(?:csv)?\s*(.*?)\s*```', response_text, re.DOTALL)
-            if csv_match:
-                response_text = csv_match.group(1).strip()
-                logger.debug("Removed markdown code block wrapper from response")
+            start = response_text.find('\n') + 1
+            end = response_text.rfind('```')
+            if start == 0:
+                response_text = response_text.strip('`').strip()
+            elif end < start:
+                # Opening fence only — the closing one was cut off by truncation
+                response_text = response_text[start:]
+            else:
+                response_text = response_text[start:end].strip()
+            logger.debug("Removed markdown code block wrapper from response")
+        return response_text
+
+    def _parse_csv_response(self, response_text: str, truncated: bool) -> pd.DataFrame:
+        response_text = self._strip_code_fence(response_text)
 
         if truncated:
-            last_newline = response_text.rfind('\n')
-            if last_newline != -1:
-                response_text = response_text[:last_newline]
-                logger.debug("Repaired CSV by removing incomplete last line")
+            response_text = self._drop_incomplete_row(response_text)
+
+        response_text = response_text.strip()
 
         try:
-            result_df = pd.read_csv(StringIO(response_text))
+            result_df = self._read_csv(response_text)
             logger.debug("Parsed CSV response: %d records", len(result_df))
             return result_df
-        except (pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+        except Exception as e:
             logger.error("Failed to parse CSV response: %s", e)
-            logger.debug("Response preview (first 500 chars): %s", response_text[:500])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response preview (first 500 chars): %s", response_text[:500])
             raise
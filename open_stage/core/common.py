@@ -1,4 +1,5 @@
 
+import http.cookiejar
 import logging
 import pandas as pd
 import requests
@@ -8,6 +9,12 @@ import inspect
 
 logger = logging.getLogger(__name__)
 
+# Shared across every APIRestOrigin so repeated pumps reuse pooled keep-alive
+# connections instead of paying a new TCP/TLS handshake per request.
+_HTTP_SESSION = requests.Session()
+# Cookies set by one origin's endpoint must not be sent by every other origin
+_HTTP_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
 
 class Printer(SingleInputMixin, Destination):
   def __init__(self, name: str) -> None:
@@ -43,20 +50,20 @@ class Funnel(SingleOutputMixin, Node):
     if not self.dfs:
       logger.error("Funnel '%s' has no DataFrames to merge", self.name)
       return
-    base_columns = list(self.dfs[0].columns)
+    base_columns = self.dfs[0].columns
     for i, df in enumerate(self.dfs):
-      if list(df.columns) != base_columns:
+      if not df.columns.equals(base_columns):
         logger.warning("Funnel '%s': DataFrame %d has different columns. Expected %s, got %s",
-                       self.name, i, base_columns, list(df.columns))
+                       self.name, i, list(base_columns), list(df.columns))
     self.combined_df = pd.concat(self.dfs, ignore_index=True)
     logger.info("Funnel '%s' merged %d DataFrames into shape %s", self.name, len(self.dfs), self.combined_df.shape)
     self.pump()
 
   def pump(self) -> None:
-    if not hasattr(self, 'combined_df') or len(self.outputs) == 0:
+    if not hasattr(self, 'combined_df') or self._output_pipe is None:
       logger.warning("Funnel '%s' has no combined data or no output pipe", self.name)
       return
-    output_pipe = list(self.outputs.values())[0]
+    output_pipe = self._output_pipe
     output_pipe.flow(self.combined_df)
     logger.info("Funnel '%s' pumped merged data through pipe '%s'", self.name, output_pipe.get_name())
 
@@ -134,8 +141,8 @@ class CSVOrigin(SingleOutputMixin, Origin):
     try:
       df = pd.read_csv(**self.csv_kwargs)
       logger.info("CSVOrigin '%s' read CSV with shape %s", self.name, df.shape)
-      if len(self.outputs) > 0:
-        output_pipe = list(self.outputs.values())[0]
+      if self._output_pipe is not None:
+        output_pipe = self._output_pipe
         output_pipe.flow(df)
         logger.debug("CSVOrigin '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
       else:
@@ -223,7 +230,7 @@ class Aggregator(SingleInputMixin, SingleOutputMixin, Node):
     if self.received_df is None:
       logger.warning("Aggregator '%s' has no data to process", self.name)
       return
-    if len(self.outputs) == 0:
+    if self._output_pipe is None:
       logger.warning("Aggregator '%s' has no output pipe configured", self.name)
       return
     df = self.received_df
@@ -240,7 +247,7 @@ class Aggregator(SingleInputMixin, SingleOutputMixin, Node):
         self.agg_field_name: agg_result.values
       }).reset_index(drop=True)
       logger.info("Aggregator '%s' completed: %d rows → %d groups", self.name, len(df), len(result_df))
-      output_pipe = list(self.outputs.values())[0]
+      output_pipe = self._output_pipe
       output_pipe.flow(result_df)
       logger.debug("Aggregator '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
     except Exception as e:
@@ -276,14 +283,14 @@ class DeleteColumns(SingleInputMixin, SingleOutputMixin, Node):
     if self.received_df is None:
       logger.warning("DeleteColumns '%s' has no data to process", self.name)
       return
-    if len(self.outputs) == 0:
+    if self._output_pipe is None:
       logger.warning("DeleteColumns '%s' has no output pipe configured", self.name)
       return
     df = self.received_df
     try:
       result_df = df.drop(columns=self.columns)
       logger.info("DeleteColumns '%s' dropped %d columns: %s", self.name, len(self.columns), self.columns)
-      output_pipe = list(self.outputs.values())[0]
+      output_pipe = self._output_pipe
       output_pipe.flow(result_df)
       logger.debug("DeleteColumns '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
     except Exception as e:
@@ -328,7 +335,7 @@ class Filter(SingleInputMixin, SingleOutputMixin, Node):
     if self.received_df is None:
       logger.warning("Filter '%s' has no data to process", self.name)
       return
-    if len(self.outputs) == 0:
+    if self._output_pipe is None:
       logger.warning("Filter '%s' has no output pipe configured", self.name)
       return
     df = self.received_df
@@ -355,7 +362,7 @@ class Filter(SingleInputMixin, SingleOutputMixin, Node):
       filtered_df = df[mask]
       logger.info("Filter '%s' passed %d/%d rows (%s %s %s)",
                   self.name, len(filtered_df), len(df), self.field, self.condition, self.value_or_values)
-      output_pipe = list(self.outputs.values())[0]
+      output_pipe = self._output_pipe
       output_pipe.flow(filtered_df)
       logger.debug("Filter '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
     except Exception as e:
@@ -385,7 +392,7 @@ class Joiner(SingleOutputMixin, Node):
       raise ValueError(f"Joiner '{self.name}': left and right pipe names must be different")
 
   def add_input_pipe(self, pipe: Pipe) -> None:
-    if len(self.inputs.keys()) < 2:
+    if len(self.inputs) < 2:
       self.inputs[pipe.get_name()] = pipe
     else:
       raise ValueError(f"Joiner '{self.name}' can only have 2 inputs")
@@ -408,7 +415,7 @@ class Joiner(SingleOutputMixin, Node):
     if len(self.received_dfs) != 2:
       logger.warning("Joiner '%s' needs exactly 2 DataFrames, got %d", self.name, len(self.received_dfs))
       return
-    if len(self.outputs) == 0:
+    if self._output_pipe is None:
       logger.warning("Joiner '%s' has no output pipe configured", self.name)
       return
     if self.left_pipe_name not in self.received_dfs:
@@ -422,7 +429,7 @@ class Joiner(SingleOutputMixin, Node):
       logger.info("Joiner '%s' completed %s join on '%s': %d + %d rows → %d rows, %d columns",
                   self.name, self.join_type, self.key, len(left_df), len(right_df),
                   len(result_df), len(result_df.columns))
-      output_pipe = list(self.outputs.values())[0]
+      output_pipe = self._output_pipe
       output_pipe.flow(result_df)
       logger.debug("Joiner '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
     except Exception as e:
@@ -531,25 +538,27 @@ class Transformer(SingleInputMixin, SingleOutputMixin, Node):
               f"not defined in function: {invalid_kwargs}. "
               f"Function parameters: {func_params}"
             )
-      logger.debug("Transformer '%s' initialized: function='%s', kwargs=%s",
-                   self.name, transformer_function.__name__, list(self.transformer_kwargs.keys()))
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Transformer '%s' initialized: function='%s', kwargs=%s",
+                     self.name, getattr(transformer_function, '__name__', repr(transformer_function)),
+                     list(self.transformer_kwargs.keys()))
     except ValueError:
       raise
     except Exception as e:
       logger.warning("Transformer '%s': could not validate function signature: %s", self.name, e)
 
   def sink(self, data_package: DataPackage) -> None:
-    logger.debug("Transformer '%s' received data from pipe '%s': %d rows, %d columns",
-                 self.name, data_package.get_pipe_name(),
-                 len(data_package.get_df()), len(data_package.get_df().columns))
-    self.received_df = data_package.get_df()
+    df = data_package.get_df()
+    logger.debug("Transformer '%s' received data from pipe '%s': shape %s",
+                 self.name, data_package.get_pipe_name(), df.shape)
+    self.received_df = df
     self.pump()
 
   def pump(self) -> None:
     if self.received_df is None:
       logger.warning("Transformer '%s' has no data to process", self.name)
       return
-    if len(self.outputs) == 0:
+    if self._output_pipe is None:
       logger.warning("Transformer '%s' has no output pipe configured", self.name)
       return
     df = self.received_df
@@ -562,9 +571,10 @@ class Transformer(SingleInputMixin, SingleOutputMixin, Node):
         )
       if result_df.empty:
         logger.warning("Transformer '%s': transformation resulted in empty DataFrame", self.name)
+      (rows_in, cols_in), (rows_out, cols_out) = df.shape, result_df.shape
       logger.info("Transformer '%s' completed: %d rows → %d rows, %d → %d columns",
-                  self.name, len(df), len(result_df), len(df.columns), len(result_df.columns))
-      output_pipe = list(self.outputs.values())[0]
+                  self.name, rows_in, rows_out, cols_in, cols_out)
+      output_pipe = self._output_pipe
       output_pipe.flow(result_df)
       logger.debug("Transformer '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
     except TypeError as e:
@@ -600,7 +610,7 @@ class APIRestOrigin(SingleOutputMixin, Origin):
   def pump(self) -> None:
     try:
       logger.debug("APIRestOrigin '%s' making HTTP request: %s", self.name, self.request_kwargs)
-      response = requests.request(**self.request_kwargs)
+      response = _HTTP_SESSION.request(**self.request_kwargs)
       response.raise_for_status()
       json_data = response.json()
       data = self._navigate_path(json_data, self.path)
@@ -616,8 +626,8 @@ class APIRestOrigin(SingleOutputMixin, Origin):
           raise ValueError(f"APIRestOrigin '{self.name}': fields {missing_fields} not found in response data. Available fields: {list(df.columns)}")
         df = df[self.fields]
       logger.info("APIRestOrigin '%s' fetched DataFrame with shape %s", self.name, df.shape)
-      if len(self.outputs) > 0:
-        output_pipe = list(self.outputs.values())[0]
+      if self._output_pipe is not None:
+        output_pipe = self._output_pipe
         output_pipe.flow(df)
         logger.debug("APIRestOrigin '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
       else:
@@ -677,7 +687,7 @@ class RemoveDuplicates(SingleInputMixin, SingleOutputMixin, Node):
     if self.received_df is None:
       logger.warning("RemoveDuplicates '%s' has no data to process", self.name)
       return
-    if len(self.outputs) == 0:
+    if self._output_pipe is None:
       logger.warning("RemoveDuplicates '%s' has no output pipe configured", self.name)
       return
     df = self.received_df
@@ -690,7 +700,7 @@ class RemoveDuplicates(SingleInputMixin, SingleOutputMixin, Node):
       logger.info("RemoveDuplicates '%s' removed %d duplicates: %d → %d rows (key='%s', sort='%s' %s, retain=%s)",
                   self.name, duplicates_removed, len(df), len(result_df),
                   self.key, self.sort_by, self.orientation, self.retain)
-      output_pipe = list(self.outputs.values())[0]
+      output_pipe = self._output_pipe
       output_pipe.flow(result_df)
       logger.debug("RemoveDuplicates '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
     except Exception as e:
@@ -747,8 +757,8 @@ class OpenOrigin(SingleOutputMixin, Origin):
   def pump(self) -> None:
     try:
       logger.info("OpenOrigin '%s' pumping DataFrame with shape %s", self.name, self.df.shape)
-      if len(self.outputs) > 0:
-        output_pipe = list(self.outputs.values())[0]
+      if self._output_pipe is not None:
+        output_pipe = self._output_pipe
         output_pipe.flow(self.df)
         logger.debug("OpenOrigin '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
       else:
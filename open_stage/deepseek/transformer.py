@@ -1,32 +1,77 @@
 import logging
+import threading
+import weakref
+from typing import Optional
+import httpx
 from openai import OpenAI
 from open_stage.core.base_ai import BasePromptTransformer
 
 logger = logging.getLogger(__name__)
 
+# One connection pool for every DeepSeekPromptTransformer in the process, so
+# consecutive requests (and concurrent chunks) reuse warm TLS connections.
+_SHARED_HTTP_CLIENT: Optional[httpx.Client] = None
+_SHARED_HTTP_CLIENT_LOCK = threading.Lock()
+# Transformers whose client wraps the shared pool, so close_shared() can make
+# them build a new one instead of sending through the closed pool
+_CLIENT_HOLDERS: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _open_http_client() -> httpx.Client:
+    # Caller holds _SHARED_HTTP_CLIENT_LOCK
+    global _SHARED_HTTP_CLIENT
+    if _SHARED_HTTP_CLIENT is None or _SHARED_HTTP_CLIENT.is_closed:
+        _SHARED_HTTP_CLIENT = httpx.Client(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        )
+    return _SHARED_HTTP_CLIENT
+
 
 class DeepSeekPromptTransformer(BasePromptTransformer):
 
     _BASE_URL = "https://api.deepseek.com"
     _MAX_TOKENS_LIMIT = 8192
 
-    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int = 8192) -> None:
-        super().__init__(name, model, api_key, prompt, max_tokens)
+    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int = 8192, **kwargs) -> None:
+        # chunk_rows, output_format, columns, ... are handled by BasePromptTransformer
+        super().__init__(name, model, api_key, prompt, max_tokens, **kwargs)
         if max_tokens > self._MAX_TOKENS_LIMIT:
             raise ValueError(
                 f"DeepSeekPromptTransformer '{self.name}': max_tokens must be between 1 and "
                 f"{self._MAX_TOKENS_LIMIT}, got {max_tokens}"
             )
 
+    @classmethod
+    def close_shared(cls) -> None:
+        """Close the connection pool shared by all DeepSeekPromptTransformer instances."""
+        global _SHARED_HTTP_CLIENT
+        with _SHARED_HTTP_CLIENT_LOCK:
+            if _SHARED_HTTP_CLIENT is not None:
+                _SHARED_HTTP_CLIENT.close()
+                _SHARED_HTTP_CLIENT = None
+            # The next pump() builds a client on a fresh pool
+            for transformer in list(_CLIENT_HOLDERS):
+                transformer.client = None
+            _CLIENT_HOLDERS.clear()
+
     def _initialize_client(self) -> None:
         try:
-            self.client = OpenAI(api_key=self.api_key, base_url=self._BASE_URL)
+            # Under the lock so close_shared() cannot close the pool between
+            # building the client and registering it
+            with _SHARED_HTTP_CLIENT_LOCK:
+                self.client = OpenAI(api_key=self.api_key, base_url=self._BASE_URL,
+                                     http_client=_open_http_client())
+                _CLIENT_HOLDERS.add(self)
             logger.info("DeepSeekPromptTransformer '%s' client initialized (model=%s)", self.name, self.model)
         except Exception as e:
             raise ValueError(f"DeepSeekPromptTransformer '{self.name}' failed to initialize client: {str(e)}")
 
     def _call_api(self, system_message: str, user_message: str) -> dict:
-        response = self.client.chat.completions.create(
+        extra_kwargs = {}
+        if self.output_format == 'json':
+            extra_kwargs['response_format'] = {"type": "json_object"}
+        stream = self.client.chat.completions.create(
             model=self.model,
             messages=[
                 {"role": "system", "content": system_message},
@@ -34,11 +79,31 @@ class DeepSeekPromptTransformer(BasePromptTransformer):
             ],
             max_tokens=self.max_tokens,
             temperature=0.0,
-            stream=False,
+            stream=True,
+            stream_options={"include_usage": True},
+            **extra_kwargs,
         )
+        parts = []
+        finish_reason = None
+        input_tokens = 0
+        output_tokens = 0
+        cache_hit_tokens = 0
+        for chunk in stream:
+            if chunk.choices:
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    parts.append(choice.delta.content)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+            if chunk.usage:
+                input_tokens = chunk.usage.prompt_tokens
+                output_tokens = chunk.usage.completion_tokens
+                cache_hit_tokens = getattr(chunk.usage, 'prompt_cache_hit_tokens', 0) or 0
+        logger.debug("DeepSeekPromptTransformer '%s' prompt cache hit: %d of %d input tokens",
+                     self.name, cache_hit_tokens, input_tokens)
         return {
-            'response_text': response.choices[0].message.content,
-            'truncated': response.choices[0].finish_reason == "length",
-            'input_tokens': response.usage.prompt_tokens,
-            'output_tokens': response.usage.completion_tokens,
+            'response_text': "".join(parts),
+            'truncated': finish_reason == "length",
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
         }
@@ -1,15 +1,350 @@
 # src/google/bigquery.py
 
+import asyncio
+import hashlib
+import io
+import json
 import logging
+import re
+import threading
+import time
+import uuid
+import weakref
+import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from open_stage.core.base import DataPackage, Origin, Destination, SingleInputMixin, SingleOutputMixin
+from google.api_core import exceptions as google_exceptions
 from google.cloud import bigquery
 from google.oauth2 import service_account
 from typing import Optional, Dict, List
 
 logger = logging.getLogger(__name__)
 
+# Authenticated clients are shared by every component in the process that
+# uses the same credentials, project and location, so each one does not pay
+# its own token fetch and TLS handshake.
+_CLIENT_LOCK = threading.Lock()
+_SHARED_CLIENTS: List = []
+# Components holding references to the shared clients, reset by close_shared()
+_CLIENT_HOLDERS: "weakref.WeakSet" = weakref.WeakSet()
 
-class GCPBigQueryOrigin(SingleOutputMixin, Origin):
+# Keep-alive connections per shared client: parallel statements, chunked
+# loads and concurrent origins would otherwise overflow requests' default
+# pool of 10 and reconnect
+_HTTP_POOL_SIZE = 32
+
+
+@lru_cache(maxsize=32)
+def _load_credentials(credentials_path: Optional[str]):
+  if credentials_path is None:
+    return None
+  return service_account.Credentials.from_service_account_file(credentials_path)
+
+
+def _pooled_session(credentials):
+  """AuthorizedSession with a connection pool sized for concurrent jobs."""
+  import google.auth
+  import google.auth.credentials
+  import requests
+  from google.auth.transport.requests import AuthorizedSession
+
+  if credentials is None:
+    credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+  else:
+    credentials = google.auth.credentials.with_scopes_if_required(credentials, bigquery.Client.SCOPE)
+  session = AuthorizedSession(credentials)
+  adapter = requests.adapters.HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+  session.mount('https://', adapter)
+  return credentials, session
+
+
+@lru_cache(maxsize=32)
+def _cached_bq_client(credentials_path: Optional[str], project_id: str, location: Optional[str]) -> bigquery.Client:
+  credentials, session = _pooled_session(_load_credentials(credentials_path))
+  client = bigquery.Client(project=project_id, credentials=credentials, location=location, _http=session)
+  if hasattr(client, 'default_job_creation_mode'):
+    # Lets query_and_wait() answer short statements without creating a job
+    client.default_job_creation_mode = 'JOB_CREATION_OPTIONAL'
+  _SHARED_CLIENTS.append(client)
+  return client
+
+
+@lru_cache(maxsize=32)
+def _cached_bqstorage_client(credentials_path: Optional[str]):
+  from google.cloud import bigquery_storage
+  client = bigquery_storage.BigQueryReadClient(credentials=_load_credentials(credentials_path))
+  _SHARED_CLIENTS.append(client)
+  return client
+
+
+@lru_cache(maxsize=32)
+def _cached_bqwrite_client(credentials_path: Optional[str]):
+  from google.cloud import bigquery_storage_v1
+  client = bigquery_storage_v1.BigQueryWriteClient(credentials=_load_credentials(credentials_path))
+  _SHARED_CLIENTS.append(client)
+  return client
+
+
+# On-demand pricing: USD 6.25 per TiB scanned
+_BYTES_PER_GB = 1 << 30
+_COST_PER_BYTE = 6.25 / (1 << 40)
+
+# Target row group size for Parquet files staged by GCPBigQueryDestination
+_PARQUET_ROW_GROUP_BYTES = 256 << 20
+
+# Zstandard level for Parquet uploads: smaller files than Snappy, still cheap to write
+_ZSTD_LEVEL = 3
+
+# How GCPBigQueryDestination describes a failed sink, checked in order;
+# BadRequest covers schema mismatches and malformed data
+_LOAD_ERROR_REASONS = (
+  (google_exceptions.NotFound, "table/dataset not found"),
+  (google_exceptions.Forbidden, "permission denied"),
+  (google_exceptions.Conflict, "conflicting table or job"),
+  (google_exceptions.BadRequest, "invalid load (schema mismatch or bad data)"),
+)
+
+# Batches buffered ahead of the pipe in GCPBigQueryOrigin batch_mode
+_BATCH_QUEUE_SIZE = 4
+
+# Target Arrow batch size per AppendRowsRequest (the API limit is 10 MB)
+_APPEND_ROWS_BATCH_BYTES = 8 << 20
+
+# A LIMIT keyword outside `--` and `#` comments (ignores identifiers like limit_date)
+_LIMIT_RE = re.compile(r"^(?:(?!--|#).)*?\blimit\b", re.IGNORECASE | re.MULTILINE)
+
+
+
+def _default_types_mapper():
+  """
+  Arrow-to-pandas dtypes that RowIterator.to_dataframe() uses by default
+  (nullable INT64/BOOL, db-dtypes DATE/TIME), so results converted from
+  Arrow here match the ones it returns.
+  """
+  import db_dtypes
+  import pyarrow as pa
+  return {
+    pa.int64(): pd.Int64Dtype(),
+    pa.bool_(): pd.BooleanDtype(),
+    pa.date32(): db_dtypes.DateDtype(),
+    pa.time64('us'): db_dtypes.TimeDtype(),
+  }.get
+
+
+def _gcs_filesystem(credentials_path: Optional[str]):
+  """pyarrow GCS filesystem authenticated like the BigQuery client."""
+  from pyarrow import fs
+  if not credentials_path:
+    return fs.GcsFileSystem()
+  from google.auth.transport.requests import Request
+  credentials = _load_credentials(credentials_path)
+  if not credentials.valid:
+    credentials.refresh(Request())
+  return fs.GcsFileSystem(access_token=credentials.token, credential_token_expiration=credentials.expiry)
+
+
+def _split_statements(sql: str, keep_comments: bool = True) -> List[str]:
+  """Split a multi-statement SQL string on ';', ignoring ';' inside quotes and comments."""
+  statements, current = [], []
+  i, n = 0, len(sql)
+  while i < n:
+    char = sql[i]
+    if char in ("'", '"', '`'):
+      end = i + 1
+      while end < n and sql[end] != char:
+        end += 2 if sql[end] == '\\' else 1
+      current.append(sql[i:end + 1])
+      i = end + 1
+    elif sql.startswith('--', i) or char == '#':
+      end = sql.find('\n', i)
+      end = n if end == -1 else end
+      if keep_comments:
+        current.append(sql[i:end])
+      i = end
+    elif sql.startswith('/*', i):
+      end = sql.find('*/', i + 2)
+      end = n if end == -1 else end + 2
+      current.append(sql[i:end] if keep_comments else ' ')
+      i = end
+    elif char == ';':
+      statements.append(''.join(current))
+      current = []
+      i += 1
+    else:
+      current.append(char)
+      i += 1
+  statements.append(''.join(current))
+  return [statement.strip() for statement in statements if statement.strip()]
+
+
+def _is_noop_sql(sql: Optional[str]) -> bool:
+  """True when sql holds nothing but whitespace, comments and ';'."""
+  return sql is not None and not _split_statements(sql, keep_comments=False)
+
+
+# Byte estimates of successful dry runs, keyed by a hash of the query and
+# its settings, so re-validating unchanged SQL in the same process is free.
+_DRY_RUN_CACHE: Dict[str, int] = {}
+_DRY_RUN_CACHE_LOCK = threading.Lock()
+
+# Process-wide LRU of query results for origins created with
+# result_cache_size > 0. Entries remember the tables the query read and when
+# it ran, and are discarded once any of those tables is modified.
+_RESULT_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.RLock()
+
+
+def _get_bq_client(credentials_path: Optional[str], project_id: str, location: Optional[str]) -> bigquery.Client:
+  with _CLIENT_LOCK:
+    return _cached_bq_client(credentials_path, project_id, location)
+
+
+def _get_bqstorage_client(credentials_path: Optional[str]):
+  with _CLIENT_LOCK:
+    return _cached_bqstorage_client(credentials_path)
+
+
+def _get_bqwrite_client(credentials_path: Optional[str]):
+  with _CLIENT_LOCK:
+    return _cached_bqwrite_client(credentials_path)
+
+
+class _BQComponentBase:
+  """
+  Client setup and statement execution shared by GCPBigQueryOrigin and
+  GCPBigQueryDestination. Subclasses set name, project_id, credentials_path,
+  location and _log_prefix in __init__.
+  """
+
+  use_legacy_sql = False
+  timeout = None
+  parallel_statements = False
+
+  def _initialize_client(self):
+    try:
+      if self.credentials_path:
+        logger.debug("%s using credentials from: %s", self._log_prefix, self.credentials_path)
+      else:
+        logger.debug("%s using default credentials", self._log_prefix)
+      self.client = _get_bq_client(self.credentials_path, self.project_id, self.location)
+      _CLIENT_HOLDERS.add(self)
+      logger.info("%s BigQuery client initialized (project=%s, location=%s)",
+                  self._log_prefix, self.project_id, self.location)
+    except Exception as e:
+      raise ValueError(f"{self._log_prefix} failed to initialize BigQuery client: {str(e)}")
+
+  def _execute_query(self, sql_query: str, description: str) -> None:
+    if self.parallel_statements:
+      statements = _split_statements(sql_query)
+      if len(statements) > 1:
+        self._execute_parallel(statements, description)
+        return
+    try:
+      logger.info("%s executing %s", self._log_prefix, description)
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query preview: %s", sql_query[:200])
+      job_config = bigquery.QueryJobConfig(use_legacy_sql=self.use_legacy_sql, use_query_cache=True,
+                                           priority=bigquery.QueryPriority.INTERACTIVE)
+      query_and_wait = getattr(self.client, 'query_and_wait', None)
+      if query_and_wait is not None:
+        # jobs.query fast path: returns inline for short statements and
+        # skips the separate job polling round-trips
+        started = time.perf_counter()
+        wait_kwargs = {'wait_timeout': self.timeout} if self.timeout else {}
+        result = query_and_wait(sql_query, job_config=job_config, **wait_kwargs)
+        duration = time.perf_counter() - started
+      else:
+        result = self.client.query(sql_query, job_config=job_config)
+        if self.timeout:
+          result.result(timeout=self.timeout)
+        else:
+          result.result()
+        duration = (result.ended - result.created).total_seconds() if result.ended else None
+      logger.info("%s %s completed%s%s",
+                  self._log_prefix, description, f" in {duration:.2f}s" if duration else "",
+                  " (cache hit, no cost)" if getattr(result, 'cache_hit', False) else "")
+      total_bytes_processed = getattr(result, 'total_bytes_processed', None)
+      if total_bytes_processed and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s bytes processed, %s rows affected",
+                     description,
+                     f"{total_bytes_processed:,}",
+                     getattr(result, 'num_dml_affected_rows', None) or "n/a")
+    except google_exceptions.BadRequest as e:
+      logger.error("%s invalid query in %s: %s", self._log_prefix, description, e)
+      raise
+    except Exception as e:
+      logger.error("%s failed to execute %s: %s", self._log_prefix, description, e)
+      raise
+
+  def _execute_parallel(self, statements: List[str], description: str) -> None:
+    logger.info("%s executing %s as %d parallel statements",
+                self._log_prefix, description, len(statements))
+    job_config = bigquery.QueryJobConfig(use_legacy_sql=self.use_legacy_sql)
+    # client.query() returns as soon as the job is created, so every
+    # statement is running server-side before the first result() wait
+    query_jobs = [self.client.query(statement, job_config=job_config) for statement in statements]
+    errors = []
+    for statement, query_job in zip(statements, query_jobs):
+      try:
+        if self.timeout:
+          query_job.result(timeout=self.timeout)
+        else:
+          query_job.result()
+      except Exception as e:
+        logger.error("%s failed to execute %s statement: %s | %s",
+                     self._log_prefix, description, e, statement[:200])
+        errors.append(e)
+    if errors:
+      raise errors[0]
+    duration = None
+    if all(job.created and job.ended for job in query_jobs):
+      duration = (max(job.ended for job in query_jobs) - min(job.created for job in query_jobs)).total_seconds()
+    logger.info("%s %s completed%s",
+                self._log_prefix, description, f" in {duration:.2f}s" if duration else "")
+
+  def _estimate_cost(self, total_bytes_processed: int) -> float:
+    return total_bytes_processed * _COST_PER_BYTE
+
+  @classmethod
+  def warmup(cls, project_id: str, credentials_path: Optional[str] = None, location: Optional[str] = None) -> None:
+    """
+    Create the shared client for these settings and run `SELECT 1`, so the
+    token fetch and connection setup happen before the first pump/sink.
+    """
+    client = _get_bq_client(credentials_path, project_id, location)
+    query_and_wait = getattr(client, 'query_and_wait', None)
+    if query_and_wait is not None:
+      query_and_wait("SELECT 1")
+    else:
+      client.query("SELECT 1").result()
+    logger.info("%s warmed up BigQuery client (project=%s, location=%s)", cls.__name__, project_id, location)
+
+  @classmethod
+  def close_shared(cls) -> None:
+    """Close the BigQuery clients shared by all origins and destinations."""
+    with _CLIENT_LOCK:
+      for client in _SHARED_CLIENTS:
+        close = getattr(client, 'close', None)
+        if close is not None:
+          close()
+      _SHARED_CLIENTS.clear()
+      # Closed transports must not be reused: the next pump/sink fetches
+      # fresh clients through the cache
+      for component in list(_CLIENT_HOLDERS):
+        component.client = None
+        if hasattr(component, 'bqstorage_client'):
+          component.bqstorage_client = None
+      _CLIENT_HOLDERS.clear()
+      _cached_bq_client.cache_clear()
+      _cached_bqstorage_client.cache_clear()
+      _cached_bqwrite_client.cache_clear()
+      _load_credentials.cache_clear()
+
+
+class GCPBigQueryOrigin(_BQComponentBase, SingleOutputMixin, Origin):
   """
   GCPBigQueryOrigin - Enhanced BigQuery Data Source
   ==================================================
@@ -29,6 +364,9 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
   table : str, optional
     Table reference in format 'dataset.table' or 'project.dataset.table'
     (required if query is not provided)
+  columns : list, optional
+    Columns to read when using 'table' (default: all columns). Only the
+    listed columns are scanned and billed.
   credentials_path : str, optional
     Path to service account JSON file (uses default credentials if None)
   before_query : str, optional
@@ -51,6 +389,42 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
     Use cached results if available
   dry_run : bool, default=False
     Validate query and estimate cost without executing
+  use_bqstorage_api : bool, default=True
+    Download results through the BigQuery Storage Read API (Arrow streams)
+    instead of paginated REST calls. Falls back to REST if
+    google-cloud-bigquery-storage is not installed.
+  parallel_statements : bool, default=False
+    Split before_query/after_query on ';' and run the statements as
+    concurrent jobs. Only for statements that do not depend on each other.
+  max_stream_count : int, optional
+    Maximum number of parallel Storage API streams used to download the
+    result (requires google-cloud-bigquery>=3.27). Lower it to bound memory
+    on wide results; None lets BigQuery choose.
+  batch_mode : bool, default=False
+    Send the result downstream one page/stream block at a time instead of
+    as a single DataFrame. Downstream components receive several flow()
+    calls; after_query runs once all batches have been sent.
+  page_size : int, optional
+    Rows per page when batches come from the REST API (batch_mode only)
+  result_cache_size : int, default=0
+    Keep up to this many results in an in-process cache and reuse them on
+    later pumps of the same query while its source tables are unmodified.
+    0 disables the cache. Ignored with before_query, after_query, dry_run
+    or batch_mode.
+  fused_script : bool, default=False
+    Submit before_query, the main query and after_query as one BigQuery
+    script (one job instead of three). Requires standard SQL and cannot be
+    combined with batch_mode.
+  dtype_backend : str, default='numpy'
+    'numpy' for regular pandas columns, or 'pyarrow' to keep the downloaded
+    Arrow buffers as ArrowDtype columns (no copy into NumPy, lower peak
+    memory). Requires pandas>=2.0.
+  export_to_gcs : str, optional
+    GCS URI prefix (e.g. 'gs://bucket/tmp/etl'). When set, the query result
+    is exported as Snappy Parquet under '<prefix>/<job_id>/' and read back
+    in parallel with pyarrow, which is faster than the Storage API for
+    multi-GB results. The exported files are deleted afterwards. Cannot be
+    combined with fused_script.
   """
 
   def __init__(
@@ -63,16 +437,27 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
     before_query: Optional[str] = None,
     after_query: Optional[str] = None,
     max_results: Optional[int] = None,
+    columns: Optional[List[str]] = None,
     use_legacy_sql: bool = False,
     query_parameters: Optional[List] = None,
     location: Optional[str] = None,
     job_labels: Optional[Dict[str, str]] = None,
     timeout: Optional[float] = None,
     use_query_cache: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    use_bqstorage_api: bool = True,
+    parallel_statements: bool = False,
+    max_stream_count: Optional[int] = None,
+    batch_mode: bool = False,
+    page_size: Optional[int] = None,
+    result_cache_size: int = 0,
+    fused_script: bool = False,
+    dtype_backend: str = 'numpy',
+    export_to_gcs: Optional[str] = None
   ):
     super().__init__()
     self.name = name
+    self._log_prefix = f"GCPBigQueryOrigin '{name}'"
     self.project_id = project_id
     self.query = query
     self.table = table
@@ -80,6 +465,7 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
     self.before_query = before_query
     self.after_query = after_query
     self.max_results = max_results
+    self.columns = columns
     self.use_legacy_sql = use_legacy_sql
     self.query_parameters = query_parameters or []
     self.location = location
@@ -87,7 +473,18 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
     self.timeout = timeout
     self.use_query_cache = use_query_cache
     self.dry_run = dry_run
+    self.use_bqstorage_api = use_bqstorage_api
+    self.parallel_statements = parallel_statements
+    self.max_stream_count = max_stream_count
+    self.batch_mode = batch_mode
+    self.page_size = page_size
+    self.result_cache_size = result_cache_size
+    self.fused_script = fused_script
+    self.dtype_backend = dtype_backend
+    self.export_to_gcs = export_to_gcs
     self.client = None
+    self.bqstorage_client = None
+    self._bqstorage_init = None
 
     if not project_id or not project_id.strip():
       raise ValueError(f"GCPBigQueryOrigin '{self.name}': project_id cannot be empty")
@@ -103,68 +500,108 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
       raise ValueError(f"GCPBigQueryOrigin '{self.name}': before_query cannot be empty string")
     if after_query is not None and not after_query.strip():
       raise ValueError(f"GCPBigQueryOrigin '{self.name}': after_query cannot be empty string")
+    # Comment-only hooks are dropped here so pump() skips their round trip
+    if _is_noop_sql(before_query):
+      self.before_query = None
+    if _is_noop_sql(after_query):
+      self.after_query = None
     if max_results is not None and max_results <= 0:
       raise ValueError(f"GCPBigQueryOrigin '{self.name}': max_results must be positive, got {max_results}")
+    if columns is not None:
+      if not table:
+        raise ValueError(f"GCPBigQueryOrigin '{self.name}': columns can only be used with 'table'")
+      if len(columns) == 0:
+        raise ValueError(f"GCPBigQueryOrigin '{self.name}': columns cannot be empty")
+      invalid = [c for c in columns if not c or not c.strip() or '`' in c]
+      if invalid:
+        raise ValueError(f"GCPBigQueryOrigin '{self.name}': invalid column names {invalid}")
     if timeout is not None and timeout <= 0:
       raise ValueError(f"GCPBigQueryOrigin '{self.name}': timeout must be positive, got {timeout}")
+    if max_stream_count is not None and max_stream_count <= 0:
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': max_stream_count must be positive, got {max_stream_count}")
+    if page_size is not None and page_size <= 0:
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': page_size must be positive, got {page_size}")
+    if result_cache_size < 0:
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': result_cache_size must be >= 0, got {result_cache_size}")
+    if fused_script and use_legacy_sql:
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': fused_script requires standard SQL (use_legacy_sql=False)")
+    if fused_script and batch_mode:
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': fused_script cannot be combined with batch_mode")
+    if export_to_gcs is not None and not export_to_gcs.startswith('gs://'):
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': export_to_gcs must be a 'gs://' URI, got '{export_to_gcs}'")
+    if export_to_gcs and fused_script:
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': export_to_gcs cannot be combined with fused_script")
+    valid_dtype_backends = ['numpy', 'pyarrow']
+    if dtype_backend not in valid_dtype_backends:
+      raise ValueError(f"GCPBigQueryOrigin '{self.name}': dtype_backend must be one of {valid_dtype_backends}, got '{dtype_backend}'")
 
-  def _initialize_client(self):
-    try:
-      if self.credentials_path:
-        logger.debug("GCPBigQueryOrigin '%s' using credentials from: %s", self.name, self.credentials_path)
-        credentials = service_account.Credentials.from_service_account_file(self.credentials_path)
-        self.client = bigquery.Client(project=self.project_id, credentials=credentials, location=self.location)
+    # table, columns and max_results are fixed for the component's lifetime,
+    # so the main query text is built once here instead of on every pump
+    if table:
+      parts = table.split('.')
+      if '`' in table or not all(part.strip() for part in parts):
+        raise ValueError(f"GCPBigQueryOrigin '{self.name}': invalid table format '{table}'")
+      if len(parts) == 2:
+        self._table_ref = f"`{project_id}.{table}`"
+      elif len(parts) == 3:
+        self._table_ref = f"`{table}`"
       else:
-        logger.debug("GCPBigQueryOrigin '%s' using default credentials", self.name)
-        self.client = bigquery.Client(project=self.project_id, location=self.location)
-      logger.info("GCPBigQueryOrigin '%s' BigQuery client initialized (project=%s, location=%s)",
-                  self.name, self.project_id, self.location)
-    except Exception as e:
-      raise ValueError(f"GCPBigQueryOrigin '{self.name}' failed to initialize BigQuery client: {str(e)}")
+        raise ValueError(f"GCPBigQueryOrigin '{self.name}': invalid table format '{table}'")
+      projection = ", ".join(f"`{c}`" for c in columns) if columns else "*"
+      self._base_query = f"SELECT {projection} FROM {self._table_ref}"
+      self._limit_suffix = f" LIMIT {max_results}" if max_results else ""
+    else:
+      self._table_ref = None
+      self._base_query = self._normalize_query(query) if use_query_cache else query
+      # On its own line so a trailing `--` comment cannot swallow it
+      self._limit_suffix = (f"\nLIMIT {max_results}"
+                            if max_results and not _LIMIT_RE.search(self._base_query) else "")
+    self._query_details = "".join((f"project={project_id}",
+                                   f", table={table}" if table else "",
+                                   f", max_results={max_results}" if max_results else ""))
 
-  def _execute_query(self, sql_query: str, description: str) -> None:
+  def _initialize_client(self):
+    super()._initialize_client()
+    if self.use_bqstorage_api:
+      # Creating the gRPC Storage client overlaps with the query running in
+      # BigQuery; downloads wait for it in _await_bqstorage_client()
+      self._bqstorage_init = threading.Thread(target=self._initialize_bqstorage_client,
+                                              name=f"bqstorage-init-{self.name}", daemon=True)
+      self._bqstorage_init.start()
+
+  def _await_bqstorage_client(self) -> None:
+    if self._bqstorage_init is not None:
+      self._bqstorage_init.join()
+      self._bqstorage_init = None
+
+  def _initialize_bqstorage_client(self) -> None:
     try:
-      logger.info("GCPBigQueryOrigin '%s' executing %s", self.name, description)
-      logger.debug("Query preview: %s", sql_query[:200])
-      job_config = bigquery.QueryJobConfig(use_legacy_sql=self.use_legacy_sql)
-      query_job = self.client.query(sql_query, job_config=job_config)
-      if self.timeout:
-        query_job.result(timeout=self.timeout)
-      else:
-        query_job.result()
-      duration = (query_job.ended - query_job.created).total_seconds() if query_job.ended else None
-      logger.info("GCPBigQueryOrigin '%s' %s completed%s",
-                  self.name, description, f" in {duration:.2f}s" if duration else "")
-      if query_job.total_bytes_processed:
-        logger.debug("%s: %s bytes processed, %s rows affected",
-                     description,
-                     f"{query_job.total_bytes_processed:,}",
-                     query_job.num_dml_affected_rows if hasattr(query_job, 'num_dml_affected_rows') else "n/a")
-    except bigquery.exceptions.BadRequest as e:
-      logger.error("GCPBigQueryOrigin '%s' invalid query in %s: %s", self.name, description, e)
-      raise
+      self.bqstorage_client = _get_bqstorage_client(self.credentials_path)
+      logger.debug("GCPBigQueryOrigin '%s' BigQuery Storage client initialized", self.name)
+    except ImportError:
+      logger.warning("GCPBigQueryOrigin '%s' google-cloud-bigquery-storage not installed, "
+                     "downloading results through the REST API", self.name)
     except Exception as e:
-      logger.error("GCPBigQueryOrigin '%s' failed to execute %s: %s", self.name, description, e)
-      raise
+      logger.warning("GCPBigQueryOrigin '%s' failed to initialize BigQuery Storage client, "
+                     "downloading results through the REST API: %s", self.name, e)
 
   def _build_query(self) -> str:
-    if self.table:
-      parts = self.table.split('.')
-      if len(parts) == 2:
-        table_ref = f"`{self.project_id}.{self.table}`"
-      elif len(parts) == 3:
-        table_ref = f"`{self.table}`"
-      else:
-        raise ValueError(f"GCPBigQueryOrigin '{self.name}': invalid table format '{self.table}'")
-      query = f"SELECT * FROM {table_ref}"
-      if self.max_results:
-        query += f" LIMIT {self.max_results}"
-      return query
-    else:
-      query = self.query
-      if self.max_results and 'LIMIT' not in query.upper():
-        query += f" LIMIT {self.max_results}"
-      return query
+    return self._base_query + self._limit_suffix
+
+  @staticmethod
+  def _normalize_query(query: str) -> str:
+    # BigQuery's result cache only hits on identical query text, so
+    # indentation and blank-line edits should not produce a new query.
+    # Whitespace inside a line is kept (string literals, `--` comments);
+    # triple-quoted literals can span lines, so those queries are left as-is.
+    if '"""' in query or "'''" in query:
+      return query.strip()
+    return "\n".join(line.strip() for line in query.splitlines() if line.strip())
+
+  @property
+  def _query_text_cache_key(self) -> tuple:
+    """Identity of the main query: normalized SQL text plus its parameters."""
+    return (self._build_query(), tuple(repr(p) for p in self.query_parameters))
 
   def _create_job_config(self) -> bigquery.QueryJobConfig:
     job_config = bigquery.QueryJobConfig()
@@ -174,70 +611,319 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
     if self.job_labels:
       job_config.labels = self.job_labels
     job_config.use_query_cache = self.use_query_cache
+    job_config.priority = bigquery.QueryPriority.INTERACTIVE
     if self.dry_run:
       job_config.dry_run = True
     return job_config
 
-  def _estimate_cost(self, total_bytes_processed: int) -> float:
-    return (total_bytes_processed / 1024 ** 4) * 6.25
+  def _download_dataframe(self, job_result) -> pd.DataFrame:
+    self._await_bqstorage_client()
+    logger.debug("GCPBigQueryOrigin '%s' downloading results via %s", self.name,
+                 "BigQuery Storage Read API" if self.bqstorage_client is not None else "REST API")
+    arrow_dtypes = self.dtype_backend == 'pyarrow'
+    use_stream_cap = self.max_stream_count is not None and self.bqstorage_client is not None
+    if not arrow_dtypes and not use_stream_cap:
+      return job_result.to_dataframe(bqstorage_client=self.bqstorage_client, create_bqstorage_client=False)
+
+    import pyarrow as pa
+    if use_stream_cap:
+      batches = list(job_result.to_arrow_iterable(bqstorage_client=self.bqstorage_client,
+                                                  max_stream_count=self.max_stream_count))
+      logger.debug("GCPBigQueryOrigin '%s' downloaded %d Arrow batches (max_stream_count=%d)",
+                   self.name, len(batches), self.max_stream_count)
+      if not batches:
+        return pd.DataFrame(columns=[field.name for field in job_result.schema])
+      table = pa.Table.from_batches(batches)
+    else:
+      table = job_result.to_arrow(bqstorage_client=self.bqstorage_client, create_bqstorage_client=False)
+    # self_destruct frees each Arrow column as soon as it is converted;
+    # ArrowDtype keeps the Arrow buffers instead of copying into NumPy blocks
+    table_df = table.to_pandas(split_blocks=True, self_destruct=True, use_threads=True,
+                               types_mapper=pd.ArrowDtype if arrow_dtypes else _default_types_mapper())
+    # self_destruct leaves the table unusable; drop the reference right away
+    del table
+    return table_df
+
+  def _flow_batches(self, query_job, job_result) -> None:
+    output_pipe = self._output_pipe
+    if output_pipe is None:
+      logger.warning("GCPBigQueryOrigin '%s' has no output pipe configured", self.name)
+      return
+
+    self._await_bqstorage_client()
+    iterable_kwargs = {'bqstorage_client': self.bqstorage_client}
+    if self.bqstorage_client is not None:
+      # Bound the batches prefetched from the read streams, so a slow
+      # downstream stage holds back the download instead of buffering it
+      iterable_kwargs['max_queue_size'] = _BATCH_QUEUE_SIZE
+      if self.max_stream_count is not None:
+        iterable_kwargs['max_stream_count'] = self.max_stream_count
+
+    total_rows = 0
+    batches = 0
+    if self.dtype_backend == 'pyarrow':
+      frames = (batch.to_pandas(types_mapper=pd.ArrowDtype)
+                for batch in job_result.to_arrow_iterable(**iterable_kwargs))
+    else:
+      frames = job_result.to_dataframe_iterable(**iterable_kwargs)
+    for df in frames:
+      output_pipe.flow(df)
+      total_rows += len(df)
+      batches += 1
+      logger.debug("GCPBigQueryOrigin '%s' pumped batch %d (%d rows) through pipe '%s'",
+                   self.name, batches, len(df), output_pipe.get_name())
+
+    duration = (query_job.ended - query_job.created).total_seconds() if query_job.ended else None
+    cost_info = ("cache hit (no cost)" if query_job.cache_hit
+                 else f"~${self._estimate_cost(query_job.total_bytes_billed or 0):.6f} USD")
+    logger.info("GCPBigQueryOrigin '%s' query returned %d rows in %d batches%s | %s",
+                self.name, total_rows, batches, f" in {duration:.2f}s" if duration else "", cost_info)
+
+  def _run_script(self, final_query: str, job_config: bigquery.QueryJobConfig):
+    """
+    Run before_query, the main query and after_query as one script job and
+    return (script_job, main_statement_job).
+    """
+    before = self.before_query.strip().rstrip(';') if self.before_query else None
+    statements = [part for part in (before, final_query.strip().rstrip(';')) if part]
+    # 1-based line where the main statement starts, used to find its child job
+    main_line = before.count('\n') + 2 if before else 1
+    if self.after_query:
+      statements.append(self.after_query.strip().rstrip(';'))
+    script = ";\n".join(statements) + ";"
+
+    logger.info("GCPBigQueryOrigin '%s' executing %d statements as one script", self.name, len(statements))
+    script_job = self.client.query(script, job_config=job_config)
+    if self.timeout:
+      script_job.result(timeout=self.timeout)
+    else:
+      script_job.result()
+
+    for child_job in self.client.list_jobs(parent_job=script_job.job_id):
+      stats = child_job.script_statistics
+      if stats and stats.stack_frames and stats.stack_frames[0].start_line == main_line:
+        return script_job, child_job
+    raise RuntimeError(f"GCPBigQueryOrigin '{self.name}': main query job not found in script {script_job.job_id}")
+
+  def _result_cache_key(self) -> Optional[tuple]:
+    # Runs with side effects or that never materialize a DataFrame are not cached
+    if (self.result_cache_size == 0 or self.before_query or self.after_query
+        or self.dry_run or self.batch_mode or self.export_to_gcs):
+      return None
+    # Download settings are part of the key: they change the dtypes of the
+    # cached frame, and an origin must not receive another one's columns
+    return (self.project_id, self.location, self.use_legacy_sql, self.dtype_backend,
+            self.max_stream_count, self.use_bqstorage_api) + self._query_text_cache_key
+
+  def _get_cached_result(self, key: tuple) -> Optional[pd.DataFrame]:
+    with _RESULT_CACHE_LOCK:
+      entry = _RESULT_CACHE.get(key)
+      if entry is None:
+        return None
+      _RESULT_CACHE.move_to_end(key)
+    for table_ref in entry['tables']:
+      modified = self.client.get_table(table_ref).modified
+      if modified is None or modified > entry['snapshot_time']:
+        logger.debug("GCPBigQueryOrigin '%s' cached result is stale (%s modified)", self.name, table_ref)
+        with _RESULT_CACHE_LOCK:
+          _RESULT_CACHE.pop(key, None)
+        return None
+    return entry['df'].copy()
+
+  def _store_cached_result(self, key: tuple, query_job, df: pd.DataFrame) -> None:
+    tables = list(query_job.referenced_tables or [])
+    if not tables:
+      # Nothing to validate freshness against
+      return
+    with _RESULT_CACHE_LOCK:
+      _RESULT_CACHE[key] = {
+        'df': df.copy(),
+        'tables': tables,
+        'snapshot_time': query_job.created or datetime.now(timezone.utc),
+      }
+      _RESULT_CACHE.move_to_end(key)
+      while len(_RESULT_CACHE) > self.result_cache_size:
+        _RESULT_CACHE.popitem(last=False)
+
+  @staticmethod
+  def clear_result_cache() -> None:
+    """Empty the in-process result cache shared by all GCPBigQueryOrigin instances."""
+    with _RESULT_CACHE_LOCK:
+      _RESULT_CACHE.clear()
+
+  def _log_query_result(self, query_job, df: pd.DataFrame) -> None:
+    duration = (query_job.ended - query_job.created).total_seconds() if query_job.ended else None
+    cache_hit = query_job.cache_hit
+    cost_info = "cache hit (no cost)" if cache_hit else f"~${self._estimate_cost(query_job.total_bytes_billed or 0):.6f} USD"
+    n_rows, n_cols = df.shape
+    logger.info("GCPBigQueryOrigin '%s' query returned %d rows, %d columns%s | %s",
+                self.name, n_rows, n_cols,
+                f" in {duration:.2f}s" if duration else "", cost_info)
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug("Columns: %s | job_id: %s", list(df.columns), query_job.job_id)
+
+  def _flow_result(self, df: pd.DataFrame) -> None:
+    output_pipe = self._output_pipe
+    if output_pipe is not None:
+      output_pipe.flow(df)
+      logger.debug("GCPBigQueryOrigin '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
+    else:
+      logger.warning("GCPBigQueryOrigin '%s' has no output pipe configured", self.name)
+
+  def _flow_gcs_export(self, query_job) -> None:
+    import pyarrow.dataset as ds
+
+    export_uri = f"{self.export_to_gcs.rstrip('/')}/{query_job.job_id}"
+    extract_config = bigquery.ExtractJobConfig(destination_format='PARQUET', compression='SNAPPY')
+    logger.info("GCPBigQueryOrigin '%s' exporting result to %s", self.name, export_uri)
+    extract_job = self.client.extract_table(query_job.destination, f"{export_uri}/part-*.parquet",
+                                            job_config=extract_config)
+    if self.timeout:
+      extract_job.result(timeout=self.timeout)
+    else:
+      extract_job.result()
+
+    filesystem = _gcs_filesystem(self.credentials_path)
+    export_path = export_uri[len('gs://'):]
+    try:
+      dataset = ds.dataset(export_path, format='parquet', filesystem=filesystem)
+      types_mapper = pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+      if self.batch_mode:
+        output_pipe = self._output_pipe
+        if output_pipe is None:
+          logger.warning("GCPBigQueryOrigin '%s' has no output pipe configured", self.name)
+          return
+        total_rows = 0
+        for batch in dataset.to_batches():
+          df = batch.to_pandas(types_mapper=types_mapper)
+          output_pipe.flow(df)
+          total_rows += len(df)
+        logger.info("GCPBigQueryOrigin '%s' streamed %d rows from GCS export", self.name, total_rows)
+      else:
+        df = dataset.to_table().to_pandas(split_blocks=True, self_destruct=True, use_threads=True,
+                                          types_mapper=types_mapper)
+        self._log_query_result(query_job, df)
+        self._flow_result(df)
+    finally:
+      try:
+        filesystem.delete_dir(export_path)
+        logger.debug("GCPBigQueryOrigin '%s' deleted export files at %s", self.name, export_uri)
+      except Exception as e:
+        logger.warning("GCPBigQueryOrigin '%s' failed to delete export files at %s: %s", self.name, export_uri, e)
+
+  def _dry_run(self, final_query: str, job_config: bigquery.QueryJobConfig) -> None:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (self.project_id, str(self.location), str(self.use_legacy_sql), final_query,
+                 *(repr(p) for p in self.query_parameters)):
+      digest.update(part.encode('utf-8'))
+      digest.update(b'\x00')
+    key = digest.hexdigest()
+
+    with _DRY_RUN_CACHE_LOCK:
+      total_bytes_processed = _DRY_RUN_CACHE.get(key)
+    cached = total_bytes_processed is not None
+    if not cached:
+      query_job = self.client.query(final_query, job_config=job_config)
+      total_bytes_processed = query_job.total_bytes_processed
+      with _DRY_RUN_CACHE_LOCK:
+        _DRY_RUN_CACHE[key] = total_bytes_processed
+
+    logger.info("GCPBigQueryOrigin '%s' DRY RUN — query valid, estimated %.2f GB, cost ~$%.6f USD%s",
+                self.name,
+                total_bytes_processed / _BYTES_PER_GB,
+                self._estimate_cost(total_bytes_processed),
+                " (cached)" if cached else "")
+
+  async def pump_async(self) -> None:
+    """
+    Run pump() on the event loop's default executor.
+
+    The query wait and download block a worker thread instead of the loop,
+    so independent origins can run together with asyncio.gather().
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, self.pump)
 
   def pump(self) -> None:
     try:
       if self.client is None:
         self._initialize_client()
 
-      if self.before_query:
+      cache_key = self._result_cache_key()
+      if cache_key is not None:
+        df = self._get_cached_result(cache_key)
+        if df is not None:
+          logger.info("GCPBigQueryOrigin '%s' served %d rows, %d columns from result cache",
+                      self.name, len(df), len(df.columns))
+          self._flow_result(df)
+          return
+
+      use_script = self.fused_script and not self.dry_run and bool(self.before_query or self.after_query)
+
+      if self.before_query and not use_script:
         if self.dry_run:
           logger.warning("GCPBigQueryOrigin '%s' skipping before_query (dry run)", self.name)
         else:
           self._execute_query(self.before_query, "before_query")
 
       final_query = self._build_query()
-      logger.info("GCPBigQueryOrigin '%s' executing main query (project=%s%s%s)",
-                  self.name, self.project_id,
-                  f", table={self.table}" if self.table else "",
-                  f", max_results={self.max_results}" if self.max_results else "")
-      logger.debug("Query: %s", final_query[:200])
+      logger.info("GCPBigQueryOrigin '%s' executing main query (%s)", self.name, self._query_details)
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query: %s", final_query[:200])
 
       job_config = self._create_job_config()
+      if self.dry_run:
+        self._dry_run(final_query, job_config)
+        return
+
+      if use_script:
+        query_job, main_job = self._run_script(final_query, job_config)
+        df = self._download_dataframe(main_job.result())
+        self._log_query_result(query_job, df)
+        self._flow_result(df)
+        return
+
       query_job = self.client.query(final_query, job_config=job_config)
 
-      if self.dry_run:
-        logger.info("GCPBigQueryOrigin '%s' DRY RUN — query valid, estimated %.2f GB, cost ~$%.6f USD",
-                    self.name,
-                    query_job.total_bytes_processed / (1024 ** 3),
-                    self._estimate_cost(query_job.total_bytes_processed))
+      result_kwargs = {}
+      if self.timeout:
+        result_kwargs['timeout'] = self.timeout
+      if self.batch_mode and self.page_size:
+        result_kwargs['page_size'] = self.page_size
+      job_result = query_job.result(**result_kwargs)
+
+      if self.export_to_gcs:
+        self._flow_gcs_export(query_job)
+        if self.after_query:
+          self._execute_query(self.after_query, "after_query")
         return
 
-      job_result = query_job.result(timeout=self.timeout) if self.timeout else query_job.result()
-      df = job_result.to_dataframe()
+      if self.batch_mode:
+        self._flow_batches(query_job, job_result)
+        if self.after_query:
+          self._execute_query(self.after_query, "after_query")
+        return
 
-      duration = (query_job.ended - query_job.created).total_seconds() if query_job.ended else None
-      cache_hit = query_job.cache_hit
-      cost_info = "cache hit (no cost)" if cache_hit else f"~${self._estimate_cost(query_job.total_bytes_billed):.6f} USD"
-      logger.info("GCPBigQueryOrigin '%s' query returned %d rows, %d columns%s | %s",
-                  self.name, len(df), len(df.columns),
-                  f" in {duration:.2f}s" if duration else "", cost_info)
-      logger.debug("Columns: %s | job_id: %s", list(df.columns), query_job.job_id)
+      df = self._download_dataframe(job_result)
+
+      self._log_query_result(query_job, df)
 
       if self.after_query:
         self._execute_query(self.after_query, "after_query")
 
-      if len(self.outputs) > 0:
-        output_pipe = list(self.outputs.values())[0]
-        output_pipe.flow(df)
-        logger.debug("GCPBigQueryOrigin '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
-      else:
-        logger.warning("GCPBigQueryOrigin '%s' has no output pipe configured", self.name)
+      if cache_key is not None:
+        self._store_cached_result(cache_key, query_job, df)
+
+      self._flow_result(df)
 
-    except bigquery.exceptions.BadRequest as e:
+    except google_exceptions.BadRequest as e:
       logger.error("GCPBigQueryOrigin '%s' invalid query: %s", self.name, e)
       raise
-    except bigquery.exceptions.NotFound as e:
+    except google_exceptions.NotFound as e:
       logger.error("GCPBigQueryOrigin '%s' resource not found: %s (project=%s, table=%s)",
                    self.name, e, self.project_id, self.table)
       raise
-    except bigquery.exceptions.Forbidden as e:
+    except google_exceptions.Forbidden as e:
       logger.error("GCPBigQueryOrigin '%s' permission denied: %s", self.name, e)
       raise
     except Exception as e:
@@ -245,7 +931,7 @@ class GCPBigQueryOrigin(SingleOutputMixin, Origin):
       raise
 
 
-class GCPBigQueryDestination(SingleInputMixin, Destination):
+class GCPBigQueryDestination(_BQComponentBase, SingleInputMixin, Destination):
   """
   GCPBigQueryDestination - Enhanced BigQuery Data Sink
   =====================================================
@@ -282,6 +968,45 @@ class GCPBigQueryDestination(SingleInputMixin, Destination):
   job_labels : dict, optional
   max_bad_records : int, default=0
   autodetect : bool, default=True
+  load_via : str, default='dataframe'
+    'dataframe' uploads the DataFrame with load_table_from_dataframe;
+    'parquet' serializes it with pyarrow (parquet_compression, dictionary encoding) and
+    uploads the bytes with load_table_from_file;
+    'storage_write' appends Arrow batches to the table's default stream with
+    the Storage Write API (no load job; the table must exist and
+    write_disposition must be 'WRITE_APPEND');
+    'parquet_gcs' writes it as Parquet under staging_uri and runs a load
+    job from GCS, which is faster for large loads.
+  staging_uri : str, optional
+    GCS prefix for staged Parquet files (required with load_via='parquet_gcs').
+    Staged files are deleted after the load.
+  parallel_statements : bool, default=False
+    Split before_query/after_query into statements and run them as
+    concurrent jobs. Only for statements that do not depend on each other.
+  load_chunk_mb : int, optional
+    Split the DataFrame into chunks of roughly this many MB (in-memory size)
+    and load them concurrently into a staging table in the same dataset,
+    then copy it to the target with write_disposition in one job.
+  max_parallel_loads : int, default=4
+    Maximum concurrent load jobs when load_chunk_mb is set.
+  storage_write_max_rows : int, default=1_000_000
+    With load_via='storage_write', larger DataFrames fall back to a
+    load job, which is cheaper for bulk data.
+  verbose_stats : bool, default=False
+    Fetch the table metadata after each load to log its total rows and
+    size (one extra API call per sink).
+  downcast_numeric : bool, default=False
+    Before uploading, shrink int64 columns to the smallest integer type that
+    holds their values, and float64 columns to float32 when that is exact.
+  categorical_cardinality_ratio : float, optional
+    Upload string columns whose distinct/total ratio is at or below this
+    value as categoricals (dictionary-encoded in Parquet).
+  await_after_query : bool, default=True
+    When False, after_query is submitted as a job and sink returns without
+    waiting for it; its errors are then not raised.
+  parquet_compression : str, default='zstd'
+    Codec for the Parquet written by load_via='parquet'/'parquet_gcs':
+    'zstd' (smallest upload), 'snappy' (fastest to write) or 'gzip'.
   """
 
   def __init__(
@@ -302,10 +1027,22 @@ class GCPBigQueryDestination(SingleInputMixin, Destination):
     location: Optional[str] = None,
     job_labels: Optional[Dict[str, str]] = None,
     max_bad_records: int = 0,
-    autodetect: bool = True
+    autodetect: bool = True,
+    load_via: str = 'dataframe',
+    staging_uri: Optional[str] = None,
+    parallel_statements: bool = False,
+    load_chunk_mb: Optional[int] = None,
+    max_parallel_loads: int = 4,
+    storage_write_max_rows: int = 1_000_000,
+    verbose_stats: bool = False,
+    downcast_numeric: bool = False,
+    categorical_cardinality_ratio: Optional[float] = None,
+    await_after_query: bool = True,
+    parquet_compression: str = 'zstd'
   ):
     super().__init__()
     self.name = name
+    self._log_prefix = f"GCPBigQueryDestination '{name}'"
     self.project_id = project_id
     self.dataset = dataset
     self.table = table
@@ -322,6 +1059,17 @@ class GCPBigQueryDestination(SingleInputMixin, Destination):
     self.job_labels = job_labels or {}
     self.max_bad_records = max_bad_records
     self.autodetect = autodetect
+    self.load_via = load_via
+    self.staging_uri = staging_uri
+    self.parallel_statements = parallel_statements
+    self.load_chunk_mb = load_chunk_mb
+    self.max_parallel_loads = max_parallel_loads
+    self.storage_write_max_rows = storage_write_max_rows
+    self.verbose_stats = verbose_stats
+    self.downcast_numeric = downcast_numeric
+    self.categorical_cardinality_ratio = categorical_cardinality_ratio
+    self.await_after_query = await_after_query
+    self.parquet_compression = parquet_compression
     self.client = None
 
     if not project_id or not project_id.strip():
@@ -340,43 +1088,44 @@ class GCPBigQueryDestination(SingleInputMixin, Destination):
       raise ValueError(f"GCPBigQueryDestination '{self.name}': before_query cannot be empty string")
     if after_query is not None and not after_query.strip():
       raise ValueError(f"GCPBigQueryDestination '{self.name}': after_query cannot be empty string")
+    # Comment-only hooks are dropped here so sink() skips their round trip
+    if _is_noop_sql(before_query):
+      self.before_query = None
+    if _is_noop_sql(after_query):
+      self.after_query = None
     if clustering_fields and len(clustering_fields) > 4:
       raise ValueError(f"GCPBigQueryDestination '{self.name}': clustering_fields cannot exceed 4 fields")
     if max_bad_records < 0:
       raise ValueError(f"GCPBigQueryDestination '{self.name}': max_bad_records must be >= 0")
+    valid_load_via = ['dataframe', 'parquet', 'parquet_gcs', 'storage_write']
+    if load_via not in valid_load_via:
+      raise ValueError(f"GCPBigQueryDestination '{self.name}': load_via must be one of {valid_load_via}")
+    if load_via == 'parquet_gcs' and (not staging_uri or not staging_uri.startswith('gs://')):
+      raise ValueError(f"GCPBigQueryDestination '{self.name}': load_via='parquet_gcs' requires a 'gs://' staging_uri")
+    if load_chunk_mb is not None and load_chunk_mb <= 0:
+      raise ValueError(f"GCPBigQueryDestination '{self.name}': load_chunk_mb must be positive, got {load_chunk_mb}")
+    if max_parallel_loads <= 0:
+      raise ValueError(f"GCPBigQueryDestination '{self.name}': max_parallel_loads must be positive, got {max_parallel_loads}")
+    if load_via == 'storage_write' and write_disposition != 'WRITE_APPEND':
+      raise ValueError(f"GCPBigQueryDestination '{self.name}': load_via='storage_write' requires write_disposition='WRITE_APPEND'")
 
-  def _initialize_client(self):
-    try:
-      if self.credentials_path:
-        logger.debug("GCPBigQueryDestination '%s' using credentials from: %s", self.name, self.credentials_path)
-        credentials = service_account.Credentials.from_service_account_file(self.credentials_path)
-        self.client = bigquery.Client(project=self.project_id, credentials=credentials, location=self.location)
-      else:
-        logger.debug("GCPBigQueryDestination '%s' using default credentials", self.name)
-        self.client = bigquery.Client(project=self.project_id, location=self.location)
-      logger.info("GCPBigQueryDestination '%s' BigQuery client initialized (project=%s, location=%s)",
-                  self.name, self.project_id, self.location)
-    except Exception as e:
-      raise ValueError(f"GCPBigQueryDestination '{self.name}' failed to initialize BigQuery client: {str(e)}")
+    valid_compressions = ['zstd', 'snappy', 'gzip']
+    if parquet_compression not in valid_compressions:
+      raise ValueError(f"GCPBigQueryDestination '{self.name}': parquet_compression must be one of {valid_compressions}")
+    if categorical_cardinality_ratio is not None and not 0 < categorical_cardinality_ratio <= 1:
+      raise ValueError(f"GCPBigQueryDestination '{self.name}': categorical_cardinality_ratio must be in (0, 1], "
+                       f"got {categorical_cardinality_ratio}")
 
-  def _execute_query(self, sql_query: str, description: str) -> None:
-    try:
-      logger.info("GCPBigQueryDestination '%s' executing %s", self.name, description)
-      logger.debug("Query preview: %s", sql_query[:200])
-      job_config = bigquery.QueryJobConfig()
-      query_job = self.client.query(sql_query, job_config=job_config)
-      query_job.result()
-      duration = (query_job.ended - query_job.created).total_seconds() if query_job.ended else None
-      logger.info("GCPBigQueryDestination '%s' %s completed%s",
-                  self.name, description, f" in {duration:.2f}s" if duration else "")
-    except bigquery.exceptions.BadRequest as e:
-      logger.error("GCPBigQueryDestination '%s' invalid query in %s: %s", self.name, description, e)
-      raise
-    except Exception as e:
-      logger.error("GCPBigQueryDestination '%s' failed to execute %s: %s", self.name, description, e)
-      raise
+    self._table_id = f"{project_id}.{dataset}.{table}"
+    self._job_config_template = self._build_job_config_template()
 
   def _create_job_config(self) -> bigquery.LoadJobConfig:
+    # Load paths set source_format/write_disposition on the copy they get.
+    # The template's API dict is the whole config, so copying it is far
+    # cheaper than rebuilding or deep-copying the config object
+    return bigquery.LoadJobConfig.from_api_repr(self._job_config_template.to_api_repr())
+
+  def _build_job_config_template(self) -> bigquery.LoadJobConfig:
     job_config = bigquery.LoadJobConfig()
     job_config.write_disposition = self.write_disposition
     job_config.create_disposition = self.create_disposition
@@ -401,11 +1150,189 @@ class GCPBigQueryDestination(SingleInputMixin, Destination):
     job_config.max_bad_records = self.max_bad_records
     return job_config
 
+  def _write_parquet(self, data, where, **kwargs) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    bytes_per_row = max(1, table.nbytes // max(1, table.num_rows))
+    row_group_size = max(1, _PARQUET_ROW_GROUP_BYTES // bytes_per_row)
+    if self.parquet_compression == 'zstd':
+      kwargs['compression_level'] = _ZSTD_LEVEL
+    pq.write_table(table, where, row_group_size=row_group_size, compression=self.parquet_compression,
+                   use_dictionary=True, **kwargs)
+
+  def _load_via_parquet(self, df: pd.DataFrame, table_id: str, job_config: bigquery.LoadJobConfig):
+    buffer = io.BytesIO()
+    self._write_parquet(df, buffer)
+    logger.debug("GCPBigQueryDestination '%s' serialized %d rows to %d bytes of %s Parquet",
+                 self.name, len(df), buffer.tell(), self.parquet_compression)
+    job_config.source_format = bigquery.SourceFormat.PARQUET
+    job = self.client.load_table_from_file(buffer, table_id, job_config=job_config, rewind=True)
+    del buffer
+    job.result()
+    return job
+
+  def _load_via_parquet_gcs(self, df: pd.DataFrame, table_id: str, job_config: bigquery.LoadJobConfig):
+    staging_uri = f"{self.staging_uri.rstrip('/')}/{self.name}/{uuid.uuid4().hex}.parquet"
+    staging_path = staging_uri[len('gs://'):]
+    filesystem = _gcs_filesystem(self.credentials_path)
+
+    logger.info("GCPBigQueryDestination '%s' staging %d rows as Parquet at %s", self.name, len(df), staging_uri)
+    self._write_parquet(df, staging_path, filesystem=filesystem)
+
+    try:
+      job_config.source_format = bigquery.SourceFormat.PARQUET
+      job = self.client.load_table_from_uri(staging_uri, table_id, job_config=job_config)
+      job.result()
+      return job
+    finally:
+      try:
+        filesystem.delete_file(staging_path)
+        logger.debug("GCPBigQueryDestination '%s' deleted staged file %s", self.name, staging_uri)
+      except Exception as e:
+        logger.warning("GCPBigQueryDestination '%s' failed to delete staged file %s: %s", self.name, staging_uri, e)
+
+  def _shrink_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+    converted = {}
+    if self.downcast_numeric:
+      for column in df.select_dtypes(include=['int64']).columns:
+        converted[column] = pd.to_numeric(df[column], downcast='integer')
+      for column in df.select_dtypes(include=['float64']).columns:
+        as_float32 = df[column].astype('float32')
+        # float32 drops precision for most decimals; only keep it when lossless
+        if as_float32.astype('float64').equals(df[column]):
+          converted[column] = as_float32
+    if self.categorical_cardinality_ratio is not None and len(df) > 0:
+      for column in df.select_dtypes(include=['object', 'string']).columns:
+        if df[column].nunique(dropna=True) / len(df) <= self.categorical_cardinality_ratio:
+          converted[column] = df[column].astype('category')
+    if not converted:
+      return df
+    logger.debug("GCPBigQueryDestination '%s' shrank dtypes of %d columns before upload", self.name, len(converted))
+    # assign() returns a new frame, so the upstream DataFrame is left untouched
+    return df.assign(**converted)
+
+  def _load_via_storage_write(self, df: pd.DataFrame) -> None:
+    import pyarrow as pa
+    from google.cloud.bigquery_storage_v1 import types
+
+    write_client = _get_bqwrite_client(self.credentials_path)
+    stream_name = f"{write_client.table_path(self.project_id, self.dataset, self.table)}/streams/_default"
+    table = df if isinstance(df, pa.Table) else pa.Table.from_pandas(df, preserve_index=False)
+    bytes_per_row = max(1, table.nbytes // max(1, table.num_rows))
+    batches = table.to_batches(max_chunksize=max(1, _APPEND_ROWS_BATCH_BYTES // bytes_per_row))
+
+    def requests():
+      # Only the first request on the connection names the stream and schema
+      yield types.AppendRowsRequest(
+        write_stream=stream_name,
+        arrow_rows=types.AppendRowsRequest.ArrowData(
+          writer_schema=types.ArrowSchema(serialized_schema=table.schema.serialize().to_pybytes()),
+          rows=types.ArrowRecordBatch(serialized_record_batch=batches[0].serialize().to_pybytes()),
+        ),
+      )
+      for batch in batches[1:]:
+        yield types.AppendRowsRequest(arrow_rows=types.AppendRowsRequest.ArrowData(
+          rows=types.ArrowRecordBatch(serialized_record_batch=batch.serialize().to_pybytes())))
+
+    logger.info("GCPBigQueryDestination '%s' appending %d rows via the Storage Write API in %d requests",
+                self.name, len(df), len(batches))
+    # The raw gapic call does not add the routing header that
+    # writer.AppendRowsStream would; the backend rejects the stream without it
+    routing = (("x-goog-request-params", f"write_stream={stream_name}"),)
+    row_errors = []
+    for response in write_client.append_rows(requests(), metadata=routing):
+      if response.error.code:
+        raise RuntimeError(f"Storage Write API append failed: {response.error.message}")
+      row_errors.extend(response.row_errors)
+    if row_errors:
+      for row_error in row_errors[:10]:
+        logger.error("GCPBigQueryDestination '%s' row %d rejected: %s",
+                     self.name, row_error.index, row_error.message)
+      # A request with row errors is rejected as a whole; the other requests
+      # were already committed to the default stream
+      raise RuntimeError(f"Storage Write API rejected {len(row_errors)} rows "
+                         f"(first: row {row_errors[0].index}: {row_errors[0].message})")
+
+  def _load_frame(self, df: pd.DataFrame, table_id: str, job_config: bigquery.LoadJobConfig):
+    if self.load_via == 'parquet_gcs':
+      return self._load_via_parquet_gcs(df, table_id, job_config)
+    if self.load_via == 'parquet':
+      return self._load_via_parquet(df, table_id, job_config)
+    job = self.client.load_table_from_dataframe(df, table_id, job_config=job_config)
+    job.result()
+    return job
+
+  def _load_chunked(self, df: pd.DataFrame, table_id: str) -> list:
+    total_bytes = int(df.memory_usage(deep=True).sum())
+    chunk_rows = max(1, int(len(df) * (self.load_chunk_mb << 20) / max(1, total_bytes)))
+    chunks = [df.iloc[start:start + chunk_rows] for start in range(0, len(df), chunk_rows)] or [df]
+    logger.info("GCPBigQueryDestination '%s' loading in %d chunks of up to %d rows (max_parallel_loads=%d)",
+                self.name, len(chunks), chunk_rows, self.max_parallel_loads)
+    if len(chunks) == 1:
+      return [self._load_frame(chunks[0], table_id, self._create_job_config())]
+
+    # Chunks are appended to a staging table, then one copy job applies
+    # write_disposition to the target: a failed chunk leaves the target as
+    # it was instead of truncated with part of the data
+    staging_id = f"{table_id}_staging_{uuid.uuid4().hex[:12]}"
+
+    def staging_config() -> bigquery.LoadJobConfig:
+      job_config = self._create_job_config()
+      job_config.create_disposition = 'CREATE_IF_NEEDED'
+      # Not accepted when loading a new, non-partition table
+      job_config.schema_update_options = []
+      return job_config
+
+    try:
+      first_config = staging_config()
+      first_config.write_disposition = 'WRITE_TRUNCATE'
+      jobs = [self._load_frame(chunks[0], staging_id, first_config)]
+      # The schema the first chunk created is pinned for the others, so
+      # chunks cannot autodetect conflicting types
+      schema = self.client.get_table(staging_id).schema
+
+      def append_config() -> bigquery.LoadJobConfig:
+        job_config = staging_config()
+        job_config.write_disposition = 'WRITE_APPEND'
+        job_config.schema = schema
+        job_config.autodetect = False
+        return job_config
+
+      with ThreadPoolExecutor(max_workers=self.max_parallel_loads) as executor:
+        futures = [executor.submit(self._load_frame, chunk, staging_id, append_config()) for chunk in chunks[1:]]
+        jobs.extend(future.result() for future in futures)
+
+      copy_config = bigquery.CopyJobConfig(write_disposition=self.write_disposition,
+                                           create_disposition=self.create_disposition)
+      copy_job = self.client.copy_table(staging_id, table_id, job_config=copy_config)
+      copy_job.result()
+      logger.debug("GCPBigQueryDestination '%s' copied staging table %s to %s (job %s)",
+                   self.name, staging_id, table_id, copy_job.job_id)
+      return jobs
+    finally:
+      try:
+        self.client.delete_table(staging_id, not_found_ok=True)
+      except Exception as e:
+        logger.warning("GCPBigQueryDestination '%s' failed to delete staging table %s: %s", self.name, staging_id, e)
+
+  async def sink_async(self, data_package: DataPackage) -> None:
+    """
+    Run sink() on the event loop's default executor, so loads into several
+    destinations can overlap with asyncio.gather().
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, self.sink, data_package)
+
   def sink(self, data_package: DataPackage) -> None:
     logger.debug("GCPBigQueryDestination '%s' received data from pipe '%s'",
                  self.name, data_package.get_pipe_name())
     df = data_package.get_df()
-    table_id = f"{self.project_id}.{self.dataset}.{self.table}"
+    if self.downcast_numeric or self.categorical_cardinality_ratio is not None:
+      df = self._shrink_dtypes(df)
+    table_id = self._table_id
+    n_rows = len(df)
 
     try:
       if self.client is None:
@@ -414,37 +1341,56 @@ class GCPBigQueryDestination(SingleInputMixin, Destination):
       if self.before_query:
         self._execute_query(self.before_query, "before_query")
 
-      logger.info("GCPBigQueryDestination '%s' loading %d rows to %s (disposition=%s)",
-                  self.name, len(df), table_id, self.write_disposition)
-      logger.debug("Columns: %s", list(df.columns))
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("GCPBigQueryDestination '%s' loading %d rows to %s (disposition=%s) | columns: %s",
+                     self.name, n_rows, table_id, self.write_disposition, list(df.columns))
 
-      job_config = self._create_job_config()
-      job = self.client.load_table_from_dataframe(df, table_id, job_config=job_config)
-      job.result()
-
-      table = self.client.get_table(table_id)
-      duration = (job.ended - job.created).total_seconds() if job.ended else None
-      logger.info("GCPBigQueryDestination '%s' load complete: %d rows loaded, %d total in table%s",
-                  self.name, len(df), table.num_rows, f" in {duration:.2f}s" if duration else "")
-      logger.debug("job_id: %s", job.job_id)
+      # Arrow-based load paths reuse the package's Arrow table unless the
+      # DataFrame was rewritten by _shrink_dtypes
+      arrow_ready = df is data_package.get_df()
+      if self.load_via == 'storage_write' and 0 < n_rows <= self.storage_write_max_rows:
+        self._load_via_storage_write(data_package.get_arrow() if arrow_ready else df)
+        jobs = []
+      elif self.load_chunk_mb:
+        jobs = self._load_chunked(df, table_id)
+      elif self.load_via in ('parquet', 'parquet_gcs') and arrow_ready:
+        jobs = [self._load_frame(data_package.get_arrow(), table_id, self._create_job_config())]
+      else:
+        jobs = [self._load_frame(df, table_id, self._create_job_config())]
 
-      if job.errors:
-        for error in job.errors:
-          logger.warning("GCPBigQueryDestination '%s' load warning: %s", self.name, error)
+      duration = None
+      if jobs and all(job.created and job.ended for job in jobs):
+        duration = (max(job.ended for job in jobs) - min(job.created for job in jobs)).total_seconds()
+      # One structured record per load; LoadJob statistics are already
+      # populated once result() returns
+      metrics = {
+        'table': table_id,
+        'load_via': self.load_via,
+        'disposition': self.write_disposition,
+        'rows': sum(job.output_rows or 0 for job in jobs) if jobs else n_rows,
+        'bytes': sum(job.output_bytes or 0 for job in jobs),
+        'duration_s': round(duration, 2) if duration else None,
+        'job_ids': [job.job_id for job in jobs],
+        'errors': [error for job in jobs for error in job.errors or []],
+      }
+      if self.verbose_stats:
+        table = self.client.get_table(table_id)
+        metrics.update(table_rows=table.num_rows, table_bytes=table.num_bytes, clustering=table.clustering_fields)
+      log = logger.warning if metrics['errors'] else logger.info
+      log("GCPBigQueryDestination '%s' load complete: %s", self.name, json.dumps(metrics, default=str))
 
       if self.after_query:
-        self._execute_query(self.after_query, "after_query")
+        if self.await_after_query:
+          self._execute_query(self.after_query, "after_query")
+        else:
+          query_job = self.client.query(self.after_query,
+                                        job_config=bigquery.QueryJobConfig(use_legacy_sql=self.use_legacy_sql))
+          logger.info("GCPBigQueryDestination '%s' submitted after_query as job %s (not waiting)",
+                      self.name, query_job.job_id)
 
     except Exception as e:
-      error_msg = str(e).lower()
-      if "not found" in error_msg:
-        logger.error("GCPBigQueryDestination '%s' table/dataset not found: %s (table=%s)",
-                     self.name, e, table_id)
-      elif "forbidden" in error_msg or "permission" in error_msg:
-        logger.error("GCPBigQueryDestination '%s' permission denied: %s", self.name, e)
-      elif "schema" in error_msg or "field" in error_msg:
-        logger.error("GCPBigQueryDestination '%s' schema mismatch: %s | columns=%s",
-                     self.name, e, list(df.columns))
-      else:
-        logger.error("GCPBigQueryDestination '%s' failed: %s (table=%s)", self.name, e, table_id)
+      reason = next((reason for error_type, reason in _LOAD_ERROR_REASONS if isinstance(e, error_type)), "failed")
+      logger.error("GCPBigQueryDestination '%s' %s: %s (table=%s)", self.name, reason, e, table_id)
+      if isinstance(e, google_exceptions.BadRequest):
+        logger.error("GCPBigQueryDestination '%s' DataFrame columns: %s", self.name, list(df.columns))
       raise
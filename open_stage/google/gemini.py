@@ -1,37 +1,142 @@
 import logging
-import google.generativeai as genai
+import threading
+from typing import Dict, Optional, Tuple
 from open_stage.core.base_ai import BasePromptTransformer
 
 logger = logging.getLogger(__name__)
 
+# genai.configure() is process-wide and drops the SDK's cached gRPC clients,
+# so it only runs when the API key changes; models are shared per
+# (api_key, model, system instruction) so every transformer reuses the same warm channel.
+_CONFIGURED_API_KEY: Optional[str] = None
+_SHARED_MODELS: Dict[Tuple[str, str, str], object] = {}
+_SHARED_MODELS_LOCK = threading.Lock()
+
+
+# Input windows differ per model (1M for Flash, 2M for 1.5 Pro, ...), so each
+# model's limit is read once from its metadata
+_INPUT_TOKEN_LIMITS: Dict[str, Optional[int]] = {}
+_INPUT_TOKEN_LIMITS_LOCK = threading.Lock()
+
+
+def _input_token_limit(model: str) -> Optional[int]:
+    import google.generativeai as genai
+    with _INPUT_TOKEN_LIMITS_LOCK:
+        if model not in _INPUT_TOKEN_LIMITS:
+            try:
+                name = model if model.startswith('models/') else f"models/{model}"
+                _INPUT_TOKEN_LIMITS[model] = genai.get_model(name).input_token_limit
+            except Exception as e:
+                # Without a known limit requests are sent as-is and the API decides
+                logger.debug("Could not read the input token limit of Gemini model '%s': %s", model, e)
+                _INPUT_TOKEN_LIMITS[model] = None
+        return _INPUT_TOKEN_LIMITS[model]
+
 
 class GeminiPromptTransformer(BasePromptTransformer):
 
-    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int = 16000) -> None:
-        super().__init__(name, model, api_key, prompt, max_tokens)
+    # Backoff for rate limits (429) and transient server errors, in seconds
+    _RETRY_INITIAL_DELAY = 1.0
+    _RETRY_MAX_DELAY = 30.0
+
+    _FUSE_SETTINGS = BasePromptTransformer._FUSE_SETTINGS + ('input_token_limit',)
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        api_key: str,
+        prompt: str,
+        max_tokens: int = 16000,
+        *,
+        input_token_limit: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        # chunk_rows, output_format, columns, ... are handled by BasePromptTransformer
+        super().__init__(name, model, api_key, prompt, max_tokens, **kwargs)
+        if input_token_limit is not None and input_token_limit <= 0:
+            raise ValueError(f"GeminiPromptTransformer '{self.name}': input_token_limit must be positive, got {input_token_limit}")
+        self.input_token_limit = input_token_limit
+        # Looked up from the model's metadata in _initialize_client() unless given
+        self._INPUT_TOKEN_LIMIT = input_token_limit
 
     def _initialize_client(self) -> None:
+        # Imported here so that importing this module (or a pipeline that only
+        # conditionally uses Gemini) does not pay for loading the SDK
+        import google.generativeai as genai
+        from google.api_core import exceptions as google_exceptions
+        from google.api_core import retry as google_retry
+        global _CONFIGURED_API_KEY
         try:
-            genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel(
-                model_name=self.model,
-                system_instruction=self._SYSTEM_MESSAGE,
+            with _SHARED_MODELS_LOCK:
+                if _CONFIGURED_API_KEY != self.api_key:
+                    genai.configure(api_key=self.api_key)
+                    _CONFIGURED_API_KEY = self.api_key
+                    _SHARED_MODELS.clear()
+                # The system instruction is fixed per model object, so CSV and
+                # JSON transformers of the same model get separate ones
+                system_instruction = self._JSON_SYSTEM_MESSAGE if self.output_format == 'json' else self._SYSTEM_MESSAGE
+                key = (self.api_key, self.model, system_instruction)
+                if key not in _SHARED_MODELS:
+                    _SHARED_MODELS[key] = genai.GenerativeModel(
+                        model_name=self.model,
+                        system_instruction=system_instruction,
+                    )
+                self.client = _SHARED_MODELS[key]
+            # Constant for the life of the transformer, so built once rather than per request
+            self._generation_config = genai.types.GenerationConfig(
+                max_output_tokens=self.max_tokens,
+                temperature=0.0,
+                top_p=0.95,
+                top_k=40,
+                response_mime_type='application/json' if self.output_format == 'json' else 'text/plain',
             )
+            self._request_options = {
+                'retry': google_retry.Retry(
+                    predicate=google_retry.if_exception_type(
+                        google_exceptions.ResourceExhausted,
+                        google_exceptions.ServiceUnavailable,
+                        google_exceptions.InternalServerError,
+                    ),
+                    initial=self._RETRY_INITIAL_DELAY,
+                    maximum=self._RETRY_MAX_DELAY,
+                ),
+            }
+            if self._INPUT_TOKEN_LIMIT is None:
+                self._INPUT_TOKEN_LIMIT = _input_token_limit(self.model)
             logger.info("GeminiPromptTransformer '%s' client initialized (model=%s)", self.name, self.model)
         except Exception as e:
             raise ValueError(f"GeminiPromptTransformer '{self.name}' failed to initialize client: {str(e)}")
 
+    @classmethod
+    def close_shared(cls) -> None:
+        """Forget the models shared by all GeminiPromptTransformer instances."""
+        global _CONFIGURED_API_KEY
+        with _SHARED_MODELS_LOCK:
+            _SHARED_MODELS.clear()
+            _CONFIGURED_API_KEY = None
+
+    def _count_tokens(self, user_message: str) -> Optional[int]:
+        try:
+            return self.client.count_tokens(user_message).total_tokens
+        except Exception as e:
+            logger.debug("GeminiPromptTransformer '%s' count_tokens failed, using the estimate: %s", self.name, e)
+            return None
+
     def _call_api(self, system_message: str, user_message: str) -> dict:
-        generation_config = genai.types.GenerationConfig(
-            max_output_tokens=self.max_tokens,
-            temperature=0.0,
-            top_p=0.95,
-            top_k=40,
-        )
+        # Streamed so long responses arrive incrementally instead of in one
+        # blocking read; the response aggregates usage and finish reason
         response = self.client.generate_content(
             contents=user_message,
-            generation_config=generation_config,
+            generation_config=self._generation_config,
+            stream=True,
+            request_options=self._request_options,
         )
+        parts = []
+        for chunk in response:
+            # The closing chunk may carry only the finish reason and no text
+            if chunk.parts:
+                parts.append(chunk.text)
 
         try:
             usage = response.usage_metadata
@@ -40,10 +145,22 @@ class GeminiPromptTransformer(BasePromptTransformer):
         except AttributeError:
             input_tokens = 0
             output_tokens = 0
+        else:
+            # Gemini caches repeated prompt prefixes implicitly; the system
+            # instruction and task come before the data so chunks share one
+            cached_tokens = getattr(usage, 'cached_content_token_count', 0) or 0
+            logger.debug("GeminiPromptTransformer '%s' implicit cache hit: %d of %d input tokens",
+                         self.name, cached_tokens, input_tokens)
+
+        # Without this the base class cannot split and retry a chunk that hit
+        # max_output_tokens, and the partial CSV would pass as complete
+        candidates = getattr(response, 'candidates', None)
+        finish_reason = candidates[0].finish_reason if candidates else None
+        truncated = getattr(finish_reason, 'name', finish_reason) == 'MAX_TOKENS'
 
         return {
-            'response_text': response.text,
-            'truncated': False,
+            'response_text': "".join(parts),
+            'truncated': truncated,
             'input_tokens': input_tokens,
             'output_tokens': output_tokens,
         }
@@ -1,14 +1,115 @@
 # src/mysql/common.py
 
+import csv
 import logging
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from sqlalchemy import create_engine, text
 import pandas as pd
 from open_stage.core.base import Origin, Pipe, Destination, DataPackage, SingleInputMixin, SingleOutputMixin
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+from urllib.parse import quote
 import time
 
 logger = logging.getLogger(__name__)
 
+# Engines are shared per connection string, so repeated pump()/sink() calls
+# check out pooled connections instead of reconnecting every time.
+_ENGINES: Dict[str, object] = {}
+_ENGINES_LOCK = threading.Lock()
+
+# Worker pool for destinations created with async_after_query=True, started
+# on first use.
+_AFTER_QUERY_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_AFTER_QUERY_EXECUTOR_LOCK = threading.Lock()
+_AFTER_QUERY_MAX_WORKERS = 4
+
+
+# Whole-word match outside `--` and `#` comments, so columns such as
+# `credit_limit` or a commented-out LIMIT don't count as one
+_LIMIT_RE = re.compile(r'^(?:(?!--|#).)*?\blimit\b', re.IGNORECASE | re.MULTILINE)
+
+_MAX_PLACEHOLDERS = 65535
+_MAX_CHUNK_ROWS = 10_000
+
+# LOAD DATA's default field escaping: a backslash introduces an escape, so
+# backslashes and the tab/newline separators inside values must be escaped
+_LOAD_DATA_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+
+
+# SQLAlchemy dialect for each supported DB-API driver; mysqlclient decodes
+# rows in C, pymysql and mysql-connector in Python
+_DRIVERS = {
+  'pymysql': 'mysql+pymysql',
+  'mysqlclient': 'mysql+mysqldb',
+  'mysqlconnector': 'mysql+mysqlconnector',
+}
+
+
+def _get_engine(connection_string: str):
+  with _ENGINES_LOCK:
+    engine = _ENGINES.get(connection_string)
+    if engine is None:
+      # pre_ping replaces connections the server dropped while they sat idle
+      engine = create_engine(connection_string, pool_pre_ping=True, pool_recycle=3600)
+      _ENGINES[connection_string] = engine
+    return engine
+
+
+@lru_cache(maxsize=256)
+def _text(sql_query: str):
+  # before/after queries and the main query repeat on every run; reusing one
+  # TextClause per string skips re-parsing its bind parameters and keeps the
+  # engine's compiled-statement cache hitting
+  return text(sql_query)
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+  """Shrink int64/float64 columns to the smallest dtype holding their values
+  and turn low-cardinality string columns into categories."""
+  for column in df.select_dtypes(include=['int64']).columns:
+    df[column] = pd.to_numeric(df[column], downcast='integer')
+  for column in df.select_dtypes(include=['float64']).columns:
+    as_float32 = df[column].astype('float32')
+    # float32 drops precision for most decimals; only keep it when lossless
+    if as_float32.astype('float64').equals(df[column]):
+      df[column] = as_float32
+  if len(df) > 0:
+    for column in df.select_dtypes(include=['object', 'string']).columns:
+      if df[column].nunique() / len(df) < 0.5:
+        df[column] = df[column].astype('category')
+  return df
+
+
+def _write_load_data_file(df: pd.DataFrame, handle) -> None:
+  """Write df in LOAD DATA's default text format: tab-separated fields,
+  newline-terminated rows, \\N for NULL and backslash escapes in text."""
+  df = df.copy(deep=False)
+  for column in df.columns:
+    series = df[column]
+    if pd.api.types.is_bool_dtype(series):
+      df[column] = series.astype('Int64')
+    elif not (pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series)):
+      # object, str and category columns alike: every value is written as text
+      df[column] = series.astype(object).where(series.notna(), None).map(
+        lambda value: value if value is None else str(value).translate(_LOAD_DATA_ESCAPES))
+  # Nothing is quoted; the escapes above already cover the separators, so
+  # the quote character is one that escaped text can no longer contain
+  df.to_csv(handle, sep='\t', index=False, header=False, na_rep='\\N',
+            quoting=csv.QUOTE_NONE, quotechar='\0')
+
+
+def dispose_engines() -> None:
+  """Close the pooled connections held by every MySQL component."""
+  with _ENGINES_LOCK:
+    for engine in _ENGINES.values():
+      engine.dispose()
+    _ENGINES.clear()
+
 
 class MySQLOrigin(SingleOutputMixin, Origin):
   """
@@ -36,6 +137,27 @@ class MySQLOrigin(SingleOutputMixin, Origin):
   max_results : int, optional
   timeout : float, optional
   query_parameters : dict, optional
+  use_connectorx : bool, default=False
+    Fetch the main query with ConnectorX (requires the `connectorx` extra).
+    Queries with query_parameters always use pandas.
+  partition_on : str, optional
+    Numeric column to split the ConnectorX read on; requires use_connectorx
+  partition_num : int, optional
+    Number of ranges (and connections) read in parallel with partition_on
+  partition_range : tuple of (int, int), optional
+    (min, max) of partition_on; ConnectorX queries it when omitted
+  dtype_backend : str, optional
+    'pyarrow' for Arrow-backed columns; with use_connectorx the result
+    stays in Arrow buffers end to end (requires pandas>=2.0)
+  stream_chunksize : int, optional
+    Read the result through a server-side cursor and flow it downstream
+    in DataFrames of this many rows instead of one DataFrame
+  auto_downcast : bool, default=False
+    Downcast integer and float columns to the smallest dtype that fits and
+    convert low-cardinality string columns to category after the fetch
+  driver : str, default='pymysql'
+    DB-API driver: 'pymysql', 'mysqlclient' (C extension, faster row
+    decoding) or 'mysqlconnector'
   """
 
   def __init__(
@@ -52,7 +174,15 @@ class MySQLOrigin(SingleOutputMixin, Origin):
     after_query: Optional[str] = None,
     max_results: Optional[int] = None,
     timeout: Optional[float] = None,
-    query_parameters: Optional[Dict] = None
+    query_parameters: Optional[Dict] = None,
+    use_connectorx: bool = False,
+    partition_on: Optional[str] = None,
+    partition_num: Optional[int] = None,
+    partition_range: Optional[Tuple[int, int]] = None,
+    stream_chunksize: Optional[int] = None,
+    dtype_backend: Optional[str] = None,
+    auto_downcast: bool = False,
+    driver: str = 'pymysql'
   ):
     super().__init__()
     self.name = name
@@ -68,6 +198,14 @@ class MySQLOrigin(SingleOutputMixin, Origin):
     self.max_results = max_results
     self.timeout = timeout
     self.query_parameters = query_parameters or {}
+    self.use_connectorx = use_connectorx
+    self.partition_on = partition_on
+    self.partition_num = partition_num
+    self.partition_range = partition_range
+    self.stream_chunksize = stream_chunksize
+    self.dtype_backend = dtype_backend
+    self.auto_downcast = auto_downcast
+    self.driver = driver
     self.engine = None
 
     if not host or not host.strip():
@@ -96,38 +234,101 @@ class MySQLOrigin(SingleOutputMixin, Origin):
       raise ValueError(f"MySQLOrigin '{self.name}': max_results must be positive, got {max_results}")
     if timeout is not None and timeout <= 0:
       raise ValueError(f"MySQLOrigin '{self.name}': timeout must be positive, got {timeout}")
+    valid_drivers = list(_DRIVERS)
+    if driver not in valid_drivers:
+      raise ValueError(f"MySQLOrigin '{self.name}': driver must be one of {valid_drivers}")
+    if partition_on is not None:
+      if not use_connectorx:
+        raise ValueError(f"MySQLOrigin '{self.name}': partition_on requires use_connectorx=True")
+      if not partition_num or partition_num <= 0:
+        raise ValueError(f"MySQLOrigin '{self.name}': partition_num must be positive when partition_on is set, got {partition_num}")
+      if query_parameters:
+        raise ValueError(f"MySQLOrigin '{self.name}': partition_on cannot be combined with query_parameters")
+      if max_results is not None:
+        # Each partition would apply the LIMIT to its own range
+        raise ValueError(f"MySQLOrigin '{self.name}': partition_on cannot be combined with max_results")
+    elif partition_num is not None or partition_range is not None:
+      raise ValueError(f"MySQLOrigin '{self.name}': partition_num and partition_range require partition_on")
+    if stream_chunksize is not None:
+      if stream_chunksize <= 0:
+        raise ValueError(f"MySQLOrigin '{self.name}': stream_chunksize must be positive, got {stream_chunksize}")
+      if use_connectorx:
+        raise ValueError(f"MySQLOrigin '{self.name}': stream_chunksize cannot be combined with use_connectorx")
+    valid_dtype_backends = [None, 'pyarrow']
+    if dtype_backend not in valid_dtype_backends:
+      raise ValueError(f"MySQLOrigin '{self.name}': dtype_backend must be one of {valid_dtype_backends}")
+    if dtype_backend and stream_chunksize is not None:
+      raise ValueError(f"MySQLOrigin '{self.name}': dtype_backend cannot be combined with stream_chunksize")
+    if auto_downcast and dtype_backend:
+      raise ValueError(f"MySQLOrigin '{self.name}': auto_downcast cannot be combined with dtype_backend")
+    if partition_range is not None and (len(partition_range) != 2 or partition_range[0] > partition_range[1]):
+      raise ValueError(f"MySQLOrigin '{self.name}': partition_range must be (min, max) with min <= max, got {partition_range}")
+
+    # Built once here; every engine lookup reuses it
+    self._url = self._create_connection_string()
 
   def _create_connection_string(self):
-    connection_string = f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+    connection_string = f"{_DRIVERS[self.driver]}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
     if self.timeout:
       connection_string += f"?connect_timeout={int(self.timeout)}"
     return connection_string
 
+  def _connectorx_uri(self) -> str:
+    return f"mysql://{quote(self.user, safe='')}:{quote(self.password, safe='')}@{self.host}:{self.port}/{self.database}"
+
+  def _read_connectorx(self, final_query: str):
+    # Rows are decoded in Rust straight into columnar buffers, skipping the
+    # per-row Python objects a DB-API cursor creates
+    import connectorx as cx
+    kwargs = {}
+    if self.partition_on:
+      # N range-sliced queries over N connections, decoded in parallel
+      kwargs = {'partition_on': self.partition_on, 'partition_num': self.partition_num}
+      if self.partition_range is not None:
+        kwargs['partition_range'] = tuple(self.partition_range)
+      logger.info("MySQLOrigin '%s' reading in %d partitions on '%s'",
+                  self.name, self.partition_num, self.partition_on)
+    if self.dtype_backend == 'pyarrow':
+      # The DataFrame wraps the Arrow buffers without copying them, and the
+      # table itself travels with it for Arrow-aware destinations
+      table = cx.read_sql(self._connectorx_uri(), final_query, return_type="arrow", **kwargs)
+      return table.to_pandas(types_mapper=pd.ArrowDtype), table
+    return cx.read_sql(self._connectorx_uri(), final_query, return_type="pandas", **kwargs), None
+
+  def _release_connection(self, connection) -> None:
+    if self.before_query or self.after_query:
+      # Temporary tables and session variables from before/after queries
+      # must not follow the connection back into the shared pool
+      connection.invalidate()
+    connection.close()
+    logger.debug("MySQLOrigin '%s' connection released", self.name)
+
   def _initialize_engine(self):
     try:
-      self.engine = create_engine(self._create_connection_string())
+      self.engine = _get_engine(self._url)
       logger.info("MySQLOrigin '%s' connected to %s@%s:%s/%s",
                   self.name, self.user, self.host, self.port, self.database)
     except Exception as e:
       raise ValueError(f"MySQLOrigin '{self.name}' failed to initialize engine: {str(e)}")
 
-  def _execute_query(self, sql_query: str, description: str) -> None:
+  def _execute_query(self, connection, sql_query: str, description: str) -> None:
     try:
       logger.info("MySQLOrigin '%s' executing %s", self.name, description)
-      logger.debug("Query preview: %s", sql_query[:200])
+      logger.debug("Query preview: %.200s", sql_query)
       start_time = time.time()
-      with self.engine.connect() as connection:
-        result = connection.execute(text(sql_query))
-        connection.commit()
-        duration = time.time() - start_time
-        logger.info("MySQLOrigin '%s' %s completed in %.2fs%s",
-                    self.name, description, duration,
-                    f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
+      result = connection.execute(_text(sql_query))
+      connection.commit()
+      duration = time.time() - start_time
+      logger.info("MySQLOrigin '%s' %s completed in %.2fs%s",
+                  self.name, description, duration,
+                  f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
     except Exception as e:
       logger.error("MySQLOrigin '%s' failed to execute %s: %s", self.name, description, e)
       raise
 
-  def _build_query(self) -> str:
+  def _build_query(self, bind_limit: bool = False) -> Tuple[str, Optional[Dict]]:
+    # With bind_limit the LIMIT is a bound parameter, so every max_results
+    # value shares one statement text and one cached compiled statement
     if self.table:
       parts = self.table.split('.')
       if len(parts) == 1:
@@ -138,47 +339,128 @@ class MySQLOrigin(SingleOutputMixin, Origin):
       else:
         raise ValueError(f"MySQLOrigin '{self.name}': invalid table format '{self.table}'")
       query = f"SELECT * FROM {table_ref}"
-      if self.max_results:
-        query += f" LIMIT {self.max_results}"
-      return query
+      add_limit = bool(self.max_results)
     else:
       query = self.query
-      if self.max_results and 'LIMIT' not in query.upper():
-        query += f" LIMIT {self.max_results}"
-      return query
+      add_limit = bool(self.max_results) and not _LIMIT_RE.search(query)
+
+    params = self.query_parameters
+    if add_limit:
+      # On its own line, so a trailing `--` comment cannot swallow it
+      if bind_limit:
+        query += "\nLIMIT :__limit"
+        params = {**(params or {}), '__limit': int(self.max_results)}
+      else:
+        query += f"\nLIMIT {self.max_results}"
+    return query, params
 
-  def pump(self) -> None:
+  def _fetch(self):
+    # One connection for before_query, the main query and after_query, so
+    # temporary tables and session variables carry over between them
+    connection = self.engine.connect()
     try:
-      if self.engine is None:
-        self._initialize_engine()
-
       if self.before_query:
-        self._execute_query(self.before_query, "before_query")
-
-      final_query = self._build_query()
+        self._execute_query(connection, self.before_query, "before_query")
+
+      use_connectorx = self.use_connectorx and not self.query_parameters
+      if self.use_connectorx and not use_connectorx:
+        logger.debug("MySQLOrigin '%s' using pandas: ConnectorX does not support query_parameters", self.name)
+      # Free-form queries without parameters are sent as plain strings, so
+      # the LIMIT is only bound where the text already goes through text()
+      final_query, params = self._build_query(
+        bind_limit=not use_connectorx and (bool(self.table) or bool(self.query_parameters)))
       logger.info("MySQLOrigin '%s' executing main query (db=%s%s%s)",
                   self.name, self.database,
                   f", table={self.table}" if self.table else "",
                   f", max_results={self.max_results}" if self.max_results else "")
-      logger.debug("Query: %s", final_query[:200])
+      logger.debug("Query: %.200s", final_query)
 
       start_time = time.time()
-      if self.query_parameters:
-        df = pd.read_sql(text(final_query), self.engine, params=self.query_parameters)
+      arrow = None
+      read_kwargs = {'dtype_backend': self.dtype_backend} if self.dtype_backend else {}
+      if use_connectorx:
+        df, arrow = self._read_connectorx(final_query)
+      elif params:
+        df = pd.read_sql(_text(final_query), connection, params=params, **read_kwargs)
       else:
-        df = pd.read_sql(final_query, self.engine)
+        df = pd.read_sql(final_query, connection, **read_kwargs)
       duration = time.time() - start_time
 
+      if self.auto_downcast:
+        before_bytes = df.memory_usage(deep=True).sum()
+        df = _downcast(df)
+        logger.debug("MySQLOrigin '%s' downcast reduced memory from %d to %d bytes",
+                     self.name, before_bytes, df.memory_usage(deep=True).sum())
+
       logger.info("MySQLOrigin '%s' query returned %d rows, %d columns in %.2fs",
                   self.name, len(df), len(df.columns), duration)
-      logger.debug("Columns: %s", list(df.columns))
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Dtypes summary: %s", df.dtypes.astype(str).value_counts().to_dict())
+        logger.debug("Dtypes: %s", df.dtypes.astype(str).to_dict())
 
       if self.after_query:
-        self._execute_query(self.after_query, "after_query")
+        self._execute_query(connection, self.after_query, "after_query")
+      return df, arrow
+    finally:
+      self._release_connection(connection)
+
+  def _stream(self) -> None:
+    # The server-side cursor keeps the connection busy until the last row
+    # is read, so before/after queries share it and run around the stream
+    connection = self.engine.connect()
+    try:
+      if self.before_query:
+        self._execute_query(connection, self.before_query, "before_query")
+
+      final_query, params = self._build_query(bind_limit=True)
+      logger.info("MySQLOrigin '%s' streaming main query in chunks of %d rows (db=%s%s)",
+                  self.name, self.stream_chunksize, self.database,
+                  f", table={self.table}" if self.table else "")
+      logger.debug("Query: %.200s", final_query)
 
-      if len(self.outputs) > 0:
-        output_pipe = list(self.outputs.values())[0]
-        output_pipe.flow(df)
+      start_time = time.time()
+      result = connection.execution_options(stream_results=True).execute(
+        _text(final_query), params)
+      columns = list(result.keys())
+      total_rows = 0
+      chunks = 0
+      while True:
+        rows = result.fetchmany(self.stream_chunksize)
+        if not rows:
+          break
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        if self.auto_downcast:
+          df = _downcast(df)
+        total_rows += len(df)
+        chunks += 1
+        if self._output_pipe is not None:
+          self._output_pipe.flow(df)
+      duration = time.time() - start_time
+
+      logger.info("MySQLOrigin '%s' streamed %d rows in %d chunks in %.2fs",
+                  self.name, total_rows, chunks, duration)
+      if self._output_pipe is None:
+        logger.warning("MySQLOrigin '%s' has no output pipe configured", self.name)
+
+      if self.after_query:
+        self._execute_query(connection, self.after_query, "after_query")
+    finally:
+      self._release_connection(connection)
+
+  def pump(self) -> None:
+    try:
+      if self.engine is None:
+        self._initialize_engine()
+
+      if self.stream_chunksize:
+        self._stream()
+        return
+
+      df, arrow = self._fetch()
+
+      if self._output_pipe is not None:
+        output_pipe = self._output_pipe
+        output_pipe.flow(df, arrow)
         logger.debug("MySQLOrigin '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
       else:
         logger.warning("MySQLOrigin '%s' has no output pipe configured", self.name)
@@ -198,11 +480,6 @@ class MySQLOrigin(SingleOutputMixin, Origin):
         logger.error("MySQLOrigin '%s' failed: %s", self.name, e)
       raise
 
-    finally:
-      if self.engine is not None:
-        self.engine.dispose()
-        logger.debug("MySQLOrigin '%s' connection closed", self.name)
-
 
 class MySQLDestination(SingleInputMixin, Destination):
   """
@@ -227,6 +504,22 @@ class MySQLDestination(SingleInputMixin, Destination):
   before_query : str, optional
   after_query : str, optional
   timeout : float, optional
+  method : str, default='multi'
+    Insert mode passed to DataFrame.to_sql: 'multi' (one multi-row INSERT
+    per chunk) or None (executemany)
+  chunksize : int, optional
+    Rows per INSERT; defaults to what fits MySQL's 65,535 placeholders per
+    statement, capped at 10,000
+  bulk_load : bool, default=False
+    Load through a temporary file with LOAD DATA LOCAL INFILE instead of
+    INSERTs (the server must allow local_infile)
+  fast_load : bool, default=False
+    Turn off unique_checks and foreign_key_checks for the load session
+  driver : str, default='pymysql'
+    DB-API driver: 'pymysql', 'mysqlclient' (C extension) or 'mysqlconnector'
+  async_after_query : bool, default=False
+    Run after_query on a worker thread once the load is committed, so
+    sink() returns without waiting for it; call join() to wait
   """
 
   def __init__(
@@ -241,7 +534,13 @@ class MySQLDestination(SingleInputMixin, Destination):
     if_exists: str = 'append',
     before_query: Optional[str] = None,
     after_query: Optional[str] = None,
-    timeout: Optional[float] = None
+    timeout: Optional[float] = None,
+    method: Optional[str] = 'multi',
+    chunksize: Optional[int] = None,
+    bulk_load: bool = False,
+    fast_load: bool = False,
+    driver: str = 'pymysql',
+    async_after_query: bool = False
   ):
     super().__init__()
     self.name = name
@@ -255,7 +554,14 @@ class MySQLDestination(SingleInputMixin, Destination):
     self.before_query = before_query
     self.after_query = after_query
     self.timeout = timeout
+    self.method = method
+    self.chunksize = chunksize
+    self.bulk_load = bulk_load
+    self.fast_load = fast_load
+    self.driver = driver
+    self.async_after_query = async_after_query
     self.engine = None
+    self._pending: Optional[Future] = None
 
     if not host or not host.strip():
       raise ValueError(f"MySQLDestination '{self.name}': host cannot be empty")
@@ -278,66 +584,170 @@ class MySQLDestination(SingleInputMixin, Destination):
       raise ValueError(f"MySQLDestination '{self.name}': after_query cannot be empty string")
     if timeout is not None and timeout <= 0:
       raise ValueError(f"MySQLDestination '{self.name}': timeout must be positive, got {timeout}")
+    valid_drivers = list(_DRIVERS)
+    if driver not in valid_drivers:
+      raise ValueError(f"MySQLDestination '{self.name}': driver must be one of {valid_drivers}")
+    valid_methods = ['multi', None]
+    if method not in valid_methods:
+      raise ValueError(f"MySQLDestination '{self.name}': method must be one of {valid_methods}")
+    if chunksize is not None and chunksize <= 0:
+      raise ValueError(f"MySQLDestination '{self.name}': chunksize must be positive, got {chunksize}")
+    if async_after_query and not after_query:
+      raise ValueError(f"MySQLDestination '{self.name}': async_after_query requires after_query")
+
+    # Built once here; every engine lookup reuses it
+    self._url = self._create_connection_string()
 
   def _create_connection_string(self):
-    connection_string = f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+    connection_string = f"{_DRIVERS[self.driver]}://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+    options = []
     if self.timeout:
-      connection_string += f"?connect_timeout={int(self.timeout)}"
+      options.append(f"connect_timeout={int(self.timeout)}")
+    if self.bulk_load:
+      # mysql-connector names the option differently from the other drivers
+      options.append("allow_local_infile=true" if self.driver == 'mysqlconnector' else "local_infile=1")
+    if options:
+      connection_string += "?" + "&".join(options)
     return connection_string
 
+  def _release_connection(self, connection) -> None:
+    if self.before_query or self.after_query or self.fast_load:
+      # Temporary tables and session variables from before/after queries
+      # (or fast_load) must not follow the connection back into the shared pool
+      connection.invalidate()
+    connection.close()
+    logger.debug("MySQLDestination '%s' connection released", self.name)
+
   def _initialize_engine(self):
     try:
-      self.engine = create_engine(self._create_connection_string())
+      self.engine = _get_engine(self._url)
       logger.info("MySQLDestination '%s' connected to %s@%s:%s/%s",
                   self.name, self.user, self.host, self.port, self.database)
     except Exception as e:
       raise ValueError(f"MySQLDestination '{self.name}' failed to initialize engine: {str(e)}")
 
-  def _execute_query(self, sql_query: str, description: str) -> None:
+  def _execute_query(self, connection, sql_query: str, description: str) -> None:
     try:
       logger.info("MySQLDestination '%s' executing %s", self.name, description)
-      logger.debug("Query preview: %s", sql_query[:200])
+      logger.debug("Query preview: %.200s", sql_query)
       start_time = time.time()
-      with self.engine.connect() as connection:
-        result = connection.execute(text(sql_query))
-        connection.commit()
-        duration = time.time() - start_time
-        logger.info("MySQLDestination '%s' %s completed in %.2fs%s",
-                    self.name, description, duration,
-                    f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
+      result = connection.execute(_text(sql_query))
+      connection.commit()
+      duration = time.time() - start_time
+      logger.info("MySQLDestination '%s' %s completed in %.2fs%s",
+                  self.name, description, duration,
+                  f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
     except Exception as e:
       logger.error("MySQLDestination '%s' failed to execute %s: %s", self.name, description, e)
       raise
 
-  def sink(self, data_package: DataPackage) -> None:
-    logger.debug("MySQLDestination '%s' received data from pipe '%s'",
-                 self.name, data_package.get_pipe_name())
-    df = data_package.get_df()
+  def _chunksize(self, df: pd.DataFrame) -> int:
+    if self.chunksize is not None:
+      return self.chunksize
+    # A multi-row INSERT binds one placeholder per value and MySQL allows
+    # 65,535 per statement
+    return max(1, min(_MAX_CHUNK_ROWS, _MAX_PLACEHOLDERS // max(1, len(df.columns))))
 
+  def _load_data_infile(self, connection, df: pd.DataFrame) -> None:
+    # Let to_sql apply if_exists and create the table from the dtypes, then
+    # hand the rows to the server's bulk loader instead of INSERTs
+    df.head(0).to_sql(name=self.table, con=connection, if_exists=self.if_exists, index=False)
+
+    fd, path = tempfile.mkstemp(suffix='.tsv', prefix='open_stage_')
     try:
-      if self.engine is None:
-        self._initialize_engine()
+      with os.fdopen(fd, 'w', encoding='utf-8', newline='') as handle:
+        _write_load_data_file(df, handle)
+      columns = ", ".join(f"`{column}`" for column in df.columns)
+      line_terminator = '\\r\\n' if os.linesep == '\r\n' else '\\n'
+      connection.execute(
+        _text(f"LOAD DATA LOCAL INFILE :path INTO TABLE `{self.table}` CHARACTER SET utf8mb4 "
+             f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '{line_terminator}' ({columns})"),
+        {'path': path}
+      )
+    finally:
+      os.remove(path)
 
+  def _load(self, df: pd.DataFrame) -> None:
+    # One connection for before_query, the load and after_query, so
+    # temporary tables and session variables carry over between them
+    connection = self.engine.connect()
+    try:
       if self.before_query:
-        self._execute_query(self.before_query, "before_query")
+        self._execute_query(connection, self.before_query, "before_query")
 
       logger.info("MySQLDestination '%s' loading %d rows to %s.%s (if_exists=%s)",
                   self.name, len(df), self.database, self.table, self.if_exists)
-      logger.debug("Columns: %s", list(df.columns))
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Dtypes summary: %s", df.dtypes.astype(str).value_counts().to_dict())
+        logger.debug("Dtypes: %s", df.dtypes.astype(str).to_dict())
 
       start_time = time.time()
-      df.to_sql(
-        name=self.table,
-        con=self.engine,
-        if_exists=self.if_exists,
-        index=False,
-        chunksize=1000
-      )
+      if self.fast_load:
+        # Checked once when the indexes are updated instead of per row
+        connection.execute(_text("SET SESSION unique_checks = 0, foreign_key_checks = 0"))
+      # One transaction for every chunk: to_sql joins the transaction open
+      # on the connection (or opens one) and the commit below ends it
+      if self.bulk_load:
+        self._load_data_infile(connection, df)
+      else:
+        df.to_sql(
+          name=self.table,
+          con=connection,
+          if_exists=self.if_exists,
+          index=False,
+          chunksize=self._chunksize(df),
+          method=self.method
+        )
+      connection.commit()
       duration = time.time() - start_time
       logger.info("MySQLDestination '%s' load complete: %d rows in %.2fs", self.name, len(df), duration)
 
-      if self.after_query:
-        self._execute_query(self.after_query, "after_query")
+      if self.after_query and self.async_after_query:
+        # The load is committed; the worker takes over the connection (and
+        # its session state) and releases it when after_query finishes
+        self._pending = self._after_query_executor().submit(self._run_after_query, connection)
+        connection = None
+      elif self.after_query:
+        self._execute_query(connection, self.after_query, "after_query")
+    finally:
+      if connection is not None:
+        self._release_connection(connection)
+
+  def _run_after_query(self, connection) -> None:
+    try:
+      self._execute_query(connection, self.after_query, "after_query")
+    finally:
+      self._release_connection(connection)
+
+  def join(self, timeout: Optional[float] = None) -> None:
+    """Wait for an after_query started by sink() and re-raise its error, if any."""
+    pending, self._pending = self._pending, None
+    if pending is not None:
+      pending.result(timeout=timeout)
+
+  @staticmethod
+  def _after_query_executor() -> ThreadPoolExecutor:
+    global _AFTER_QUERY_EXECUTOR
+    with _AFTER_QUERY_EXECUTOR_LOCK:
+      if _AFTER_QUERY_EXECUTOR is None:
+        _AFTER_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=_AFTER_QUERY_MAX_WORKERS,
+                                                   thread_name_prefix="open-stage-mysql")
+      return _AFTER_QUERY_EXECUTOR
+
+  def sink(self, data_package: DataPackage) -> None:
+    logger.debug("MySQLDestination '%s' received data from pipe '%s'",
+                 self.name, data_package.get_pipe_name())
+    df = data_package.get_df()
+
+    try:
+      if self.engine is None:
+        self._initialize_engine()
+
+      # One after_query in flight per destination: finish (and surface
+      # errors from) the previous one before loading again
+      self.join()
+
+      self._load(df)
 
     except Exception as e:
       error_msg = str(e).lower()
@@ -357,8 +767,3 @@ class MySQLDestination(SingleInputMixin, Destination):
         logger.error("MySQLDestination '%s' failed: %s (table=%s, shape=%s)",
                      self.name, e, self.table, df.shape)
       raise
-
-    finally:
-      if self.engine is not None:
-        self.engine.dispose()
-        logger.debug("MySQLDestination '%s' connection closed", self.name)
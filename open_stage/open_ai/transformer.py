@@ -7,8 +7,9 @@ logger = logging.getLogger(__name__)
 
 class OpenAIPromptTransformer(BasePromptTransformer):
 
-    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int = 16000) -> None:
-        super().__init__(name, model, api_key, prompt, max_tokens)
+    def __init__(self, name: str, model: str, api_key: str, prompt: str, max_tokens: int = 16000, **kwargs) -> None:
+        # chunk_rows, output_format, columns, ... are handled by BasePromptTransformer
+        super().__init__(name, model, api_key, prompt, max_tokens, **kwargs)
 
     def _initialize_client(self) -> None:
         try:
@@ -18,6 +19,9 @@ class OpenAIPromptTransformer(BasePromptTransformer):
             raise ValueError(f"OpenAIPromptTransformer '{self.name}' failed to initialize client: {str(e)}")
 
     def _call_api(self, system_message: str, user_message: str) -> dict:
+        extra_kwargs = {}
+        if self.output_format == 'json':
+            extra_kwargs['response_format'] = {"type": "json_object"}
         response = self.client.chat.completions.create(
             model=self.model,
             messages=[
@@ -27,6 +31,7 @@ class OpenAIPromptTransformer(BasePromptTransformer):
             max_tokens=self.max_tokens,
             temperature=0.0,
             stream=False,
+            **extra_kwargs,
         )
         return {
             'response_text': response.choices[0].message.content,
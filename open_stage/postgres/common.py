@@ -1,14 +1,65 @@
 # src/postgres/common.py
 
+import asyncio
+import atexit
+import io
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy import create_engine, text
 import pandas as pd
 from open_stage.core.base import Origin, Pipe, Destination, DataPackage, SingleInputMixin, SingleOutputMixin
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
+from urllib.parse import quote
 import time
 
 logger = logging.getLogger(__name__)
 
+# Engines are shared per connection string and timeout, so repeated
+# pump()/sink() calls check out pooled connections instead of reconnecting.
+_ENGINES: Dict[Tuple[str, Optional[int]], object] = {}
+_ENGINES_LOCK = threading.Lock()
+
+# Rows serialized per COPY call, so the CSV buffer stays bounded on large frames
+_COPY_CHUNK_ROWS = 50_000
+
+# Default rows per INSERT statement, lowered for wide rows so one statement
+# stays around _MAX_INSERT_BYTES
+_INSERT_CHUNK_ROWS = 10_000
+_MAX_INSERT_BYTES = 10_000_000
+
+
+
+def _get_engine(connection_string: str, connect_timeout: Optional[int] = None):
+  key = (connection_string, connect_timeout)
+  with _ENGINES_LOCK:
+    engine = _ENGINES.get(key)
+    if engine is None:
+      connect_args = {'connect_timeout': connect_timeout} if connect_timeout else {}
+      # pre_ping replaces connections the server dropped while they sat idle
+      engine = create_engine(connection_string, connect_args=connect_args, pool_size=10, max_overflow=20,
+                             pool_timeout=30, pool_pre_ping=True, pool_recycle=1800)
+      _ENGINES[key] = engine
+    return engine
+
+
+def dispose_engines() -> None:
+  """Close every pooled PostgreSQL connection held by the shared engines."""
+  with _ENGINES_LOCK:
+    for engine in _ENGINES.values():
+      engine.dispose()
+    _ENGINES.clear()
+
+
+# Pooled connections are closed cleanly when the interpreter exits instead
+# of being dropped by the server when the process goes away
+atexit.register(dispose_engines)
+
+
+def _quote_ident(name) -> str:
+  return '"' + str(name).replace('"', '""') + '"'
+
 
 class PostgresOrigin(SingleOutputMixin, Origin):
   """
@@ -40,6 +91,25 @@ class PostgresOrigin(SingleOutputMixin, Origin):
   max_results : int, optional
   timeout : float, optional
   query_parameters : dict, optional
+  use_connectorx : bool, default=False
+    Fetch the main query with ConnectorX over the binary protocol (requires
+    the `connectorx` extra). Queries with query_parameters always use pandas.
+  partition_on : str, optional
+    Integer column to split the read on; the ranges are read in parallel
+    (by ConnectorX with use_connectorx, otherwise by worker threads)
+  partition_num : int, optional
+    Number of ranges (and connections) read in parallel with partition_on
+  partition_range : tuple of (int, int), optional
+    (min, max) of partition_on; queried with MIN/MAX when omitted
+  dtype_backend : str, optional
+    'pyarrow' for Arrow-backed columns (requires pandas>=2.0); ConnectorX
+    and partitioned reads are then assembled as Arrow without copying
+  server_side_transfer : bool, default=False
+    When the output pipe feeds a PostgresDestination in the same database,
+    copy the rows there with one INSERT ... SELECT instead of through pandas
+  stream_chunksize : int, optional
+    Read the result through a server-side cursor and flow it downstream
+    in DataFrames of this many rows instead of one DataFrame
   """
 
   def __init__(
@@ -56,7 +126,14 @@ class PostgresOrigin(SingleOutputMixin, Origin):
     after_query: Optional[str] = None,
     max_results: Optional[int] = None,
     timeout: Optional[float] = None,
-    query_parameters: Optional[Dict] = None
+    query_parameters: Optional[Dict] = None,
+    use_connectorx: bool = False,
+    partition_on: Optional[str] = None,
+    partition_num: Optional[int] = None,
+    partition_range: Optional[Tuple[int, int]] = None,
+    stream_chunksize: Optional[int] = None,
+    dtype_backend: Optional[str] = None,
+    server_side_transfer: bool = False
   ):
     super().__init__()
     self.name = name
@@ -72,6 +149,13 @@ class PostgresOrigin(SingleOutputMixin, Origin):
     self.max_results = max_results
     self.timeout = timeout
     self.query_parameters = query_parameters or {}
+    self.use_connectorx = use_connectorx
+    self.partition_on = partition_on
+    self.partition_num = partition_num
+    self.partition_range = partition_range
+    self.stream_chunksize = stream_chunksize
+    self.dtype_backend = dtype_backend
+    self.server_side_transfer = server_side_transfer
     self.engine = None
 
     if not host or not host.strip():
@@ -100,33 +184,139 @@ class PostgresOrigin(SingleOutputMixin, Origin):
       raise ValueError(f"PostgresOrigin '{self.name}': max_results must be positive, got {max_results}")
     if timeout is not None and timeout <= 0:
       raise ValueError(f"PostgresOrigin '{self.name}': timeout must be positive, got {timeout}")
+    if partition_on is not None:
+      if not partition_num or partition_num <= 0:
+        raise ValueError(f"PostgresOrigin '{self.name}': partition_num must be positive when partition_on is set, got {partition_num}")
+      if query_parameters and use_connectorx:
+        raise ValueError(f"PostgresOrigin '{self.name}': partition_on with use_connectorx cannot be combined with query_parameters")
+      if max_results is not None:
+        # Each partition would apply the LIMIT to its own range
+        raise ValueError(f"PostgresOrigin '{self.name}': partition_on cannot be combined with max_results")
+    elif partition_num is not None or partition_range is not None:
+      raise ValueError(f"PostgresOrigin '{self.name}': partition_num and partition_range require partition_on")
+    if partition_range is not None and (len(partition_range) != 2 or partition_range[0] > partition_range[1]):
+      raise ValueError(f"PostgresOrigin '{self.name}': partition_range must be (min, max) with min <= max, got {partition_range}")
+    if stream_chunksize is not None:
+      if stream_chunksize <= 0:
+        raise ValueError(f"PostgresOrigin '{self.name}': stream_chunksize must be positive, got {stream_chunksize}")
+      if use_connectorx:
+        raise ValueError(f"PostgresOrigin '{self.name}': stream_chunksize cannot be combined with use_connectorx")
+      if partition_on is not None:
+        raise ValueError(f"PostgresOrigin '{self.name}': stream_chunksize cannot be combined with partition_on")
+    valid_dtype_backends = [None, 'pyarrow']
+    if dtype_backend not in valid_dtype_backends:
+      raise ValueError(f"PostgresOrigin '{self.name}': dtype_backend must be one of {valid_dtype_backends}")
+    if dtype_backend and stream_chunksize is not None:
+      raise ValueError(f"PostgresOrigin '{self.name}': dtype_backend cannot be combined with stream_chunksize")
+
+    # Built once here; every engine lookup and ConnectorX read reuses them
+    self._url = self._create_connection_string()
+    self._connectorx_url = self._connectorx_uri()
 
   def _create_connection_string(self):
     return f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+  def _connectorx_uri(self) -> str:
+    return f"postgresql://{quote(self.user, safe='')}:{quote(self.password, safe='')}@{self.host}:{self.port}/{self.database}"
+
+  def _read_connectorx(self, final_query: str):
+    # Rows arrive over the binary protocol and are decoded in Rust straight
+    # into columnar buffers, skipping the per-cell Python objects of psycopg2
+    import connectorx as cx
+    kwargs = {}
+    if self.partition_on:
+      # N range-sliced queries over N connections, decoded in parallel
+      kwargs = {'partition_on': self.partition_on, 'partition_num': self.partition_num}
+      if self.partition_range is not None:
+        kwargs['partition_range'] = tuple(self.partition_range)
+      logger.info("PostgresOrigin '%s' reading in %d partitions on '%s'",
+                  self.name, self.partition_num, self.partition_on)
+    if self.dtype_backend == 'pyarrow':
+      # The partitions come back as record batches of one Arrow table; the
+      # DataFrame wraps its buffers without copying, and the table travels
+      # with it for Arrow-aware destinations
+      table = cx.read_sql(self._connectorx_url, final_query, return_type="arrow", protocol="binary", **kwargs)
+      return table.to_pandas(types_mapper=pd.ArrowDtype), table
+    return cx.read_sql(self._connectorx_url, final_query, return_type="pandas", protocol="binary", **kwargs), None
+
+  def _partition_bounds(self, final_query: str) -> List[Tuple[int, int]]:
+    if self.partition_range is not None:
+      low, high = self.partition_range
+    else:
+      column = _quote_ident(self.partition_on)
+      with self.engine.connect() as connection:
+        low, high = connection.execute(
+          text(f"SELECT MIN({column}), MAX({column}) FROM ({final_query}) AS _bounds"),
+          self.query_parameters).one()
+      if low is None:
+        return []
+    low, high = int(low), int(high)
+    step = max(1, -(-(high - low + 1) // self.partition_num))
+    return [(start, min(start + step, high + 1)) for start in range(low, high + 1, step)]
+
+  def _read_partition(self, final_query: str, condition: str, params: Dict) -> pd.DataFrame:
+    query = f"SELECT * FROM ({final_query}) AS _partition WHERE {condition}"
+    with self.engine.connect() as connection:
+      return pd.read_sql(text(query), connection, params={**self.query_parameters, **params}, **self._read_kwargs())
+
+  def _read_kwargs(self) -> Dict:
+    return {'dtype_backend': self.dtype_backend} if self.dtype_backend else {}
+
+  def _read_partitioned(self, final_query: str):
+    # Each range is a separate query on its own pooled connection; psycopg2
+    # releases the GIL while waiting, so the server scans them in parallel
+    column = _quote_ident(self.partition_on)
+    ranges = self._partition_bounds(final_query)
+    logger.info("PostgresOrigin '%s' reading in %d partitions on '%s'",
+                self.name, len(ranges), self.partition_on)
+    tasks = [(f"{column} >= :__low AND {column} < :__high", {'__low': low, '__high': high})
+             for low, high in ranges]
+    # Rows whose partition value is NULL fall outside every range
+    tasks.append((f"{column} IS NULL", {}))
+    with ThreadPoolExecutor(max_workers=self.partition_num) as executor:
+      frames = list(executor.map(lambda task: self._read_partition(final_query, *task), tasks))
+    if self.dtype_backend != 'pyarrow':
+      return pd.concat(frames, ignore_index=True), None
+
+    # Arrow-backed partitions are chained as chunks of one table instead of
+    # being copied into new contiguous columns, as pd.concat would
+    import pyarrow as pa
+    tables = [pa.Table.from_pandas(frame, preserve_index=False) for frame in frames if len(frame)] or \
+             [pa.Table.from_pandas(frames[0], preserve_index=False)]
+    if int(pa.__version__.split('.')[0]) >= 14:
+      # An all-NULL partition has null-typed columns; widen them to match
+      table = pa.concat_tables(tables, promote_options="permissive")
+    else:
+      table = pa.concat_tables(tables, promote=True)
+    return table.to_pandas(types_mapper=pd.ArrowDtype), table
+
   def _initialize_engine(self):
     try:
-      connect_args = {}
-      if self.timeout:
-        connect_args['connect_timeout'] = int(self.timeout)
-      self.engine = create_engine(self._create_connection_string(), connect_args=connect_args)
+      self.engine = _get_engine(self._url, int(self.timeout) if self.timeout else None)
       logger.info("PostgresOrigin '%s' connected to %s@%s:%s/%s",
                   self.name, self.user, self.host, self.port, self.database)
     except Exception as e:
       raise ValueError(f"PostgresOrigin '{self.name}' failed to initialize engine: {str(e)}")
 
-  def _execute_query(self, sql_query: str, description: str) -> None:
+  def _release_connection(self, connection) -> None:
+    if self.before_query or self.after_query:
+      # Temporary tables and session settings from before/after queries
+      # must not follow the connection back into the shared pool
+      connection.invalidate()
+    connection.close()
+    logger.debug("PostgresOrigin '%s' connection released", self.name)
+
+  def _execute_query(self, connection, sql_query: str, description: str) -> None:
     try:
       logger.info("PostgresOrigin '%s' executing %s", self.name, description)
-      logger.debug("Query preview: %s", sql_query[:200])
+      logger.debug("Query preview: %.200s", sql_query)
       start_time = time.time()
-      with self.engine.connect() as connection:
-        result = connection.execute(text(sql_query))
-        connection.commit()
-        duration = time.time() - start_time
-        logger.info("PostgresOrigin '%s' %s completed in %.2fs%s",
-                    self.name, description, duration,
-                    f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
+      result = connection.execute(text(sql_query))
+      connection.commit()
+      duration = time.time() - start_time
+      logger.info("PostgresOrigin '%s' %s completed in %.2fs%s",
+                  self.name, description, duration,
+                  f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
     except Exception as e:
       logger.error("PostgresOrigin '%s' failed to execute %s: %s", self.name, description, e)
       raise
@@ -151,38 +341,163 @@ class PostgresOrigin(SingleOutputMixin, Origin):
         query += f" LIMIT {self.max_results}"
       return query
 
+  def _stream(self, connection, final_query: str) -> None:
+    # psycopg2 backs stream_results with a named (server-side) cursor, so
+    # only one chunk of rows is held in memory at a time; max_row_buffer lets
+    # SQLAlchemy read ahead a whole chunk per round trip instead of at most
+    # 1,000 rows
+    logger.info("PostgresOrigin '%s' streaming main query in chunks of %d rows (db=%s%s)",
+                self.name, self.stream_chunksize, self.database,
+                f", table={self.table}" if self.table else "")
+    logger.debug("Query: %.200s", final_query)
+
+    # A producer thread fetches and builds the next chunk while this thread
+    # flows the current one downstream; at most two chunks wait in the queue
+    chunk_queue: queue.Queue = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    producer = threading.Thread(target=self._produce_chunks, args=(connection, final_query, chunk_queue, stop),
+                                name=f"{self.name}-prefetch", daemon=True)
+
+    start_time = time.time()
+    total_rows = 0
+    chunks = 0
+    producer.start()
+    try:
+      while True:
+        item = chunk_queue.get()
+        if item is None:
+          break
+        if isinstance(item, BaseException):
+          raise item
+        total_rows += len(item)
+        chunks += 1
+        if self._output_pipe is not None:
+          self._output_pipe.flow(item)
+    finally:
+      stop.set()
+      # Unblock a producer waiting on a full queue
+      while producer.is_alive():
+        try:
+          chunk_queue.get(timeout=0.1)
+        except queue.Empty:
+          pass
+      producer.join()
+    duration = time.time() - start_time
+
+    logger.info("PostgresOrigin '%s' streamed %d rows in %d chunks in %.2fs",
+                self.name, total_rows, chunks, duration)
+    if self._output_pipe is None:
+      logger.warning("PostgresOrigin '%s' has no output pipe configured", self.name)
+
+  def _produce_chunks(self, connection, final_query: str, chunk_queue: queue.Queue,
+                      stop: threading.Event) -> None:
+    # Runs on the prefetch thread: pushes DataFrames, then None when the
+    # result is exhausted, or the exception that ended the fetch. The pump
+    # thread does not touch the connection until this thread is joined.
+    try:
+      # Per statement, so after_query on the same connection runs normally
+      result = connection.execute(
+        text(final_query), self.query_parameters,
+        execution_options={'stream_results': True, 'max_row_buffer': self.stream_chunksize})
+      try:
+        columns = list(result.keys())
+        while not stop.is_set():
+          rows = result.fetchmany(self.stream_chunksize)
+          if not rows:
+            break
+          chunk_queue.put(pd.DataFrame.from_records(rows, columns=columns))
+      finally:
+        result.close()
+      chunk_queue.put(None)
+    except BaseException as e:
+      chunk_queue.put(e)
+
+  def _transfer_destination(self) -> Optional['PostgresDestination']:
+    if not self.server_side_transfer or self._output_pipe is None:
+      return None
+    destination = self._output_pipe.destination
+    if isinstance(destination, PostgresDestination) and \
+        (destination.host, destination.port, destination.database) == (self.host, self.port, self.database):
+      return destination
+    logger.info("PostgresOrigin '%s' server_side_transfer skipped: output is not a PostgresDestination "
+                "in the same database", self.name)
+    return None
+
+  async def pump_async(self) -> None:
+    """
+    Run pump() on the event loop's default executor.
+
+    psycopg2 releases the GIL while it waits on the server, so independent
+    origins can run together with asyncio.gather().
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, self.pump)
+
+  def _read(self, connection):
+    # Returns (df, arrow), or None when the rows were streamed downstream or
+    # transferred server-side
+    final_query = self._build_query()
+    destination = self._transfer_destination()
+    if destination is not None:
+      # The rows never leave the server; the destination runs its own
+      # before/after queries around the INSERT ... SELECT
+      destination._load_from_query(final_query, self.query_parameters)
+      return None
+
+    if self.stream_chunksize:
+      self._stream(connection, final_query)
+      return None
+
+    logger.info("PostgresOrigin '%s' executing main query (db=%s%s%s)",
+                self.name, self.database,
+                f", table={self.table}" if self.table else "",
+                f", max_results={self.max_results}" if self.max_results else "")
+    logger.debug("Query: %.200s", final_query)
+
+    start_time = time.time()
+    arrow = None
+    if self.partition_on and not self.use_connectorx:
+      df, arrow = self._read_partitioned(final_query)
+    elif self.query_parameters:
+      if self.use_connectorx:
+        logger.debug("PostgresOrigin '%s' using pandas: ConnectorX does not support query_parameters", self.name)
+      df = pd.read_sql(text(final_query), connection, params=self.query_parameters, **self._read_kwargs())
+    elif self.use_connectorx:
+      df, arrow = self._read_connectorx(final_query)
+    else:
+      df = pd.read_sql(final_query, connection, **self._read_kwargs())
+    duration = time.time() - start_time
+
+    logger.info("PostgresOrigin '%s' query returned %d rows, %d columns in %.2fs",
+                self.name, len(df), len(df.columns), duration)
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug("Dtypes summary: %s", df.dtypes.astype(str).value_counts().to_dict())
+      logger.debug("Dtypes: %s", df.dtypes.astype(str).to_dict())
+    return df, arrow
+
   def pump(self) -> None:
     try:
       if self.engine is None:
         self._initialize_engine()
 
-      if self.before_query:
-        self._execute_query(self.before_query, "before_query")
-
-      final_query = self._build_query()
-      logger.info("PostgresOrigin '%s' executing main query (db=%s%s%s)",
-                  self.name, self.database,
-                  f", table={self.table}" if self.table else "",
-                  f", max_results={self.max_results}" if self.max_results else "")
-      logger.debug("Query: %s", final_query[:200])
-
-      start_time = time.time()
-      if self.query_parameters:
-        df = pd.read_sql(text(final_query), self.engine, params=self.query_parameters)
-      else:
-        df = pd.read_sql(final_query, self.engine)
-      duration = time.time() - start_time
-
-      logger.info("PostgresOrigin '%s' query returned %d rows, %d columns in %.2fs",
-                  self.name, len(df), len(df.columns), duration)
-      logger.debug("Columns: %s", list(df.columns))
-
-      if self.after_query:
-        self._execute_query(self.after_query, "after_query")
-
-      if len(self.outputs) > 0:
-        output_pipe = list(self.outputs.values())[0]
-        output_pipe.flow(df)
+      # One connection for before_query, the main query and after_query, so
+      # temporary tables and session settings carry over between them
+      connection = self.engine.connect()
+      try:
+        if self.before_query:
+          self._execute_query(connection, self.before_query, "before_query")
+        result = self._read(connection)
+        if self.after_query:
+          self._execute_query(connection, self.after_query, "after_query")
+      finally:
+        self._release_connection(connection)
+
+      if result is None:
+        return
+      df, arrow = result
+      if self._output_pipe is not None:
+        output_pipe = self._output_pipe
+        output_pipe.flow(df, arrow)
         logger.debug("PostgresOrigin '%s' pumped data through pipe '%s'", self.name, output_pipe.get_name())
       else:
         logger.warning("PostgresOrigin '%s' has no output pipe configured", self.name)
@@ -202,10 +517,6 @@ class PostgresOrigin(SingleOutputMixin, Origin):
         logger.error("PostgresOrigin '%s' failed: %s", self.name, e)
       raise
 
-    finally:
-      if self.engine is not None:
-        self.engine.dispose()
-        logger.debug("PostgresOrigin '%s' connection closed", self.name)
 
 
 class PostgresDestination(SingleInputMixin, Destination):
@@ -232,6 +543,20 @@ class PostgresDestination(SingleInputMixin, Destination):
   before_query : str, optional
   after_query : str, optional
   timeout : float, optional
+  load_via : str, default='multi'
+    'multi' uses multi-row INSERT statements through DataFrame.to_sql;
+    'copy' streams the rows with COPY ... FROM STDIN; 'binary_copy' encodes
+    the Arrow table into COPY's binary format with pgpq (requires the
+    `pgpq` extra); 'execute_values' sends INSERT pages through
+    psycopg2.extras.execute_values; 'unnest' sends one array per column
+    to INSERT ... SELECT FROM UNNEST (falling back to 'execute_values' for
+    column types it cannot map)
+  chunksize : int, optional
+    Rows per INSERT with 'execute_values', 'unnest' or 'multi'; defaults to 10,000,
+    fewer for rows wider than 1 KB
+  unlogged_bulk_load : bool, default=False
+    With if_exists='replace' and a COPY load, fill the new table while it is
+    UNLOGGED, then SET LOGGED and ANALYZE it
   """
 
   def __init__(
@@ -247,7 +572,10 @@ class PostgresDestination(SingleInputMixin, Destination):
     if_exists: str = 'append',
     before_query: Optional[str] = None,
     after_query: Optional[str] = None,
-    timeout: Optional[float] = None
+    timeout: Optional[float] = None,
+    load_via: str = 'multi',
+    chunksize: Optional[int] = None,
+    unlogged_bulk_load: bool = False
   ):
     super().__init__()
     self.name = name
@@ -262,6 +590,9 @@ class PostgresDestination(SingleInputMixin, Destination):
     self.before_query = before_query
     self.after_query = after_query
     self.timeout = timeout
+    self.load_via = load_via
+    self.chunksize = chunksize
+    self.unlogged_bulk_load = unlogged_bulk_load
     self.engine = None
 
     if not host or not host.strip():
@@ -287,69 +618,282 @@ class PostgresDestination(SingleInputMixin, Destination):
       raise ValueError(f"PostgresDestination '{self.name}': after_query cannot be empty string")
     if timeout is not None and timeout <= 0:
       raise ValueError(f"PostgresDestination '{self.name}': timeout must be positive, got {timeout}")
+    valid_load_via = ['multi', 'copy', 'binary_copy', 'execute_values', 'unnest']
+    if load_via not in valid_load_via:
+      raise ValueError(f"PostgresDestination '{self.name}': load_via must be one of {valid_load_via}")
+    if chunksize is not None and chunksize <= 0:
+      raise ValueError(f"PostgresDestination '{self.name}': chunksize must be positive, got {chunksize}")
+    if unlogged_bulk_load and (if_exists != 'replace' or load_via not in ('copy', 'binary_copy')):
+      raise ValueError(f"PostgresDestination '{self.name}': unlogged_bulk_load requires if_exists='replace' "
+                       "and load_via='copy' or 'binary_copy'")
+
+    # Built once here; every engine lookup reuses it
+    self._url = self._create_connection_string()
 
   def _create_connection_string(self):
     return f"postgresql+psycopg2://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
   def _initialize_engine(self):
     try:
-      connect_args = {}
-      if self.timeout:
-        connect_args['connect_timeout'] = int(self.timeout)
-      self.engine = create_engine(self._create_connection_string(), connect_args=connect_args)
+      self.engine = _get_engine(self._url, int(self.timeout) if self.timeout else None)
       logger.info("PostgresDestination '%s' connected to %s@%s:%s/%s",
                   self.name, self.user, self.host, self.port, self.database)
     except Exception as e:
       raise ValueError(f"PostgresDestination '{self.name}' failed to initialize engine: {str(e)}")
 
-  def _execute_query(self, sql_query: str, description: str) -> None:
+  def _release_connection(self, connection) -> None:
+    if self.before_query or self.after_query:
+      # Temporary tables and session settings from before/after queries
+      # must not follow the connection back into the shared pool
+      connection.invalidate()
+    connection.close()
+    logger.debug("PostgresDestination '%s' connection released", self.name)
+
+  def _execute_query(self, connection, sql_query: str, description: str) -> None:
     try:
       logger.info("PostgresDestination '%s' executing %s", self.name, description)
-      logger.debug("Query preview: %s", sql_query[:200])
+      logger.debug("Query preview: %.200s", sql_query)
       start_time = time.time()
-      with self.engine.connect() as connection:
-        result = connection.execute(text(sql_query))
-        connection.commit()
-        duration = time.time() - start_time
-        logger.info("PostgresDestination '%s' %s completed in %.2fs%s",
-                    self.name, description, duration,
-                    f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
+      result = connection.execute(text(sql_query))
+      connection.commit()
+      duration = time.time() - start_time
+      logger.info("PostgresDestination '%s' %s completed in %.2fs%s",
+                  self.name, description, duration,
+                  f" ({result.rowcount:,} rows affected)" if result.rowcount >= 0 else "")
     except Exception as e:
       logger.error("PostgresDestination '%s' failed to execute %s: %s", self.name, description, e)
       raise
 
+  def _chunksize(self, df: pd.DataFrame) -> int:
+    if self.chunksize is not None:
+      return self.chunksize
+    # Measured on a sample so string columns count their contents, not just
+    # their object pointers, without walking the whole frame
+    sample = df.head(1000)
+    bytes_per_row = sample.memory_usage(index=False, deep=True).sum() / max(1, len(sample))
+    if bytes_per_row > 1024:
+      return max(1000, int(_MAX_INSERT_BYTES // bytes_per_row))
+    return _INSERT_CHUNK_ROWS
+
+  @staticmethod
+  def _execute_values_insert(pd_table, conn, keys, data_iter) -> None:
+    # to_sql insertion method: psycopg2 packs each chunk into one INSERT
+    # page itself instead of SQLAlchemy binding every row's parameters
+    from psycopg2.extras import execute_values
+    table_ref = _quote_ident(pd_table.name)
+    if pd_table.schema:
+      table_ref = f"{_quote_ident(pd_table.schema)}.{table_ref}"
+    columns = ", ".join(_quote_ident(key) for key in keys)
+    rows = list(data_iter)
+    cursor = conn.connection.cursor()
+    try:
+      execute_values(cursor, f"INSERT INTO {table_ref} ({columns}) VALUES %s", rows, page_size=len(rows) or 1)
+    finally:
+      cursor.close()
+
+  @staticmethod
+  def _unnest_types(df: pd.DataFrame) -> Optional[List[str]]:
+    # Array element types matching the columns to_sql creates, or None when
+    # a column has no safe mapping
+    pg_types = []
+    for column in df.columns:
+      series = df[column]
+      if pd.api.types.is_bool_dtype(series):
+        pg_types.append('boolean')
+      elif pd.api.types.is_integer_dtype(series):
+        pg_types.append('numeric' if str(series.dtype).lower() == 'uint64' else 'bigint')
+      elif pd.api.types.is_float_dtype(series):
+        pg_types.append('double precision')
+      elif isinstance(series.dtype, pd.DatetimeTZDtype):
+        pg_types.append('timestamptz')
+      elif pd.api.types.is_datetime64_dtype(series):
+        pg_types.append('timestamp')
+      elif pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty'):
+        pg_types.append('text')
+      else:
+        return None
+    return pg_types
+
+  def _unnest_insert(self, connection, df: pd.DataFrame, pg_types: List[str]) -> None:
+    # One array parameter per column instead of one parameter per cell;
+    # the server casts each array once and UNNEST zips them back into rows
+    self._create_table(connection, df)
+    columns = ", ".join(_quote_ident(column) for column in df.columns)
+    arrays = ", ".join(f"%s::{pg_type}[]" for pg_type in pg_types)
+    insert_sql = (f"INSERT INTO {_quote_ident(self.schema)}.{_quote_ident(self.table)} ({columns}) "
+                  f"SELECT * FROM UNNEST({arrays})")
+    chunksize = self._chunksize(df)
+    cursor = connection.connection.cursor()
+    try:
+      for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start:start + chunksize]
+        cursor.execute(insert_sql, [
+          chunk[column].astype(object).where(chunk[column].notna(), None).tolist()
+          for column in chunk.columns
+        ])
+    finally:
+      cursor.close()
+
+  def _create_table(self, connection, df: pd.DataFrame) -> None:
+    # Let to_sql apply if_exists and create the table from the dtypes
+    df.head(0).to_sql(name=self.table, con=connection, schema=self.schema, if_exists=self.if_exists, index=False)
+    if self.unlogged_bulk_load:
+      # The table was just recreated in this transaction and is still empty,
+      # so this is free; the COPY then skips writing every row to the WAL
+      connection.execute(text(f"ALTER TABLE {_quote_ident(self.schema)}.{_quote_ident(self.table)} SET UNLOGGED"))
+
+  def _copy_from_stdin(self, connection, df: pd.DataFrame) -> None:
+    # Stream the rows as CSV through COPY instead of INSERT statements
+    self._create_table(connection, df)
+    columns = ", ".join(_quote_ident(column) for column in df.columns)
+    copy_sql = (f"COPY {_quote_ident(self.schema)}.{_quote_ident(self.table)} ({columns}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+    cursor = connection.connection.cursor()
+    try:
+      for start in range(0, len(df), _COPY_CHUNK_ROWS):
+        buffer = io.StringIO()
+        df.iloc[start:start + _COPY_CHUNK_ROWS].to_csv(buffer, index=False, header=False, na_rep='\\N')
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+    finally:
+      cursor.close()
+
+  def _copy_binary(self, connection, df: pd.DataFrame, table) -> None:
+    # Arrow columns are encoded straight into COPY's binary format, with no
+    # per-cell Python objects or CSV text in between
+    from pgpq import ArrowToPostgresBinaryEncoder
+    self._create_table(connection, df)
+    columns = ", ".join(_quote_ident(column) for column in table.column_names)
+    copy_sql = (f"COPY {_quote_ident(self.schema)}.{_quote_ident(self.table)} ({columns}) "
+                "FROM STDIN WITH (FORMAT binary)")
+    cursor = connection.connection.cursor()
+    try:
+      for start in range(0, table.num_rows, _COPY_CHUNK_ROWS):
+        # Each COPY is a complete binary stream: header, rows, trailer
+        encoder = ArrowToPostgresBinaryEncoder(table.schema)
+        buffer = io.BytesIO()
+        buffer.write(encoder.write_header())
+        for batch in table.slice(start, _COPY_CHUNK_ROWS).to_batches():
+          buffer.write(encoder.write_batch(batch))
+        buffer.write(encoder.finish())
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+    finally:
+      cursor.close()
+
+  def _load_from_query(self, query: str, params: Dict) -> None:
+    """Load the result of a query in the same database with INSERT ... SELECT,
+    honoring if_exists like sink() does."""
+    if self.engine is None:
+      self._initialize_engine()
+
+    # before_query, the load and after_query share one connection, as in sink()
+    connection = self.engine.connect()
+    try:
+      if self.before_query:
+        self._execute_query(connection, self.before_query, "before_query")
+
+      target = f"{_quote_ident(self.schema)}.{_quote_ident(self.table)}"
+      logger.info("PostgresDestination '%s' loading server-side into %s.%s (if_exists=%s)",
+                  self.name, self.schema, self.table, self.if_exists)
+      logger.debug("Query: %.200s", query)
+      start_time = time.time()
+      exists = connection.execute(text("SELECT to_regclass(:name)"), {'name': target}).scalar() is not None
+      if exists and self.if_exists == 'replace':
+        connection.execute(text(f"DROP TABLE {target}"))
+        exists = False
+      if not exists or self.if_exists == 'fail':
+        # CREATE fails on an existing table, as to_sql does with 'fail'
+        result = connection.execute(text(f"CREATE TABLE {target} AS {query}"), params)
+      else:
+        # Columns are matched by name, as to_sql does
+        columns = ", ".join(_quote_ident(column) for column in
+                            connection.execute(text(f"SELECT * FROM ({query}) AS _source LIMIT 0"), params).keys())
+        result = connection.execute(
+          text(f"INSERT INTO {target} ({columns}) SELECT {columns} FROM ({query}) AS _source"), params)
+      connection.commit()
+      duration = time.time() - start_time
+      logger.info("PostgresDestination '%s' server-side load complete: %d rows in %.2fs",
+                  self.name, result.rowcount, duration)
+
+      if self.after_query:
+        self._execute_query(connection, self.after_query, "after_query")
+    finally:
+      self._release_connection(connection)
+
+  async def sink_async(self, data_package: DataPackage) -> None:
+    """
+    Run sink() on the event loop's default executor, so loads into several
+    destinations can overlap with asyncio.gather().
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, self.sink, data_package)
+
   def sink(self, data_package: DataPackage) -> None:
     logger.debug("PostgresDestination '%s' received data from pipe '%s'",
                  self.name, data_package.get_pipe_name())
     df = data_package.get_df()
+    row_count = len(df)
     table_ref = f"{self.schema}.{self.table}"
 
     try:
       if self.engine is None:
         self._initialize_engine()
 
-      if self.before_query:
-        self._execute_query(self.before_query, "before_query")
-
-      logger.info("PostgresDestination '%s' loading %d rows to %s (if_exists=%s)",
-                  self.name, len(df), table_ref, self.if_exists)
-      logger.debug("Columns: %s", list(df.columns))
-
-      start_time = time.time()
-      df.to_sql(
-        name=self.table,
-        con=self.engine,
-        schema=self.schema,
-        if_exists=self.if_exists,
-        index=False,
-        chunksize=1000,
-        method='multi'
-      )
-      duration = time.time() - start_time
-      logger.info("PostgresDestination '%s' load complete: %d rows in %.2fs", self.name, len(df), duration)
+      # One connection for before_query, the load and after_query, so
+      # temporary tables and session settings carry over between them
+      connection = self.engine.connect()
+      try:
+        if self.before_query:
+          self._execute_query(connection, self.before_query, "before_query")
+
+        logger.info("PostgresDestination '%s' loading %d rows to %s (if_exists=%s)",
+                    self.name, row_count, table_ref, self.if_exists)
+        if logger.isEnabledFor(logging.DEBUG):
+          logger.debug("Dtypes summary: %s", df.dtypes.astype(str).value_counts().to_dict())
+          logger.debug("Dtypes: %s", df.dtypes.astype(str).to_dict())
+
+        pg_types = self._unnest_types(df) if self.load_via == 'unnest' else None
+        if self.load_via == 'unnest' and pg_types is None:
+          logger.info("PostgresDestination '%s' cannot map every column to an array type for UNNEST, "
+                      "using execute_values", self.name)
+
+        start_time = time.time()
+        # Begun here so to_sql joins this transaction instead of committing
+        # its DROP/CREATE on its own: the table creation and every
+        # COPY/INSERT chunk commit together, and with if_exists='replace' a
+        # failed load leaves the previous table in place
+        with connection.begin():
+          if self.load_via == 'copy':
+            self._copy_from_stdin(connection, df)
+          elif self.load_via == 'binary_copy':
+            # Reuses the Arrow table an upstream Arrow reader already built
+            self._copy_binary(connection, df, data_package.get_arrow())
+          elif self.load_via == 'unnest' and pg_types is not None:
+            self._unnest_insert(connection, df, pg_types)
+          else:
+            df.to_sql(
+              name=self.table,
+              con=connection,
+              schema=self.schema,
+              if_exists=self.if_exists,
+              index=False,
+              chunksize=self._chunksize(df),
+              method='multi' if self.load_via == 'multi' else self._execute_values_insert
+            )
+          if self.unlogged_bulk_load:
+            target = f"{_quote_ident(self.schema)}.{_quote_ident(self.table)}"
+            # Still in the load's transaction: SET LOGGED writes the table to
+            # the WAL once, and ANALYZE's statistics commit with the rows
+            connection.execute(text(f"ALTER TABLE {target} SET LOGGED"))
+            connection.execute(text(f"ANALYZE {target}"))
+        duration = time.time() - start_time
+        logger.info("PostgresDestination '%s' load complete: %d rows in %.2fs", self.name, row_count, duration)
 
-      if self.after_query:
-        self._execute_query(self.after_query, "after_query")
+        if self.after_query:
+          self._execute_query(connection, self.after_query, "after_query")
+      finally:
+        self._release_connection(connection)
 
     except Exception as e:
       error_msg = str(e).lower()
@@ -371,7 +915,3 @@ class PostgresDestination(SingleInputMixin, Destination):
                      self.name, e, table_ref, df.shape)
       raise
 
-    finally:
-      if self.engine is not None:
-        self.engine.dispose()
-        logger.debug("PostgresDestination '%s' connection closed", self.name)
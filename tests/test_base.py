@@ -47,6 +47,24 @@ class TestDataPackage:
         assert pkg.get_pipe_name() == "my_pipe"
         assert pkg.get_df().equals(df)
 
+    def test_get_arrow_converts_once(self):
+        pa = pytest.importorskip("pyarrow")
+        pkg = DataPackage("my_pipe", pd.DataFrame({'x': [1, 2]}))
+        table = pkg.get_arrow()
+        assert isinstance(table, pa.Table)
+        assert table.column_names == ['x']
+        assert pkg.get_arrow() is table
+
+    def test_get_arrow_reuses_table_from_sender(self):
+        pa = pytest.importorskip("pyarrow")
+        df = pd.DataFrame({'x': [1, 2]})
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pipe = Pipe("p1")
+        dest = CaptureDest()
+        pipe.set_destination(dest)
+        pipe.flow(df, arrow=table)
+        assert dest.received[0].get_arrow() is table
+
 
 class TestPipe:
     def test_get_name(self):
@@ -83,6 +101,13 @@ class TestSingleOutputMixin:
         with pytest.raises(ValueError, match="can only have 1 output"):
             origin.add_output_pipe(Pipe("p2"))
 
+    def test_remembers_output_pipe(self):
+        origin = _SimpleOrigin("orig")
+        assert origin._output_pipe is None
+        pipe = Pipe("p1")
+        origin.add_output_pipe(pipe)
+        assert origin._output_pipe is pipe
+
 
 class TestSingleInputMixin:
     def test_allows_one_input(self):
@@ -0,0 +1,463 @@
+import io
+import json
+import threading
+from concurrent.futures import wait
+import pandas as pd
+import pytest
+from open_stage.core.base import DataPackage, Pipe
+from open_stage.core.base_ai import BasePromptTransformer
+from open_stage.core.common import OpenOrigin
+from tests.conftest import CaptureDest
+
+
+class _EchoTransformer(BasePromptTransformer):
+    """Returns the CSV it was sent, so the output equals the input."""
+
+    def __init__(self, name="echo", model="fake-model", api_key="fake-key",
+                 prompt="Return the data unchanged.", max_tokens=1000, **kwargs):
+        super().__init__(name, model, api_key, prompt, max_tokens, **kwargs)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _initialize_client(self):
+        self.client = object()
+
+    def _call_api(self, system_message, user_message):
+        with self._lock:
+            self.calls.append(user_message)
+        data_csv = user_message.split("CSV format:\n\n", 1)[1].split("\n\nRemember:", 1)[0]
+        return {'response_text': data_csv, 'truncated': False, 'input_tokens': 0, 'output_tokens': 0}
+
+
+def run_transformer(transformer, df):
+    dest = CaptureDest()
+    origin = OpenOrigin("o", df)
+    origin.add_output_pipe(Pipe("p1")).set_destination(transformer)
+    transformer.add_output_pipe(Pipe("p2")).set_destination(dest)
+    origin.pump()
+    return dest.last_df
+
+
+class TestBasePromptTransformer:
+    def test_single_request_by_default(self, sample_df):
+        tr = _EchoTransformer()
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) == 1
+        assert result.equals(sample_df)
+
+    def test_chunk_rows_splits_and_preserves_order(self, sample_df):
+        tr = _EchoTransformer(chunk_rows=2, max_concurrency=3)
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) == 3
+        assert result.equals(sample_df)
+
+    def test_invalid_chunk_rows_raises(self):
+        with pytest.raises(ValueError, match="chunk_rows must be positive"):
+            _EchoTransformer(chunk_rows=0)
+
+    def test_invalid_max_concurrency_raises(self):
+        with pytest.raises(ValueError, match="max_concurrency must be positive"):
+            _EchoTransformer(max_concurrency=0)
+
+    def test_cache_responses_skips_repeated_calls(self, sample_df):
+        BasePromptTransformer.clear_response_cache()
+        first = _EchoTransformer(name="first", cache_responses=True)
+        second = _EchoTransformer(name="second", cache_responses=True)
+        run_transformer(first, sample_df)
+        result = run_transformer(second, sample_df)
+        assert len(first.calls) == 1
+        assert len(second.calls) == 0
+        assert result.equals(sample_df)
+        BasePromptTransformer.clear_response_cache()
+
+    def test_cache_path_persists_responses(self, sample_df, tmp_path):
+        BasePromptTransformer.clear_response_cache()
+        cache_path = str(tmp_path / "responses.sqlite")
+        first = _EchoTransformer(name="first", cache_path=cache_path)
+        second = _EchoTransformer(name="second", cache_path=cache_path)
+        run_transformer(first, sample_df)
+        result = run_transformer(second, sample_df)
+        assert len(first.calls) == 1
+        assert len(second.calls) == 0
+        assert result.equals(sample_df)
+
+    def test_invalid_cache_ttl_raises(self):
+        with pytest.raises(ValueError, match="cache_ttl must be positive"):
+            _EchoTransformer(cache_ttl=0)
+
+    def test_invalid_csv_engine_raises(self):
+        with pytest.raises(ValueError, match="csv_engine must be one of"):
+            _EchoTransformer(csv_engine="polars")
+
+    def test_pyarrow_csv_engine_roundtrip(self, sample_df):
+        pytest.importorskip("pyarrow")
+        tr = _EchoTransformer(csv_engine="pyarrow")
+        result = run_transformer(tr, sample_df)
+        assert result.equals(sample_df)
+
+    def test_pyarrow_csv_engine_falls_back_for_mixed_columns(self):
+        pytest.importorskip("pyarrow")
+        df = pd.DataFrame({'id': [1, 2], 'value': pd.Series([1, 'x'], dtype=object)})
+        tr = _EchoTransformer(csv_engine="pyarrow")
+        assert tr._to_csv(df) == df.to_csv(index=False)
+
+    def test_pyarrow_csv_engine_reads_ragged_response(self):
+        pytest.importorskip("pyarrow")
+        tr = _EchoTransformer(csv_engine="pyarrow")
+        result = tr._read_csv("a,b\n1,2\n3\n")
+        assert list(result['a']) == [1, 3]
+        assert pd.isna(result['b'][1])
+
+    def test_fuse_combines_prompts(self):
+        first, second = _EchoTransformer(name="a"), _EchoTransformer(name="b")
+        second.prompt = "Uppercase the names."
+        fused = _EchoTransformer.fuse("ab", [first, second])
+        assert isinstance(fused, _EchoTransformer)
+        assert "1) Return the data unchanged." in fused.prompt
+        assert "2) Uppercase the names." in fused.prompt
+
+    def test_fuse_carries_common_settings(self):
+        first = _EchoTransformer(name="a", chunk_rows=5, columns=['id'], max_tokens=500)
+        second = _EchoTransformer(name="b", chunk_rows=5, columns=['id'], max_tokens=2000)
+        fused = _EchoTransformer.fuse("ab", [first, second])
+        assert fused.chunk_rows == 5
+        assert fused.columns == ['id']
+        assert fused.max_tokens == 2000
+
+    def test_fuse_rejects_differing_settings(self):
+        first, second = _EchoTransformer(name="a"), _EchoTransformer(name="b", chunk_rows=5)
+        assert not first.can_fuse_with(second)
+        with pytest.raises(ValueError, match="cannot fuse 'b'"):
+            _EchoTransformer.fuse("ab", [first, second])
+
+    def test_fuse_words_final_step_from_output_format(self):
+        first = _EchoTransformer(name="a", output_format="json")
+        second = _EchoTransformer(name="b", output_format="json")
+        fused = _EchoTransformer.fuse("ab", [first, second])
+        assert fused.output_format == "json"
+        assert "CSV" not in fused.prompt
+        assert "JSON object" in fused.prompt
+
+    def test_fuse_rejects_connected_transformers(self):
+        first, second = _EchoTransformer(name="a"), _EchoTransformer(name="b")
+        first.add_output_pipe(Pipe("p"))
+        with pytest.raises(ValueError, match="already connected"):
+            _EchoTransformer.fuse("ab", [first, second])
+
+    def test_keep_columns_prompt_runs_locally(self, sample_df):
+        tr = _EchoTransformer(prompt="Keep only columns id, name.")
+        result = run_transformer(tr, sample_df)
+        assert tr.calls == []
+        assert list(result.columns) == ['id', 'name']
+
+    def test_filter_rows_prompt_runs_locally(self, sample_df):
+        tr = _EchoTransformer(prompt="Filter rows where score >= 85")
+        result = run_transformer(tr, sample_df)
+        assert tr.calls == []
+        assert result['id'].tolist() == [1, 4, 5]
+        assert result.index.tolist() == [0, 1, 2]
+
+    def test_local_plan_falls_back_to_model_on_missing_column(self, sample_df):
+        tr = _EchoTransformer(prompt="Drop column missing")
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) == 1
+        assert result.equals(sample_df)
+
+    def test_local_filter_falls_back_on_type_mismatch(self, sample_df):
+        tr = _EchoTransformer(prompt="Filter rows where name = 5")
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) == 1
+        assert result.equals(sample_df)
+
+    def test_local_filter_on_string_column(self, sample_df):
+        tr = _EchoTransformer(prompt="Keep only rows where category = 'A'")
+        result = run_transformer(tr, sample_df)
+        assert tr.calls == []
+        assert result['id'].tolist() == [1, 3, 4]
+
+    def test_quoted_column_name_containing_and(self):
+        df = pd.DataFrame({'id': [1], 'sales and returns': [2], 'sales': [3], 'returns': [4]})
+        tr = _EchoTransformer(prompt='Keep only columns id, "sales and returns"')
+        result = run_transformer(tr, df)
+        assert tr.calls == []
+        assert list(result.columns) == ['id', 'sales and returns']
+
+    def test_auto_chunk_rows_sizes_chunks_from_max_tokens(self, sample_df):
+        tr = _EchoTransformer(chunk_rows='auto', max_tokens=30)
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) > 1
+        assert result.equals(sample_df)
+
+    def test_auto_chunk_rows_single_request_when_it_fits(self, sample_df):
+        tr = _EchoTransformer(chunk_rows='auto', max_tokens=8192)
+        run_transformer(tr, sample_df)
+        assert len(tr.calls) == 1
+
+    def test_float_decimals_rounds_serialized_floats(self):
+        df = pd.DataFrame({'id': [1, 2], 'value': [3.141592653589793, 2.718281828459045]})
+        tr = _EchoTransformer(float_decimals=3)
+        result = run_transformer(tr, df)
+        assert "3.142" in tr.calls[0] and "3.1415" not in tr.calls[0]
+        assert result['value'].tolist() == [3.142, 2.718]
+        assert result['id'].tolist() == [1, 2]
+
+    def test_float_format_limits_significant_digits(self):
+        df = pd.DataFrame({'id': [1, 2], 'value': [123456.789, 0.000123456]})
+        tr = _EchoTransformer(float_format='%.4g')
+        result = run_transformer(tr, df)
+        assert "1.235e+05" in tr.calls[0] and "0.0001235" in tr.calls[0]
+        assert result['id'].tolist() == [1, 2]
+
+    def test_invalid_float_format_raises(self):
+        with pytest.raises(ValueError, match="float_format must be"):
+            _EchoTransformer(float_format='%d %d')
+
+    def test_empty_input_skips_api_call(self, sample_df):
+        tr = _EchoTransformer()
+        dest = CaptureDest()
+        tr.add_output_pipe(Pipe("p2")).set_destination(dest)
+        tr.sink(DataPackage("p1", sample_df.iloc[:0]))
+        result = dest.last_df
+        assert tr.calls == []
+        assert tr.client is None
+        assert len(result) == 0 and list(result.columns) == list(sample_df.columns)
+
+    def test_columns_sends_only_selected_columns(self, sample_df):
+        tr = _EchoTransformer(columns=['id'], key_column='id')
+        result = run_transformer(tr, sample_df)
+        assert tr.calls[0].split("CSV format:\n\n", 1)[1].startswith("id\n")
+        assert result.equals(sample_df)
+
+    def test_columns_reattaches_untouched_columns_to_new_output(self, sample_df):
+        class _LabelTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                result = super()._call_api(system_message, user_message)
+                lines = result['response_text'].strip().split("\n")
+                result['response_text'] = "\n".join([lines[0] + ",label"] + [line + ",x" for line in lines[1:]])
+                return result
+
+        tr = _LabelTransformer(columns=['id', 'name'], key_column='id')
+        result = run_transformer(tr, sample_df)
+        assert list(result.columns) == list(sample_df.columns) + ['label']
+        assert result['score'].tolist() == sample_df['score'].tolist()
+        assert result['label'].tolist() == ['x'] * len(sample_df)
+
+    def test_columns_reattached_by_key_after_filter(self, sample_df):
+        tr = _EchoTransformer(prompt="Filter rows where score >= 85", columns=['id', 'score'], key_column='id')
+        result = run_transformer(tr, sample_df)
+        assert list(result.columns) == list(sample_df.columns)
+        assert result['id'].tolist() == [1, 4, 5]
+        assert result['name'].tolist() == ['Alice', 'Alice', 'Bob']
+
+    def test_columns_reattached_by_key_when_rows_are_reordered(self, sample_df):
+        class _ReversingTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                result = super()._call_api(system_message, user_message)
+                lines = result['response_text'].strip().split("\n")
+                result['response_text'] = "\n".join([lines[0]] + lines[:0:-1])
+                return result
+
+        tr = _ReversingTransformer(columns=['id', 'score'], key_column='id')
+        result = run_transformer(tr, sample_df)
+        assert result['id'].tolist() == [5, 4, 3, 2, 1]
+        expected = sample_df.set_index('id').loc[[5, 4, 3, 2, 1]]
+        assert result['name'].tolist() == expected['name'].tolist()
+        assert result['category'].tolist() == expected['category'].tolist()
+
+    def test_columns_not_reattached_without_key(self, sample_df):
+        tr = _EchoTransformer(columns=['id', 'score'])
+        result = run_transformer(tr, sample_df)
+        assert list(result.columns) == ['id', 'score']
+
+    def test_key_column_must_be_sent(self):
+        with pytest.raises(ValueError, match="key_column must be one of columns"):
+            _EchoTransformer(columns=['score'], key_column='id')
+
+    def test_columns_missing_from_input_raises(self, sample_df):
+        tr = _EchoTransformer(columns=['id', 'nope'])
+        with pytest.raises(ValueError, match="columns not found in input"):
+            run_transformer(tr, sample_df)
+
+    def test_parse_strips_markdown_fence(self):
+        tr = _EchoTransformer()
+        result = tr._parse_csv_response("```csv\na,b\n1,2\n```", truncated=False)
+        assert list(result.columns) == ['a', 'b']
+        assert result['a'].tolist() == [1]
+
+    def test_parse_strips_unclosed_fence_on_truncation(self):
+        tr = _EchoTransformer()
+        result = tr._parse_csv_response("```csv\na,b\n1,2\n3,", truncated=True)
+        assert result['b'].tolist() == [2]
+
+    def test_run_in_background_returns_before_pump(self, sample_df):
+        release = threading.Event()
+
+        class _BlockingTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                release.wait(timeout=5)
+                return super()._call_api(system_message, user_message)
+
+        tr = _BlockingTransformer(run_in_background=True)
+        dest = CaptureDest()
+        origin = OpenOrigin("o", sample_df)
+        origin.add_output_pipe(Pipe("p1")).set_destination(tr)
+        tr.add_output_pipe(Pipe("p2")).set_destination(dest)
+        origin.pump()
+        assert dest.received == []
+        release.set()
+        tr.join(timeout=5)
+        assert dest.last_df.equals(sample_df)
+
+    def test_join_reraises_background_error(self, sample_df):
+        class _FailingTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                raise RuntimeError("boom")
+
+        tr = _FailingTransformer(run_in_background=True)
+        origin = OpenOrigin("o", sample_df)
+        origin.add_output_pipe(Pipe("p1")).set_destination(tr)
+        tr.add_output_pipe(Pipe("p2")).set_destination(CaptureDest())
+        origin.pump()
+        with pytest.raises(RuntimeError, match="boom"):
+            tr.join(timeout=5)
+
+    def test_background_chain_longer_than_a_worker_pool(self, sample_df):
+        chain = [_EchoTransformer(name=f"t{i}", run_in_background=True) for i in range(12)]
+        dest = CaptureDest()
+        origin = OpenOrigin("o", sample_df)
+        origin.add_output_pipe(Pipe("p0")).set_destination(chain[0])
+        for i, (upstream, downstream) in enumerate(zip(chain, chain[1:]), start=1):
+            upstream.add_output_pipe(Pipe(f"p{i}")).set_destination(downstream)
+        chain[-1].add_output_pipe(Pipe("out")).set_destination(dest)
+        for _ in range(3):
+            origin.pump()
+        for transformer in chain:
+            transformer.join(timeout=5)
+        assert len(dest.received) == 3
+        assert dest.last_df.equals(sample_df)
+
+    def test_background_error_raised_by_next_sink(self, sample_df):
+        class _FailingTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                raise RuntimeError("boom")
+
+        tr = _FailingTransformer(run_in_background=True)
+        origin = OpenOrigin("o", sample_df)
+        origin.add_output_pipe(Pipe("p1")).set_destination(tr)
+        tr.add_output_pipe(Pipe("p2")).set_destination(CaptureDest())
+        origin.pump()
+        wait(list(tr._pending), timeout=5)
+        with pytest.raises(RuntimeError, match="boom"):
+            origin.pump()
+
+    def test_user_message_puts_task_before_data(self, sample_df):
+        tr = _EchoTransformer()
+        run_transformer(tr, sample_df)
+        assert tr.calls[0].startswith("Task: Return the data unchanged.")
+
+    def test_received_df_released_before_request(self, sample_df):
+        seen = []
+
+        class _InspectingTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                seen.append(self.received_df)
+                return super()._call_api(system_message, user_message)
+
+        tr = _InspectingTransformer()
+        run_transformer(tr, sample_df)
+        assert seen == [None]
+        assert tr.received_df is None
+
+    def test_truncated_response_keeps_complete_last_row(self):
+        tr = _EchoTransformer()
+        result = tr._parse_csv_response("a,b\n1,2\n3,4\n", truncated=True)
+        assert result['a'].tolist() == [1, 3]
+
+    def test_truncated_response_drops_row_cut_inside_quoted_field(self):
+        tr = _EchoTransformer()
+        result = tr._parse_csv_response('a,b\n1,x\n2,"line one\nline', truncated=True)
+        assert result['a'].tolist() == [1]
+
+    def test_truncated_response_cut_after_newline_inside_quoted_field(self):
+        tr = _EchoTransformer()
+        result = tr._parse_csv_response('a,b\n1,x\n2,"line one\n', truncated=True)
+        assert result['a'].tolist() == [1]
+
+    def test_json_output_format_parses_rows(self, sample_df):
+        class _JsonEchoTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                result = super()._call_api(system_message, user_message)
+                rows = pd.read_csv(io.StringIO(result['response_text'])).to_dict('records')
+                return {**result, 'response_text': json.dumps({'rows': rows})}
+
+        tr = _JsonEchoTransformer(output_format='json')
+        result = run_transformer(tr, sample_df)
+        assert result.equals(sample_df)
+
+    def test_json_output_format_rejects_truncated_response(self):
+        tr = _EchoTransformer(output_format='json')
+        with pytest.raises(ValueError, match="truncated"):
+            tr._parse_json_response('{"rows": [{"a": 1}, {"a"', truncated=True)
+
+    def test_json_output_format_strips_markdown_fence(self):
+        tr = _EchoTransformer(output_format='json')
+        result = tr._parse_json_response('```json\n{"rows": [{"a": 1}, {"a": 2}]}\n```', truncated=False)
+        assert result['a'].tolist() == [1, 2]
+
+    def test_invalid_output_format_raises(self):
+        with pytest.raises(ValueError, match="output_format must be one of"):
+            _EchoTransformer(output_format='xml')
+
+    def test_truncated_chunk_is_split_and_retried(self, sample_df):
+        class _TruncatingTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                result = super()._call_api(system_message, user_message)
+                rows = result['response_text'].strip().count('\n')
+                return {**result, 'truncated': rows > 2}
+
+        tr = _TruncatingTransformer(chunk_rows=5)
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) == 5
+        assert result.equals(sample_df)
+
+    def test_truncated_response_without_chunking_is_not_split(self, sample_df):
+        class _TruncatingTransformer(_EchoTransformer):
+            def _call_api(self, system_message, user_message):
+                return {**super()._call_api(system_message, user_message), 'truncated': True}
+
+        tr = _TruncatingTransformer()
+        run_transformer(tr, sample_df)
+        assert len(tr.calls) == 1
+
+    def test_oversized_request_is_split_before_sending(self, sample_df):
+        tr = _EchoTransformer(chunk_rows=10)
+        tr._INPUT_TOKEN_LIMIT = 55
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) > 1
+        assert result.equals(sample_df)
+
+    def test_oversized_request_without_chunking_raises(self, sample_df):
+        tr = _EchoTransformer()
+        tr._INPUT_TOKEN_LIMIT = 10
+        with pytest.raises(ValueError, match="input limit"):
+            run_transformer(tr, sample_df)
+        assert tr.calls == []
+
+    def test_exact_token_count_overrides_estimate(self, sample_df):
+        class _CountingTransformer(_EchoTransformer):
+            def _count_tokens(self, user_message):
+                return 1
+
+        tr = _CountingTransformer()
+        tr._INPUT_TOKEN_LIMIT = 10
+        result = run_transformer(tr, sample_df)
+        assert len(tr.calls) == 1
+        assert result.equals(sample_df)
+
+    def test_numeric_frame_skips_quoting(self):
+        df = pd.DataFrame({'id': [1, 2], 'value': [0.5, None]})
+        tr = _EchoTransformer()
+        assert tr._needs_no_quoting(df)
+        assert tr._to_csv(df) == df.to_csv(index=False)
+        assert not tr._needs_no_quoting(df.rename(columns={'value': 'a,b'}))
+        assert not tr._needs_no_quoting(pd.DataFrame({'name': ['x']}))
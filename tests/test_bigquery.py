@@ -0,0 +1,96 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("google.cloud.bigquery")
+
+from open_stage.google.bigquery import (
+    GCPBigQueryDestination, GCPBigQueryOrigin, _is_noop_sql, _split_statements,
+)
+
+
+def _destination(**kwargs):
+    return GCPBigQueryDestination("dest", project_id="project", dataset="ds", table="t",
+                                  write_disposition="WRITE_APPEND", **kwargs)
+
+
+class TestSplitStatements:
+    def test_splits_on_semicolons(self):
+        assert _split_statements("SELECT 1; SELECT 2;") == ["SELECT 1", "SELECT 2"]
+
+    def test_semicolon_inside_quotes_does_not_split(self):
+        sql = "SELECT 'a;b', \"c;d\", `e;f`; SELECT 'it\\'s; here'"
+        assert _split_statements(sql) == ["SELECT 'a;b', \"c;d\", `e;f`", "SELECT 'it\\'s; here'"]
+
+    def test_semicolon_inside_comments_does_not_split(self):
+        sql = "SELECT 1 -- first; still a comment\n; /* block; comment */ SELECT 2 # last; one"
+        assert _split_statements(sql) == ["SELECT 1 -- first; still a comment",
+                                          "/* block; comment */ SELECT 2 # last; one"]
+
+    def test_comments_dropped_when_not_kept(self):
+        sql = "-- setup\nSELECT 1; /* note */ SELECT 2"
+        assert _split_statements(sql, keep_comments=False) == ["SELECT 1", "SELECT 2"]
+
+
+class TestIsNoopSql:
+    def test_comment_only_hooks_are_noops(self):
+        assert _is_noop_sql("-- nothing to do yet\n;")
+        assert _is_noop_sql("/* disabled: DELETE FROM t; */")
+        assert _is_noop_sql("# placeholder")
+
+    def test_statements_are_not_noops(self):
+        assert not _is_noop_sql("-- clean up\nDELETE FROM t WHERE true")
+        assert not _is_noop_sql(None)
+
+
+class TestNormalizeQuery:
+    def test_ignores_indentation_and_blank_lines(self):
+        query = "\n    SELECT a,  b\n\n    FROM t  -- comment\n"
+        assert GCPBigQueryOrigin._normalize_query(query) == "SELECT a,  b\nFROM t  -- comment"
+
+    def test_keeps_triple_quoted_literals(self):
+        query = "SELECT '''line one\n    line two''' AS text\n"
+        assert GCPBigQueryOrigin._normalize_query(query) == query.strip()
+
+    def test_origin_sends_the_normalized_query(self):
+        origin = GCPBigQueryOrigin("origin", project_id="project", query="  SELECT 1\n\n  FROM t\n")
+        assert origin._build_query() == "SELECT 1\nFROM t"
+
+
+class TestBuildQuery:
+    def test_limit_after_trailing_comment_goes_on_its_own_line(self):
+        origin = GCPBigQueryOrigin("origin", project_id="project", query="SELECT * FROM t -- latest rows",
+                                   max_results=10)
+        assert origin._build_query() == "SELECT * FROM t -- latest rows\nLIMIT 10"
+
+    @pytest.mark.parametrize("query", ["SELECT * FROM t -- limit 5", "SELECT * FROM t # limit 5",
+                                       "SELECT limit_date FROM t"])
+    def test_limit_in_comment_or_identifier_is_not_a_limit(self, query):
+        origin = GCPBigQueryOrigin("origin", project_id="project", query=query, max_results=10)
+        assert origin._build_query() == query + "\nLIMIT 10"
+
+    def test_existing_limit_is_kept(self):
+        origin = GCPBigQueryOrigin("origin", project_id="project", query="SELECT * FROM t LIMIT 5", max_results=10)
+        assert origin._build_query() == "SELECT * FROM t LIMIT 5"
+
+
+class TestShrinkDtypes:
+    def test_floats_shrink_only_when_lossless(self):
+        df = pd.DataFrame({'exact': [0.5, 2.25, None], 'decimal': [0.1, 2.5, None]})
+        result = _destination(downcast_numeric=True)._shrink_dtypes(df)
+        assert str(result['exact'].dtype) == 'float32'
+        assert str(result['decimal'].dtype) == 'float64'
+        assert str(df['exact'].dtype) == 'float64'
+
+    def test_integers_shrink_to_fit(self):
+        result = _destination(downcast_numeric=True)._shrink_dtypes(pd.DataFrame({'id': [1, 300]}))
+        assert str(result['id'].dtype) == 'int16'
+
+    def test_categorical_threshold_is_inclusive(self):
+        df = pd.DataFrame({'status': ['a', 'a', 'b', 'b'], 'name': ['a', 'b', 'c', 'd']})
+        result = _destination(categorical_cardinality_ratio=0.5)._shrink_dtypes(df)
+        assert isinstance(result['status'].dtype, pd.CategoricalDtype)
+        assert not isinstance(result['name'].dtype, pd.CategoricalDtype)
+
+    def test_nothing_shrinks_by_default(self):
+        df = pd.DataFrame({'id': [1, 2], 'status': ['a', 'a']})
+        assert _destination()._shrink_dtypes(df) is df
@@ -8,7 +8,7 @@ from open_stage.core.common import (
     OpenOrigin, Printer,
     Filter, DeleteColumns, Aggregator,
     RemoveDuplicates, Copy, Funnel, Switcher, Joiner, Transformer,
-    CSVOrigin, CSVDestination,
+    CSVOrigin, CSVDestination, APIRestOrigin,
 )
 from tests.conftest import CaptureDest
 
@@ -427,3 +427,46 @@ class TestCSVRoundtrip:
         result = pd.read_csv(csv_path)
         assert list(result.columns) == list(sample_df.columns)
         assert len(result) == len(sample_df)
+
+
+class TestAPIRestOrigin:
+    def test_reuses_shared_session(self, monkeypatch):
+        from open_stage.core import common
+
+        class _FakeResponse:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"data": [{"id": 1}, {"id": 2}]}
+
+        calls = []
+
+        def fake_request(**kwargs):
+            calls.append(kwargs)
+            return _FakeResponse()
+
+        monkeypatch.setattr(common._HTTP_SESSION, "request", fake_request)
+        origin = APIRestOrigin("api", path="data", method="GET", url="https://example.com")
+        dest = CaptureDest()
+        origin.add_output_pipe(Pipe("p1")).set_destination(dest)
+        origin.pump()
+        origin.pump()
+        assert len(calls) == 2
+        assert calls[0] == {"method": "GET", "url": "https://example.com"}
+        assert dest.last_df["id"].tolist() == [1, 2]
+
+    def test_shared_session_rejects_cookies(self):
+        import email.message
+        import urllib.request
+        from open_stage.core import common
+
+        class _FakeResponse:
+            def info(self):
+                headers = email.message.Message()
+                headers["Set-Cookie"] = "session=secret; Path=/"
+                return headers
+
+        jar = common._HTTP_SESSION.cookies
+        jar.extract_cookies(_FakeResponse(), urllib.request.Request("https://example.com/login"))
+        assert len(jar) == 0
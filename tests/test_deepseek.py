@@ -0,0 +1,54 @@
+import json
+import pandas as pd
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from open_stage.core.base import Pipe
+from open_stage.core.common import OpenOrigin
+from open_stage.deepseek import transformer as deepseek
+from open_stage.deepseek.transformer import DeepSeekPromptTransformer
+from tests.conftest import CaptureDest
+
+
+def _stream_response(request):
+    # Streamed chat completion echoing a fixed CSV, as the API sends it
+    chunks = [
+        {'choices': [{'index': 0, 'delta': {'role': 'assistant', 'content': "id\n1\n"}, 'finish_reason': None}]},
+        {'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]},
+        {'choices': [], 'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2}},
+    ]
+    body = "".join(
+        "data: " + json.dumps({'id': 'c', 'object': 'chat.completion.chunk', 'created': 0,
+                               'model': 'deepseek-chat', **chunk}) + "\n\n"
+        for chunk in chunks
+    ) + "data: [DONE]\n\n"
+    return httpx.Response(200, headers={'content-type': 'text/event-stream'}, text=body)
+
+
+@pytest.fixture
+def mock_pool(monkeypatch):
+    # Every shared pool the module opens answers from _stream_response
+    class _MockClient(httpx.Client):
+        def __init__(self, **kwargs):
+            super().__init__(transport=httpx.MockTransport(_stream_response), **kwargs)
+
+    monkeypatch.setattr(deepseek.httpx, "Client", _MockClient)
+    yield
+    DeepSeekPromptTransformer.close_shared()
+
+
+class TestDeepSeekPromptTransformer:
+    def test_pump_after_close_shared_uses_new_pool(self, mock_pool):
+        tr = DeepSeekPromptTransformer("t", "deepseek-chat", "key", "Return the data unchanged.")
+        dest = CaptureDest()
+        origin = OpenOrigin("o", pd.DataFrame({'id': [1]}))
+        origin.add_output_pipe(Pipe("p1")).set_destination(tr)
+        tr.add_output_pipe(Pipe("p2")).set_destination(dest)
+
+        origin.pump()
+        DeepSeekPromptTransformer.close_shared()
+        assert tr.client is None
+        origin.pump()
+        assert [package.get_df()['id'].tolist() for package in dest.received] == [[1], [1]]
@@ -0,0 +1,105 @@
+import io
+import pandas as pd
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from open_stage.core.base import Pipe
+from open_stage.mysql.common import MySQLOrigin, _downcast, _write_load_data_file
+from tests.conftest import CaptureDest
+
+
+def _origin(**kwargs):
+    return MySQLOrigin("origin", host="localhost", database="db", user="u", password="p", **kwargs)
+
+
+def _load_data_text(df):
+    buffer = io.StringIO()
+    _write_load_data_file(df, buffer)
+    return buffer.getvalue().replace('\r\n', '\n')
+
+
+class TestLoadDataFile:
+    def test_escapes_separators_and_backslashes(self):
+        df = pd.DataFrame({'text': ['a\tb', 'line\nbreak', 'back\\slash', 'say "hi"']})
+        assert _load_data_text(df).split('\n')[:-1] == ['a\\tb', 'line\\nbreak', 'back\\\\slash', 'say "hi"']
+
+    def test_nulls_are_written_as_backslash_n(self):
+        df = pd.DataFrame({'text': ['x', None], 'value': [1.5, None]})
+        assert _load_data_text(df) == 'x\t1.5\n\\N\t\\N\n'
+
+    def test_literal_backslash_n_is_not_null(self):
+        df = pd.DataFrame({'text': ['\\N']})
+        assert _load_data_text(df) == '\\\\N\n'
+
+    def test_category_and_object_columns_are_escaped(self):
+        df = pd.DataFrame({'category': pd.Series(['a\tb', 'a\tb'], dtype='category'),
+                           'mixed': pd.Series(['c\nd', 1], dtype=object)})
+        assert _load_data_text(df) == 'a\\tb\tc\\nd\na\\tb\t1\n'
+
+    def test_booleans_are_written_as_integers(self):
+        df = pd.DataFrame({'flag': [True, False]})
+        assert _load_data_text(df) == '1\n0\n'
+
+
+class TestDowncast:
+    def test_integers_shrink_to_the_smallest_type_holding_them(self):
+        df = _downcast(pd.DataFrame({'small': [-128, 127], 'medium': [0, 128], 'large': [0, 2 ** 40]}))
+        assert [str(dtype) for dtype in df.dtypes] == ['int8', 'int16', 'int64']
+
+    def test_floats_shrink_only_when_lossless(self):
+        df = _downcast(pd.DataFrame({'exact': [0.5, 2.25, None], 'decimal': [0.1, 2.5, None]}))
+        assert str(df['exact'].dtype) == 'float32'
+        assert str(df['decimal'].dtype) == 'float64'
+        assert df['decimal'].tolist()[:2] == [0.1, 2.5]
+
+    def test_low_cardinality_strings_become_categories(self):
+        df = _downcast(pd.DataFrame({'status': ['open', 'open', 'open', 'closed', 'open'],
+                                     'name': ['a', 'b', 'c', 'd', 'e']}))
+        assert isinstance(df['status'].dtype, pd.CategoricalDtype)
+        assert not isinstance(df['name'].dtype, pd.CategoricalDtype)
+
+
+class TestBuildQuery:
+    def test_limit_added_when_query_has_none(self):
+        query, _ = _origin(query="SELECT * FROM orders", max_results=10)._build_query()
+        assert query == "SELECT * FROM orders\nLIMIT 10"
+
+    def test_existing_limit_is_kept(self):
+        query, _ = _origin(query="SELECT * FROM orders LIMIT 5", max_results=10)._build_query()
+        assert query == "SELECT * FROM orders LIMIT 5"
+
+    def test_identifier_containing_limit_is_not_a_limit(self):
+        query, _ = _origin(query="SELECT limit_date FROM orders", max_results=10)._build_query()
+        assert query.endswith("\nLIMIT 10")
+
+    def test_limit_in_comment_is_not_a_limit(self):
+        query, _ = _origin(query="SELECT * FROM orders -- limit applied later", max_results=10)._build_query()
+        assert query == "SELECT * FROM orders -- limit applied later\nLIMIT 10"
+        query, _ = _origin(query="SELECT * FROM orders # no limit", max_results=10)._build_query()
+        assert query.endswith("\nLIMIT 10")
+
+    def test_table_read_binds_the_limit(self):
+        origin = _origin(table="shop.orders", max_results=10)
+        query, params = origin._build_query(bind_limit=True)
+        assert query == "SELECT * FROM `shop`.`orders`\nLIMIT :__limit"
+        assert params == {'__limit': 10}
+        # A different limit reuses the same statement text
+        assert _origin(table="shop.orders", max_results=20)._build_query(bind_limit=True)[0] == query
+
+    def test_bound_limit_keeps_query_parameters(self):
+        origin = _origin(query="SELECT * FROM orders WHERE status = :status", max_results=10,
+                         query_parameters={'status': 'open'})
+        query, params = origin._build_query(bind_limit=True)
+        assert query.endswith("\nLIMIT :__limit")
+        assert params == {'status': 'open', '__limit': 10}
+
+    def test_bound_limit_is_applied_by_the_database(self, tmp_path):
+        engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+        pd.DataFrame({'id': range(5)}).to_sql("orders", engine, index=False)
+        origin = _origin(table="orders", max_results=2)
+        origin.engine = engine
+        dest = CaptureDest()
+        origin.add_output_pipe(Pipe("p")).set_destination(dest)
+        origin.pump()
+        assert dest.last_df['id'].tolist() == [0, 1]
@@ -0,0 +1,81 @@
+import pandas as pd
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from open_stage.core.base import DataPackage, Pipe
+from open_stage.postgres.common import PostgresDestination, PostgresOrigin
+from tests.conftest import CaptureDest
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # File-backed SQLite with transactional DDL, standing in for the server:
+    # pysqlite would otherwise commit DROP/CREATE on its own, and the file
+    # outlives connections invalidated after before/after queries
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @sqlalchemy.event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def _destination(engine, **kwargs):
+    dest = PostgresDestination("dest", host="localhost", database="db", user="u", password="p",
+                               table="t", schema="main", **kwargs)
+    dest.engine = engine
+    return dest
+
+
+def _origin(engine, **kwargs):
+    origin = PostgresOrigin("origin", host="localhost", database="db", user="u", password="p", **kwargs)
+    origin.engine = engine
+    return origin
+
+
+class TestPostgresOrigin:
+    def test_before_query_temp_table_reaches_main_query(self, engine):
+        origin = _origin(engine, before_query="CREATE TEMP TABLE temp_orders AS SELECT 1 AS id",
+                         query="SELECT id FROM temp_orders")
+        dest = CaptureDest()
+        origin.add_output_pipe(Pipe("p")).set_destination(dest)
+        origin.pump()
+        assert dest.last_df['id'].tolist() == [1]
+
+    def test_before_query_temp_table_reaches_stream(self, engine):
+        origin = _origin(engine, before_query="CREATE TEMP TABLE temp_orders AS SELECT 1 AS id UNION SELECT 2",
+                         query="SELECT id FROM temp_orders ORDER BY id", stream_chunksize=1)
+        dest = CaptureDest()
+        origin.add_output_pipe(Pipe("p")).set_destination(dest)
+        origin.pump()
+        assert [package.get_df()['id'].tolist() for package in dest.received] == [[1], [2]]
+
+
+class TestPostgresDestination:
+    def test_replace_keeps_old_table_when_load_fails(self, engine):
+        pd.DataFrame({'id': [1, 2]}).to_sql("t", engine, schema="main", index=False)
+        dest = _destination(engine, if_exists='replace', load_via='copy')
+        # SQLite cursors have no copy_expert, so the load fails after the
+        # table has been dropped and recreated
+        with pytest.raises(AttributeError):
+            dest.sink(DataPackage("p", pd.DataFrame({'id': [3]})))
+        assert pd.read_sql("SELECT id FROM main.t", engine)['id'].tolist() == [1, 2]
+
+    def test_replace_with_multi_insert(self, engine):
+        pd.DataFrame({'id': [1, 2]}).to_sql("t", engine, schema="main", index=False)
+        dest = _destination(engine, if_exists='replace', load_via='multi')
+        dest.sink(DataPackage("p", pd.DataFrame({'id': [3]})))
+        assert pd.read_sql("SELECT id FROM main.t", engine)['id'].tolist() == [3]
+
+    def test_before_query_temp_table_reaches_after_query(self, engine):
+        dest = _destination(engine, if_exists='append',
+                            before_query="CREATE TEMP TABLE audit AS SELECT 99 AS id",
+                            after_query="INSERT INTO main.t SELECT id FROM audit")
+        dest.sink(DataPackage("p", pd.DataFrame({'id': [1]})))
+        assert pd.read_sql("SELECT id FROM main.t ORDER BY id", engine)['id'].tolist() == [1, 99]